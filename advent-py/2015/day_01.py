@@ -1,5 +1,7 @@
 """ day 1: not quite lisp """
 
+from advent import read_input
+
 
 def parse_instructions(instructions):
     floor = 0
@@ -22,22 +24,30 @@ def last_floor(instructions):
     return list(parse_instructions(instructions))[-1]
 
 
-assert last_floor("(())") == 0
-assert last_floor("()()") == 0
-assert last_floor("(((") == 3
-assert last_floor("(()(()(") == 3
-assert last_floor("))(((((") == 3
-assert last_floor("())") == -1
-assert last_floor("))(") == -1
-assert last_floor(")))") == -3
-assert last_floor(")())())") == -3
+def part1(instructions):
+    return last_floor(instructions.strip())
+
+
+def part2(instructions):
+    return entered_basement(instructions.strip())
+
+
+def test_examples():
+    assert last_floor("(())") == 0
+    assert last_floor("()()") == 0
+    assert last_floor("(((") == 3
+    assert last_floor("(()(()(") == 3
+    assert last_floor("))(((((") == 3
+    assert last_floor("())") == -1
+    assert last_floor("))(") == -1
+    assert last_floor(")))") == -3
+    assert last_floor(")())())") == -3
 
-assert entered_basement(")") == 1
-assert entered_basement("()())") == 5
+    assert entered_basement(")") == 1
+    assert entered_basement("()())") == 5
 
-INSTRUCTIONS = ""
-with open("data/01.txt") as fh:
-    INSTRUCTIONS = fh.readline().strip()
 
-assert last_floor(INSTRUCTIONS) == 232
-assert entered_basement(INSTRUCTIONS) == 1783
+def test_answers():
+    instructions = read_input(2015, 1)
+    assert part1(instructions) == 232
+    assert part2(instructions) == 1783
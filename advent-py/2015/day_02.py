@@ -13,14 +13,16 @@ def parse_present_dimensions(present_str):
     return [int(x) for x in present_str.split("x")]
 
 
-assert wrapping_paper(*parse_present_dimensions("2x3x4")) == 58
-assert wrapping_paper(*parse_present_dimensions("1x1x10")) == 43
-assert ribbon(*parse_present_dimensions("2x3x4")) == 34
-assert ribbon(*parse_present_dimensions("1x1x10")) == 14
+def part1(presents_str):
+    return sum([wrapping_paper(*parse_present_dimensions(present)) for present in presents_str.split()])
 
-PRESENTS = []
-with open("data/02.txt") as fh:
-    PRESENTS = fh.readlines()
 
-print(sum([wrapping_paper(*parse_present_dimensions(present)) for present in PRESENTS]))
-print(sum([ribbon(*parse_present_dimensions(present)) for present in PRESENTS]))
+def part2(presents_str):
+    return sum([ribbon(*parse_present_dimensions(present)) for present in presents_str.split()])
+
+
+def test_examples():
+    assert wrapping_paper(*parse_present_dimensions("2x3x4")) == 58
+    assert wrapping_paper(*parse_present_dimensions("1x1x10")) == 43
+    assert ribbon(*parse_present_dimensions("2x3x4")) == 34
+    assert ribbon(*parse_present_dimensions("1x1x10")) == 14
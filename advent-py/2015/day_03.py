@@ -2,6 +2,8 @@
 
 from collections import namedtuple
 
+from advent import read_input
+
 Location = namedtuple("Location", ["x", "y"])
 
 
@@ -30,19 +32,25 @@ def unique_houses_two_santas(directions):
     return len(set(list(deliver_presents(directions[::2])) + list(deliver_presents(directions[1::2]))))
 
 
-assert unique_houses(">") == 2
-assert unique_houses("^>v<") == 4
-assert unique_houses("^v^v^v^v^v") == 2
+def part1(directions):
+    return unique_houses(directions.strip())
+
+
+def part2(directions):
+    return unique_houses_two_santas(directions.strip())
 
-assert unique_houses_two_santas("^v") == 3
-assert unique_houses_two_santas("^>v<") == 3
-assert unique_houses_two_santas("^v^v^v^v^v") == 11
 
+def test_examples():
+    assert unique_houses(">") == 2
+    assert unique_houses("^>v<") == 4
+    assert unique_houses("^v^v^v^v^v") == 2
 
-DIRECTIONS = ""
-with open("data/03.txt") as fh:
-    DIRECTIONS = fh.readline().strip()
+    assert unique_houses_two_santas("^v") == 3
+    assert unique_houses_two_santas("^>v<") == 3
+    assert unique_houses_two_santas("^v^v^v^v^v") == 11
 
 
-assert unique_houses(DIRECTIONS) == 2081
-assert unique_houses_two_santas(DIRECTIONS) == 2341
+def test_answers():
+    directions = read_input(2015, 3)
+    assert part1(directions) == 2081
+    assert part2(directions) == 2341
@@ -3,6 +3,8 @@
 import re
 from hashlib import md5
 
+from advent.cache import memoize
+
 PATTERN = re.compile("^0{5}.*")
 
 
@@ -10,6 +12,7 @@ def five_leading_zeros(hashed):
     return bool(re.match(PATTERN, hashed))
 
 
+@memoize
 def process(key, pattern_to_match):
     index = 1
     while True:
@@ -20,8 +23,14 @@ def process(key, pattern_to_match):
         index += 1
 
 
-assert process("abcdef", re.compile("^0{5}.*")) == 609043
-assert process("pqrstuv", re.compile("^0{5}.*")) == 1048970
+def part1(key):
+    return process(key.strip(), re.compile("^0{5}.*"))
+
+
+def part2(key):
+    return process(key.strip(), re.compile("^0{6}.*"))
+
 
-print(process("ckczppom", re.compile("^0{5}.*")))
-print(process("ckczppom", re.compile("^0{6}.*")))
+def test_examples():
+    assert process("abcdef", re.compile("^0{5}.*")) == 609043
+    assert process("pqrstuv", re.compile("^0{5}.*")) == 1048970
@@ -26,20 +26,22 @@ def is_nice_v2(string):
     return matches(DOUBLE_PAIR, string) and matches(SANDWICH_LETTERS, string)
 
 
-assert is_nice_v1("ugknbfddgicrmopn")
-assert is_nice_v1("aaa")
-assert not is_nice_v1("jchzalrnumimnmhp")
-assert not is_nice_v1("haegwjzuvuyypxyu")
-assert not is_nice_v1("dvszwmarrgswjxmb")
-
-assert is_nice_v2("qjhvhtzxzqqjkmpb")
-assert is_nice_v2("xxyxx")
-assert not is_nice_v2("uurcxstgmygtbstg")
-assert not is_nice_v2("ieodomkazucvgmuy")
-
-STRINGS = []
-with open("data/05.txt") as fh:
-    STRINGS = fh.readlines()
-
-print(sum([int(is_nice_v1(string.strip())) for string in STRINGS]))
-print(sum([int(is_nice_v2(string.strip())) for string in STRINGS]))
+def part1(strings_str):
+    return sum([int(is_nice_v1(string.strip())) for string in strings_str.split()])
+
+
+def part2(strings_str):
+    return sum([int(is_nice_v2(string.strip())) for string in strings_str.split()])
+
+
+def test_examples():
+    assert is_nice_v1("ugknbfddgicrmopn")
+    assert is_nice_v1("aaa")
+    assert not is_nice_v1("jchzalrnumimnmhp")
+    assert not is_nice_v1("haegwjzuvuyypxyu")
+    assert not is_nice_v1("dvszwmarrgswjxmb")
+
+    assert is_nice_v2("qjhvhtzxzqqjkmpb")
+    assert is_nice_v2("xxyxx")
+    assert not is_nice_v2("uurcxstgmygtbstg")
+    assert not is_nice_v2("ieodomkazucvgmuy")
@@ -2,23 +2,25 @@
 
 import attr
 
+from advent.grid import Grid2D
+
 
 @attr.s
 class LightDisplay:
     grid = attr.ib(init=False)
 
     def __attrs_post_init__(self):
-        self.grid = [[0 for _ in range(1000)] for _ in range(1000)]
+        self.grid = Grid2D.zeros(1000, 1000)
 
-    def turn_on(self, x, y):
-        self.grid[y][x] += 1
+    def turn_on(self, region):
+        self.grid.cells[region] += 1
 
-    def turn_off(self, x, y):
-        self.grid[y][x] -= 1
-        self.grid[y][x] = max(0, self.grid[y][x])
+    def turn_off(self, region):
+        lights = self.grid.cells[region]
+        self.grid.cells[region] = (lights - 1).clip(min=0)
 
-    def toggle(self, x, y):
-        self.grid[y][x] += 2
+    def toggle(self, region):
+        self.grid.cells[region] += 2
 
     def parse_instruction(self, string):
         start_loc, end_loc, func = None, None, None
@@ -35,12 +37,10 @@ class LightDisplay:
 
         start_x, start_y = [int(x) for x in start_loc.split(",")]
         end_x, end_y = [int(x) for x in end_loc.split(",")]
-        for y in range(start_y, end_y + 1):
-            for x in range(start_x, end_x + 1):
-                func(x, y)
+        func((slice(start_y, end_y + 1), slice(start_x, end_x + 1)))
 
     def brightness(self):
-        return sum([sum(row) for row in self.grid])
+        return int(self.grid.cells.sum())
 
     @classmethod
     def init(cls, instructions):
@@ -51,9 +51,5 @@ class LightDisplay:
         return display
 
 
-DISPLAY = LightDisplay()
-with open("data/06.txt") as fh:
-    for line in fh:
-        DISPLAY.parse_instruction(line)
-
-print(DISPLAY.brightness())
+def part2(instructions_str):
+    return LightDisplay.init([line for line in instructions_str.split("\n") if line]).brightness()
@@ -3,6 +3,8 @@ from collections import namedtuple
 
 import attr
 
+from advent import read_input
+
 Instruction = namedtuple("Instruction", ["op", "inputs", "output"])
 
 OPS = {
@@ -83,6 +85,19 @@ class Circuit:
         self.wires = {x: get(x) for x in self.wires}
 
 
+def part1(instructions_str):
+    circuit = Circuit(instructions_str)
+    circuit.run()
+    return circuit.wires["a"]
+
+
+def part2(instructions_str):
+    circuit = Circuit(instructions_str)
+    circuit.wires["b"] = part1(instructions_str)
+    circuit.run(ignore_outputs=["b"])
+    return circuit.wires["a"]
+
+
 TEST_INSTRUCTIONS = """
 123 -> x
 456 -> y
@@ -94,19 +109,14 @@ NOT x -> h
 NOT y -> i
 """
 
-TEST_CIRCUIT = Circuit(TEST_INSTRUCTIONS)
-TEST_CIRCUIT.run()
-assert TEST_CIRCUIT.wires["i"] == 65079
-
 
-with open("data/07.txt") as fh:
-    REAL_INSTRUCTIONS = fh.read()
+def test_examples():
+    test_circuit = Circuit(TEST_INSTRUCTIONS)
+    test_circuit.run()
+    assert test_circuit.wires["i"] == 65079
 
-REAL_CIRCUIT = Circuit(REAL_INSTRUCTIONS)
-REAL_CIRCUIT.run()
-assert REAL_CIRCUIT.wires["a"] == 3176
 
-REAL_CIRCUIT = Circuit(REAL_INSTRUCTIONS)
-REAL_CIRCUIT.wires["b"] = 3176
-REAL_CIRCUIT.run(ignore_outputs=["b"])
-assert REAL_CIRCUIT.wires["a"] == 14710
+def test_answers():
+    instructions_str = read_input(2015, 7)
+    assert part1(instructions_str) == 3176
+    assert part2(instructions_str) == 14710
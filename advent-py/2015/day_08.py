@@ -3,6 +3,8 @@
 
 import json
 
+from advent import read_data_file
+
 
 def code_length(string):
     return len(string)
@@ -16,28 +18,31 @@ def repr_length(string):
     return len(json.dumps(string))
 
 
-def diff_chars_decoded(filename):
+def diff_chars_decoded(strings_str):
     char_diff = 0
-    with open(filename) as fh:
-        for _line in fh:
-            line = _line.strip()
-            char_diff += code_length(line) - str_length(line)
+    for line in strings_str.split():
+        char_diff += code_length(line) - str_length(line)
 
     return char_diff
 
 
-def diff_chars_encoded(filename):
+def diff_chars_encoded(strings_str):
     char_diff = 0
-    with open(filename) as fh:
-        for _line in fh:
-            line = _line.strip()
-            char_diff += repr_length(line) - code_length(line)
+    for line in strings_str.split():
+        char_diff += repr_length(line) - code_length(line)
 
     return char_diff
 
 
-assert diff_chars_decoded("data/08-examples.txt") == 12
-assert diff_chars_encoded("data/08-examples.txt") == 19
+def part1(strings_str):
+    return diff_chars_decoded(strings_str)
+
+
+def part2(strings_str):
+    return diff_chars_encoded(strings_str)
+
 
-print(diff_chars_decoded("data/08.txt"))
-print(diff_chars_encoded("data/08.txt"))
+def test_examples():
+    examples = read_data_file(2015, "08-examples.txt")
+    assert diff_chars_decoded(examples) == 12
+    assert diff_chars_encoded(examples) == 19
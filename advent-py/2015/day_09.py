@@ -6,6 +6,8 @@ import attr
 
 from copy import deepcopy
 
+from advent import read_input
+
 
 @attr.s
 class Location:
@@ -102,18 +104,27 @@ def furthest_distance(distances):
     return max_distance
 
 
+def part1(distances):
+    return shortest_distance(distances)
+
+
+def part2(distances):
+    return furthest_distance(distances)
+
+
 TEST_DISTANCES = """
 London to Dublin = 464
 London to Belfast = 518
 Dublin to Belfast = 141
 """
 
-assert shortest_distance(TEST_DISTANCES) == 605
-assert furthest_distance(TEST_DISTANCES) == 982
 
-DISTANCES = ""
-with open("data/09.txt") as fh:
-    DISTANCES = fh.read()
+def test_examples():
+    assert shortest_distance(TEST_DISTANCES) == 605
+    assert furthest_distance(TEST_DISTANCES) == 982
+
 
-assert shortest_distance(DISTANCES) == 251
-assert furthest_distance(DISTANCES) == 898
+def test_answers():
+    distances = read_input(2015, 9)
+    assert part1(distances) == 251
+    assert part2(distances) == 898
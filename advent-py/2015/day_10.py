@@ -34,12 +34,19 @@ def chain_translate(times, string):
     return output
 
 
-assert translate("1") == "11"
-assert translate("11") == "21"
-assert translate("21") == "1211"
-assert translate("1211") == "111221"
-assert translate("111221") == "312211"
+def part1(sequence):
+    return len(chain_translate(40, sequence.strip()))
 
-assert chain_translate(5, "1") == "312211"
 
-print(len(chain_translate(50, "1113222113")))
+def part2(sequence):
+    return len(chain_translate(50, sequence.strip()))
+
+
+def test_examples():
+    assert translate("1") == "11"
+    assert translate("11") == "21"
+    assert translate("21") == "1211"
+    assert translate("1211") == "111221"
+    assert translate("111221") == "312211"
+
+    assert chain_translate(5, "1") == "312211"
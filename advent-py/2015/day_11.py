@@ -2,6 +2,8 @@
 
 import re
 
+from advent import read_input
+
 STRAIGHTS_OF_LETTERS = ["".join([chr(i), chr(i + 1), chr(i + 2)]) for i in range(ord("a"), ord("a") + 24)]
 
 BANNED_LETTERS = re.compile(r"[iol]")
@@ -48,20 +50,32 @@ def next_valid_password(password):
             return new_password
 
 
-assert increment_password("xx") == "xy"
-assert increment_password("xy") == "xz"
-assert increment_password("xz") == "ya"
-assert increment_password("ya") == "yb"
-assert increment_password("yb") == "yc"
+def part1(password):
+    return next_valid_password(password.strip())
+
+
+def part2(password):
+    return next_valid_password(part1(password))
+
+
+def test_examples():
+    assert increment_password("xx") == "xy"
+    assert increment_password("xy") == "xz"
+    assert increment_password("xz") == "ya"
+    assert increment_password("ya") == "yb"
+    assert increment_password("yb") == "yc"
+
+    assert straight_present("hijklmmn")
+    assert not no_banned_letters_present("hijklmmn")
+    assert pairs_present("abbceffg")
+    assert not straight_present("abbceffg")
+    assert not pairs_present("abbcegjk")
 
-assert straight_present("hijklmmn")
-assert not no_banned_letters_present("hijklmmn")
-assert pairs_present("abbceffg")
-assert not straight_present("abbceffg")
-assert not pairs_present("abbcegjk")
+    assert next_valid_password("abcdefgh") == "abcdffaa"
+    assert next_valid_password("ghijklmn") == "ghjaabcc"
 
-assert next_valid_password("abcdefgh") == "abcdffaa"
-assert next_valid_password("ghijklmn") == "ghjaabcc"
 
-assert next_valid_password("vzbxkghb") == "vzbxxyzz"
-assert next_valid_password("vzbxxyzz") == "vzcaabcc"
+def test_answers():
+    password = read_input(2015, 11)
+    assert part1(password) == "vzbxxyzz"
+    assert part2(password) == "vzcaabcc"
@@ -22,19 +22,20 @@ def nested_sum(obj):
     raise Exception(f"Unsupported type {type(obj)}")
 
 
-assert nested_sum(json.loads("[1,2,3]")) == 6
-assert nested_sum(json.loads('{"a":2,"b":4}')) == 6
-assert nested_sum(json.loads("[[[3]]]")) == 3
-assert nested_sum(json.loads('{"a":{"b":4},"c":-1}')) == 3
-assert nested_sum(json.loads('{"a":[-1,1]}')) == 0
-assert nested_sum(json.loads('[-1,{"a":1}]')) == 0
-assert nested_sum(json.loads("[]")) == 0
-assert nested_sum(json.loads("{}")) == 0
-
-assert nested_sum(json.loads('[1,{"c":"red","b":2},3]')) == 4
-assert nested_sum(json.loads('{"d":"red","e":[1,2,3,4],"f":5}')) == 0
-assert nested_sum(json.loads('[1,"red",5]')) == 6
-
-
-with open("data/12.txt") as fh:
-    print(nested_sum(json.load(fh)))
+def part2(document):
+    return nested_sum(json.loads(document))
+
+
+def test_examples():
+    assert nested_sum(json.loads("[1,2,3]")) == 6
+    assert nested_sum(json.loads('{"a":2,"b":4}')) == 6
+    assert nested_sum(json.loads("[[[3]]]")) == 3
+    assert nested_sum(json.loads('{"a":{"b":4},"c":-1}')) == 3
+    assert nested_sum(json.loads('{"a":[-1,1]}')) == 0
+    assert nested_sum(json.loads('[-1,{"a":1}]')) == 0
+    assert nested_sum(json.loads("[]")) == 0
+    assert nested_sum(json.loads("{}")) == 0
+
+    assert nested_sum(json.loads('[1,{"c":"red","b":2},3]')) == 4
+    assert nested_sum(json.loads('{"d":"red","e":[1,2,3,4],"f":5}')) == 0
+    assert nested_sum(json.loads('[1,"red",5]')) == 6
@@ -49,6 +49,14 @@ def happiest(attendees, add_self=False):
     return highest_happiness
 
 
+def part1(attendees):
+    return happiest(attendees)
+
+
+def part2(attendees):
+    return happiest(attendees, add_self=True)
+
+
 TEST_ATTENDEES = """
 Alice would gain 54 happiness units by sitting next to Bob.
 Alice would lose 79 happiness units by sitting next to Carol.
@@ -64,7 +72,6 @@ David would lose 7 happiness units by sitting next to Bob.
 David would gain 41 happiness units by sitting next to Carol.
 """
 
-assert happiest(TEST_ATTENDEES) == 330
 
-with open("data/13.txt") as fh:
-    print(happiest(fh.read(), add_self=True))
+def test_examples():
+    assert happiest(TEST_ATTENDEES) == 330
@@ -31,22 +31,29 @@ class Reindeer:
 
 PATTERN = r"([A-z]+) can fly ([0-9]+) km/s for ([0-9]+) seconds, but then must rest for ([0-9]+) seconds."
 
-stable = []
-with open("data/14.txt") as fh:
-    for line in fh:
+
+def parse_stable(stable_str):
+    stable = []
+    for line in stable_str.split("\n"):
         if match := re.match(PATTERN, line):
             name, speed, fly, rest = match.groups()
             stable.append(Reindeer(name, int(speed), int(fly), int(rest)))
 
+    return stable
+
+
+def winning_score(stable, race_seconds):
+    scores = defaultdict(int)
+    for seconds, distances in enumerate(zip(*[reindeer.fly() for reindeer in stable]), 1):
+        max_distance = max([x[1] for x in distances])
+
+        for (name, distance) in distances:
+            if distance == max_distance:
+                scores[name] += 1
 
-scores = defaultdict(int)
-for seconds, distances in enumerate(zip(*[reindeer.fly() for reindeer in stable]), 1):
-    max_distance = max([x[1] for x in distances])
+        if seconds == race_seconds:
+            return max(scores.values())
 
-    for (name, distance) in distances:
-        if distance == max_distance:
-            scores[name] += 1
 
-    if seconds == 2503:
-        print(max(scores.values()))
-        break
+def part2(stable_str):
+    return winning_score(parse_stable(stable_str), 2503)
@@ -35,24 +35,28 @@ def cookie_score(ingredients, calorie_match=False):
     return result
 
 
-TEST_INGREDIENTS = parse_ingredients(
-    """
-Butterscotch: capacity -1, durability -2, flavor 6, texture 3, calories 8
-Cinnamon: capacity 2, durability 3, flavor -2, texture -1, calories 3
-"""
-)
-assert cookie_score([(TEST_INGREDIENTS["Butterscotch"], 44), (TEST_INGREDIENTS["Cinnamon"], 56)]) == 62842880
+def best_cookie_score(ingredients, calorie_match=False):
+    best_score = 0
+    for _ingredient_list in combinations_with_replacement(ingredients.values(), 100):
+        ingredient_list = [(x, _ingredient_list.count(x)) for x in set(_ingredient_list)]
+        score = cookie_score(ingredient_list, calorie_match=calorie_match)
+
+        if score > best_score:
+            best_score = score
+
+    return best_score
 
 
-with open("data/15.txt") as fh:
-    INGREDIENTS = parse_ingredients(fh.read())
+def part2(ingredients_str):
+    return best_cookie_score(parse_ingredients(ingredients_str), calorie_match=True)
 
-BEST_SCORE = 0
-for _ingredient_list in combinations_with_replacement(INGREDIENTS.values(), 100):
-    ingredient_list = [(x, _ingredient_list.count(x)) for x in set(_ingredient_list)]
-    score = cookie_score(ingredient_list, calorie_match=True)
 
-    if score > BEST_SCORE:
-        BEST_SCORE = score
+TEST_INGREDIENTS = """
+Butterscotch: capacity -1, durability -2, flavor 6, texture 3, calories 8
+Cinnamon: capacity 2, durability 3, flavor -2, texture -1, calories 3
+"""
+
 
-print(BEST_SCORE)
+def test_examples():
+    ingredients = parse_ingredients(TEST_INGREDIENTS)
+    assert cookie_score([(ingredients["Butterscotch"], 44), (ingredients["Cinnamon"], 56)]) == 62842880
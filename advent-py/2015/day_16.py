@@ -50,10 +50,6 @@ def parse_sues(sue_str):
     return sues
 
 
-SUES = {}
-with open("data/16.txt") as fh:
-    SUES = parse_sues(fh.read())
-
 GIFTER = {
     "children": 3,
     "cats": 7,
@@ -67,10 +63,16 @@ GIFTER = {
     "perfumes": 1,
 }
 
-for (INDEX, SUE) in SUES.items():
-    if criteria_match_part1(GIFTER, SUE):
-        print(INDEX)
 
-for (INDEX, SUE) in SUES.items():
-    if criteria_match_part2(GIFTER, SUE):
-        print(INDEX)
+def matching_sue(sue_str, criteria_match_fn):
+    for (index, sue) in parse_sues(sue_str).items():
+        if criteria_match_fn(GIFTER, sue):
+            return index
+
+
+def part1(sue_str):
+    return matching_sue(sue_str, criteria_match_part1)
+
+
+def part2(sue_str):
+    return matching_sue(sue_str, criteria_match_part2)
@@ -1,5 +1,7 @@
 """ day 17: no such thing as too much """
 
+from advent import read_input
+
 
 def containers_for(quantity, containers):
     for (i, container) in enumerate(containers):
@@ -34,13 +36,21 @@ def ways_for_minimum_containers_to_make(quantity, containers_str):
     return numbers_of_containers.count(min(numbers_of_containers))
 
 
+def part1(containers_str):
+    return ways_for_containers_to_make(150, containers_str)
+
+
+def part2(containers_str):
+    return ways_for_minimum_containers_to_make(150, containers_str)
+
+
 TEST_CONTAINERS = "20 15 10 5 5"
-assert ways_for_containers_to_make(25, TEST_CONTAINERS) == 4
-assert ways_for_minimum_containers_to_make(25, TEST_CONTAINERS) == 3
 
-CONTAINERS = ""
-with open("data/17.txt") as fh:
-    CONTAINERS = fh.read()
 
-assert ways_for_containers_to_make(150, CONTAINERS) == 654
-print(ways_for_minimum_containers_to_make(150, CONTAINERS))
+def test_examples():
+    assert ways_for_containers_to_make(25, TEST_CONTAINERS) == 4
+    assert ways_for_minimum_containers_to_make(25, TEST_CONTAINERS) == 3
+
+
+def test_answers():
+    assert part1(read_input(2015, 17)) == 654
@@ -100,13 +100,15 @@ HOHOHO
 """
 
 
-assert distinct_replaced_molecules(*parse(TEST_REPLACEMENT_STR1)) == 4
-assert steps_to_e(*parse(TEST_REPLACEMENT_STR2)) == 3
-assert steps_to_e(*parse(TEST_REPLACEMENT_STR3)) == 6
+def part1(replacement_str):
+    return distinct_replaced_molecules(*parse(replacement_str))
 
 
-with open("data/19.txt") as fh:
-    REPLACEMENT_STR = fh.read()
+def part2(replacement_str):
+    return steps_to_e(*parse(replacement_str))
 
-print(distinct_replaced_molecules(*parse(REPLACEMENT_STR)))
-print(steps_to_e(*parse(REPLACEMENT_STR)))
+
+def test_examples():
+    assert distinct_replaced_molecules(*parse(TEST_REPLACEMENT_STR1)) == 4
+    assert steps_to_e(*parse(TEST_REPLACEMENT_STR2)) == 3
+    assert steps_to_e(*parse(TEST_REPLACEMENT_STR3)) == 6
@@ -44,5 +44,9 @@ def house_number(num_presents, elf_house_limit, presents_delivered_factor):
     return lowest_house
 
 
-print(house_number(36000000, math.inf, 10))
-print(house_number(36000000, 50, 11))
+def part1(num_presents):
+    return house_number(int(num_presents), math.inf, 10)
+
+
+def part2(num_presents):
+    return house_number(int(num_presents), 50, 11)
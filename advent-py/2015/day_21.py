@@ -3,6 +3,8 @@
 from collections import namedtuple
 import itertools
 
+from advent import read_input
+
 Equipment = namedtuple("Equipment", ["cost", "damage", "armor"])
 
 
@@ -103,9 +105,25 @@ RINGS = [
     Equipment(80, 0, 3),
 ]
 
-BOSS = Character(109, 8, 2)
 
-assert battle(Character(8, 5, 5), Character(12, 7, 2))
+def parse_boss(boss_str):
+    stats = dict([line.split(": ") for line in boss_str.strip().split("\n")])
+    return Character(int(stats["Hit Points"]), int(stats["Damage"]), int(stats["Armor"]))
+
+
+def part1(boss_str):
+    return min_gold_to_win(parse_boss(boss_str))
+
+
+def part2(boss_str):
+    return max_gold_to_lose(parse_boss(boss_str))
+
+
+def test_examples():
+    assert battle(Character(8, 5, 5), Character(12, 7, 2))
+
 
-assert min_gold_to_win(BOSS) == 111
-assert max_gold_to_lose(BOSS) == 188
+def test_answers():
+    boss_str = read_input(2015, 21)
+    assert part1(boss_str) == 111
+    assert part2(boss_str) == 188
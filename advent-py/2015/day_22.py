@@ -3,6 +3,9 @@
 from copy import copy, deepcopy
 from dataclasses import dataclass
 
+from advent import read_input
+from advent.cache import memoize
+
 
 @dataclass
 class InstantSpell:
@@ -130,6 +133,7 @@ SPELLS = {
 
 # I'm sure there's a more efficient way to do this, certainly the repeated
 # `battlefield` copying is inefficient. takes about a minute to run both parts.
+@memoize
 def battle(player, boss, hard_difficulty=False):
     starting_battlefield = Battlefield(player, boss)
     min_mana_to_win = float("inf")
@@ -166,8 +170,25 @@ def battle(player, boss, hard_difficulty=False):
     return min_mana_to_win
 
 
-assert battle(Player(10, 250), Boss(13, 8)) == 226
-assert battle(Player(10, 250), Boss(14, 8)) == 641
+def parse_boss(boss_str):
+    stats = dict([line.split(": ") for line in boss_str.strip().split("\n")])
+    return Boss(int(stats["Hit Points"]), int(stats["Damage"]))
+
+
+def part1(boss_str):
+    return battle(Player(50, 500), parse_boss(boss_str))
+
+
+def part2(boss_str):
+    return battle(Player(50, 500), parse_boss(boss_str), hard_difficulty=True)
+
+
+def test_examples():
+    assert battle(Player(10, 250), Boss(13, 8)) == 226
+    assert battle(Player(10, 250), Boss(14, 8)) == 641
+
 
-assert battle(Player(50, 500), Boss(58, 9)) == 1269
-assert battle(Player(50, 500), Boss(58, 9), True) == 1309
+def test_answers():
+    boss_str = read_input(2015, 22)
+    assert part1(boss_str) == 1269
+    assert part2(boss_str) == 1309
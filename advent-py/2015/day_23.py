@@ -1,5 +1,7 @@
 """ day 23: opening the turing lock """
 
+from advent import read_input
+
 
 class Computer:
     def __init__(self):
@@ -51,14 +53,18 @@ class Computer:
         return self.registers["b"]
 
 
-with open("data/23.txt") as f:
-    PROGRAM = f.read()
+def part1(program_str):
+    computer = Computer()
+    return computer.run_program(program_str)
+
+
+def part2(program_str):
+    computer = Computer()
+    computer.registers["a"] = 1
+    return computer.run_program(program_str)
 
-c = Computer()
-c.run_program(PROGRAM)
-assert c.registers["b"] == 170
 
-c = Computer()
-c.registers["a"] = 1
-c.run_program(PROGRAM)
-assert c.registers["b"] == 247
+def test_answers():
+    program_str = read_input(2015, 23)
+    assert part1(program_str) == 170
+    assert part2(program_str) == 247
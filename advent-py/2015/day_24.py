@@ -2,6 +2,8 @@
 
 from functools import reduce
 
+from advent import read_input
+
 
 def list_difference(minuend, *subtrahends):
     """safe list difference in case there are duplicate entries in minuend"""
@@ -74,17 +76,28 @@ def distribute_packages(packages, num_packages):
 
         best_group = group
 
-    print(best_group)
-
     return quantum_entanglement(best_group)
 
 
-TEST_PACKAGES = list(range(1, 6)) + list(range(7, 12))
-assert distribute_packages(TEST_PACKAGES, 3) == 99
-assert distribute_packages(TEST_PACKAGES, 4) == 44
+def parse_packages(packages_str):
+    return [int(x.strip()) for x in packages_str.split()]
+
+
+def part1(packages_str):
+    return distribute_packages(parse_packages(packages_str), 3)
+
+
+def part2(packages_str):
+    return distribute_packages(parse_packages(packages_str), 4)
+
+
+def test_examples():
+    test_packages = list(range(1, 6)) + list(range(7, 12))
+    assert distribute_packages(test_packages, 3) == 99
+    assert distribute_packages(test_packages, 4) == 44
 
-with open("data/24.txt") as f:
-    PACKAGES = [int(x.strip()) for x in f.readlines() if x]
 
-assert distribute_packages(PACKAGES, 3) == 11266889531
-assert distribute_packages(PACKAGES, 4) == 77387711
+def test_answers():
+    packages_str = read_input(2015, 24)
+    assert part1(packages_str) == 11266889531
+    assert part2(packages_str) == 77387711
@@ -1,5 +1,9 @@
 """ day 25: let it snow """
 
+import re
+
+from advent import read_input
+
 
 def seq_number(row, col):
     def seq_number_col1(row):
@@ -28,4 +32,14 @@ def code(row, col):
     return value
 
 
-assert code(2947, 3029) == 19980801
+def parse_location(manual_str):
+    row, col = re.search(r"row ([0-9]+), column ([0-9]+)", manual_str).groups()
+    return int(row), int(col)
+
+
+def part1(manual_str):
+    return code(*parse_location(manual_str))
+
+
+def test_answers():
+    assert part1(read_input(2015, 25)) == 19980801
@@ -18,13 +18,13 @@ def compute_fuel_for_fuel(initial_mass):
     return fuel + compute_fuel_for_fuel(fuel)
 
 
-total_fuel = 0
-with open("data/01.txt", "r") as f:
-    for line in f.readlines():
-        mass_str = line.strip()
-        try:
-            total_fuel += compute_fuel_for_fuel(int(mass_str))
-        except ValueError:
-            print(f"{mass_str} cannot be parsed to int")
-
-print(total_fuel)
+def parse_masses(masses_str):
+    return [int(mass_str) for mass_str in masses_str.split()]
+
+
+def part1(masses_str):
+    return sum([compute_fuel(mass) for mass in parse_masses(masses_str)])
+
+
+def part2(masses_str):
+    return sum([compute_fuel_for_fuel(mass) for mass in parse_masses(masses_str)])
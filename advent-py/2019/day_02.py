@@ -3,6 +3,10 @@ day 2: 1202 program alarm
 https://adventofcode.com/2019/day/2
 """
 
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from advent import read_input
+
 
 def parse_program(program, noun=None, verb=None):
     index = 0
@@ -26,28 +30,115 @@ def parse_program(program, noun=None, verb=None):
         elif opcode == 99:
             break
         else:
-            print(f"Bad opcode {opcode}!")
-            raise ValueError
+            raise ValueError(f"Bad opcode {opcode} at {index}!")
 
         index += instruction_length
 
     return program[0]
 
 
-def read_first_program_from_file(filename):
-    with open(filename, "r") as f:
-        for line in f.readlines():
-            return [int(x) for x in line.strip().split(",")]
+def try_inputs(program, noun, verb):
+    """the program's output for one noun and verb, or None if it crashes on them"""
+
+    try:
+        return parse_program(list(program), noun, verb)
+    except (IndexError, ValueError):
+        return None
+
+
+def _sweep_chunk(program, target, nouns, verbs):
+    for noun in nouns:
+        for verb in verbs:
+            if try_inputs(program, noun, verb) == target:
+                return noun, verb
+
+    return None
+
+
+def sweep(program, target, nouns=range(100), verbs=range(100), chunk_size=10, max_workers=None):
+    """(noun, verb) giving target, trying `chunk_size` nouns at a time per worker and stopping at the first hit"""
+
+    chunks = [nouns[start : start + chunk_size] for start in range(0, len(nouns), chunk_size)]
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(_sweep_chunk, program, target, chunk, verbs) for chunk in chunks]
+        for future in as_completed(futures):
+            found = future.result()
+            if found is not None:
+                # anything still queued won't start; the with block only waits on chunks already running
+                for other in futures:
+                    other.cancel()
+                return found
+
+    return None
+
+
+def solve_linear(program, target, nouns=range(100), verbs=range(100)):
+    """
+    if the output looks like c + a * noun + b * verb, solve for (noun, verb) directly instead of sweeping
+
+    The fit comes from three runs and is checked against a few more, and whatever it finds is run once for real,
+    so a program that isn't linear after all just gets None.
+    """
+
+    base = try_inputs(program, nouns[0], verbs[0])
+    noun_step = try_inputs(program, nouns[1], verbs[0])
+    verb_step = try_inputs(program, nouns[0], verbs[1])
+    if None in (base, noun_step, verb_step):
+        return None
+
+    a = noun_step - base
+    b = verb_step - base
+
+    def predict(noun, verb):
+        return base + a * (noun - nouns[0]) + b * (verb - verbs[0])
+
+    for noun, verb in [(nouns[-1], verbs[-1]), (nouns[len(nouns) // 2], verbs[len(verbs) // 3]), (nouns[2], verbs[-1])]:
+        if try_inputs(program, noun, verb) != predict(noun, verb):
+            return None
+
+    for noun in nouns:
+        remainder = target - predict(noun, verbs[0])
+        if b == 0:
+            if remainder != 0:
+                continue
+            verb = verbs[0]
+        elif remainder % b:
+            continue
+        else:
+            verb = verbs[0] + remainder // b
+
+        if verb in verbs and try_inputs(program, noun, verb) == target:
+            return noun, verb
+
+    return None
+
+
+def read_first_program(program_str):
+    for line in program_str.split("\n"):
+        return [int(x) for x in line.strip().split(",")]
+
+
+def part1(program_str):
+    return parse_program(read_first_program(program_str), 12, 2)
+
+
+def part2(program_str):
+    program = read_first_program(program_str)
+    found = solve_linear(program, 19690720) or sweep(program, 19690720)
+    if found is None:
+        raise ValueError("No noun and verb make the program output 19690720")
+
+    noun, verb = found
+    return 100 * noun + verb
+
 
+def test_examples():
+    assert parse_program([1, 0, 0, 0, 99]) == 2
+    assert parse_program([2, 3, 0, 3, 99]) == 2
+    assert parse_program([2, 4, 4, 5, 99, 0]) == 2
+    assert parse_program([1, 1, 1, 4, 99, 5, 6, 0, 99]) == 30
 
-# test cases
-assert parse_program([1, 0, 0, 0, 99]) == 2
-assert parse_program([2, 3, 0, 3, 99]) == 2
-assert parse_program([2, 4, 4, 5, 99, 0]) == 2
-assert parse_program([1, 1, 1, 4, 99, 5, 6, 0, 99]) == 30
 
-PROGRAM = read_first_program_from_file("data/02.txt")
-for noun_opt in range(100):
-    for verb_opt in range(100):
-        if parse_program(list(PROGRAM), noun_opt, verb_opt) == 19690720:
-            print(100 * noun_opt + verb_opt)
+def test_answers():
+    program = read_first_program(read_input(2019, 2))
+    assert solve_linear(program, 19690720) == sweep(program, 19690720, max_workers=2) == (79, 60)
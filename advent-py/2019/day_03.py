@@ -5,6 +5,8 @@ https://adventofcode.com/2019/day/3
 
 import sys
 
+from advent import read_input
+
 # probably should use a dict here (value = steps required) to make this faster
 # current structure is [(x, y, steps_required)]
 def points_hit_single_instruction(start_position, direction, distance):
@@ -63,15 +65,18 @@ def closest_point_from_strs(wire1_str, wire2_str):
     return fewest_steps_to_intersection_point(str_to_wire(wire1_str), str_to_wire(wire2_str))
 
 
-def read_wire_strs_from_file(filename):
-    with open(filename, "r") as f:
-        return [line for line in f.readlines()]
+def part2(wires_str):
+    wire1_str, wire2_str = wires_str.split()
+    return closest_point_from_strs(wire1_str, wire2_str)
+
 
+def test_examples():
+    assert closest_point_from_strs("R75,D30,R83,U83,L12,D49,R71,U7,L72", "U62,R66,U55,R34,D71,R55,D58,R83") == 610
+    assert (
+        closest_point_from_strs("R98,U47,R26,D63,R33,U87,L62,D20,R33,U53,R51", "U98,R91,D20,R16,D67,R40,U7,R15,U6,R7")
+        == 410
+    )
 
-# test cases
-assert closest_point_from_strs("R75,D30,R83,U83,L12,D49,R71,U7,L72", "U62,R66,U55,R34,D71,R55,D58,R83") == 610
-assert closest_point_from_strs("R98,U47,R26,D63,R33,U87,L62,D20,R33,U53,R51", "U98,R91,D20,R16,D67,R40,U7,R15,U6,R7",) == 410
 
-WIRES = read_wire_strs_from_file("data/03.txt")
-if len(WIRES) > 1:
-    print(closest_point_from_strs(WIRES[0], WIRES[1]))  # 399
+def test_answers():
+    assert part2(read_input(2019, 3)) == 15678
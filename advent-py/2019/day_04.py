@@ -5,6 +5,8 @@ https://adventofcode.com/2019/day/4
 
 from collections import defaultdict
 
+from advent import read_input
+
 
 def is_increasing(password):
     return not any([password[i] > password[i + 1] for i in range(len(password) - 1)])
@@ -72,8 +74,15 @@ def count_valid_passwords(lower_bound, upper_bound):
     return _count_valid_passwords_recursive([], str_to_list(lower_bound), str_to_list(upper_bound))
 
 
-assert meets_criteria("112233")
-assert meets_criteria("111122")
-assert not meets_criteria("123444")
+def part2(range_str):
+    return count_valid_passwords(*range_str.strip().split("-"))
+
+
+def test_examples():
+    assert meets_criteria("112233")
+    assert meets_criteria("111122")
+    assert not meets_criteria("123444")
+
 
-print(count_valid_passwords("138241", "674034"))  # 1890
+def test_answers():
+    assert part2(read_input(2019, 4)) == 1277
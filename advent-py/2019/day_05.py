@@ -3,54 +3,164 @@ day 5: sunny with a chance of asteroids
 https://adventofcode.com/2019/day/5
 """
 
-from typing import List
+import copy
+import random
+from collections import deque
+from enum import Enum
 
 import attr
 
+from advent.cache import cached_parse
+
+from .intcode_analysis import analysis_report, fusable_compare_jump
+from .intcode_jit import BlockCompiler, split_instruction
+from .intcode_memory import PAGE_BITS, PAGE_MASK, core_size, new_page, store, to_words
+from .intcode_profile import InstructionStats
+from .intcode_trace import HALT, INPUT, OUTPUT, Trace
+
+
+@cached_parse
+def parse_programs(program_str):
+    """one program per non-empty line"""
+
+    return [[int(x) for x in line.strip().split(",")] for line in program_str.split("\n") if line.strip()]
+
+
+class RunStatus(Enum):
+    NEED_INPUT = 1
+    OUTPUT = 2
+    BUDGET_EXHAUSTED = 3
+    HALTED = 4
+
+
+@attr.s(frozen=True, slots=True)
+class IntcodeImage:
+    """a parsed program that's never written to, so any number of machines can start from the same one"""
+
+    words = attr.ib()
+    # how much of `words` is the program itself, rather than room to grow into
+    length = attr.ib(default=None)
+    # instructions decoded by any machine that's still running on these words as they are
+    decoded = attr.ib(init=False, factory=dict, eq=False)
+
+    @classmethod
+    def init_from_list(cls, program):
+        return IntcodeImage(to_words(program, core_size(len(program))), len(program))
+
+    @classmethod
+    def init_from_str(cls, program_str):
+        return cls.init_from_list(parse_programs(program_str)[0])
+
+    @classmethod
+    def init_from_file(cls, filename):
+        with open(filename, "r") as file:
+            return cls.init_from_str(file.read())
+
 
 @attr.s(slots=True)
 class IntcodeComputer:
+    # a list of ints, or an IntcodeImage to share with other machines
     program = attr.ib(factory=list)
 
-    input_values = attr.ib(factory=list)
+    input_values = attr.ib(factory=deque, converter=deque)
+    # compile straight-line code to python functions, for long running programs
+    use_jit = attr.ib(default=False)
+    # count every instruction executed, in `stats`
+    instrument = attr.ib(default=False)
+    # record every input read and output written, in `trace`
+    record_trace = attr.ib(default=False)
+    # run a compare and the conditional jump on its result in one dispatch
+    fuse = attr.ib(default=False)
 
     index = attr.ib(init=False, default=0)
     relative_base = attr.ib(init=False, default=0)
     alive = attr.ib(init=False, default=True)
 
-    backup_program = attr.ib(init=False)
+    image = attr.ib(init=False)
+    # page number -> page, for addresses past the end of the program
+    pages = attr.ib(init=False, factory=dict)
+    # pages this machine can write to in place, rather than sharing with a fork
+    owned_pages = attr.ib(init=False, factory=set)
+    # address -> (handler, parameter modes)
+    decoded = attr.ib(init=False, factory=dict)
+    # the program (and what's been decoded from it) is shared with the image and forks until the first write
+    shared = attr.ib(init=False, default=False)
+    block_compiler = attr.ib(init=False, default=None)
+    stats = attr.ib(init=False, default=None)
+    trace = attr.ib(init=False, default=None)
+    # instructions executed since the last reset
+    steps = attr.ib(init=False, default=0)
+    # outputs from run(), waiting to be picked up
+    output_values = attr.ib(init=False, factory=deque)
+    observed = attr.ib(init=False, default=False)
 
     def __attrs_post_init__(self):
-        self.program = list(self.program)
-        self.backup_program = list(self.program)
+        if not isinstance(self.program, IntcodeImage):
+            self.program = IntcodeImage.init_from_list(self.program)
+
+        # start out sharing the image's memory, and only copy it on the first write
+        self.image = self.program
+        self.program = self.image.words
+        if self.instrument:
+            self.stats = InstructionStats()
+        if self.record_trace:
+            self.trace = Trace()
+
+        # compiled blocks and fused instructions would skip the per-instruction bookkeeping, so observed machines
+        # always interpret one instruction at a time
+        self.observed = self.instrument or self.record_trace
+        self.fuse = self.fuse and not self.observed
+        if self.use_jit and not self.observed:
+            self.block_compiler = BlockCompiler()
+
+        # fused instructions don't look like what other machines expect to find decoded, so aren't shared with them
+        self.decoded = dict() if self.fuse else self.image.decoded
+        self.shared = True
 
     def is_alive(self):
         return self.alive
 
     def reset(self):
-        self.program = list(self.backup_program)
+        self.program = self.image.words
+        self.pages = dict()
+        self.owned_pages = set()
         self.index = 0
         self.relative_base = 0
         self.alive = True
-        self.input_values = list()
+        self.input_values = deque()
+        self.decoded = dict() if self.fuse else self.image.decoded
+        self.shared = True
+        self.steps = 0
+        self.output_values = deque()
+        if self.block_compiler is not None:
+            self.block_compiler.reset()
+        if self.record_trace:
+            self.trace = Trace()
 
     @classmethod
-    def init_from_file_generator(cls, filename, **kwargs):
-        with open(filename, "r") as file:
-            for line in file.readlines():
-                program_raw = [int(x) for x in line.strip().split(",")]
-                yield IntcodeComputer(program=program_raw, **kwargs)
+    def init_from_str_generator(cls, program_str, **kwargs):
+        for program_raw in parse_programs(program_str):
+            yield IntcodeComputer(program=program_raw, **kwargs)
 
     @classmethod
-    def init_from_file(cls, filename, **kwargs):
-        for intcode_computer in IntcodeComputer.init_from_file_generator(filename, **kwargs):
+    def init_from_str(cls, program_str, **kwargs):
+        for intcode_computer in IntcodeComputer.init_from_str_generator(program_str, **kwargs):
             return intcode_computer
 
+    @classmethod
+    def init_from_file(cls, filename, **kwargs):
+        with open(filename, "r") as file:
+            return cls.init_from_str(file.read(), **kwargs)
+
     def _get_value_program(self, index):
         if index < len(self.program):
             return self.program[index]
 
-        return 0
+        page = self.pages.get(index >> PAGE_BITS)
+        if page is None:
+            return 0
+
+        return page[index & PAGE_MASK]
 
     def _get_value(self, parameter, mode):
         if mode == 0:
@@ -67,153 +177,166 @@ class IntcodeComputer:
 
         return parameter
 
+    def _unshare(self):
+        self.program = self.program[:]
+        self.decoded = dict(self.decoded)
+        self.shared = False
+
+    def _set_value_paged(self, index, value):
+        page_number = index >> PAGE_BITS
+        page = self.pages.get(page_number)
+        if page is None:
+            page = new_page()
+            self.owned_pages.add(page_number)
+        elif page_number not in self.owned_pages:
+            page = page[:]
+            self.owned_pages.add(page_number)
+
+        self.pages[page_number] = store(page, index & PAGE_MASK, value)
+
     def _set_value(self, index, value):
+        if self.shared:
+            self._unshare()
+
         if index < len(self.program):
-            self.program[index] = value
+            try:
+                self.program[index] = value
+            except OverflowError:
+                self.program = store(self.program, index, value)
         else:
-            self.program.extend([0 for _ in range(10 + index - len(self.program))])
-            self.program[index] = value
+            self._set_value_paged(index, value)
 
-    def _get_params(self, instruction_len):
-        if self.index + instruction_len >= len(self.program):
-            self.program.extend([0 for _ in range(10 + self.index + instruction_len - len(self.program))])
+        # self-modifying code: whatever was decoded at this address is stale now
+        if index in self.decoded:
+            del self.decoded[index]
+        if self.block_compiler is not None and index in self.block_compiler.owners:
+            self.block_compiler.invalidate(index)
 
-        return self.program[self.index + 1 : self.index + instruction_len]
+    def _read(self, offset, mode):
+        """value of the parameter `offset` cells after the current instruction"""
 
-    def _get_params_with_modes(self, instruction_len, param_modes):
-        return list(zip(self._get_params(instruction_len), param_modes))
+        return self._get_value(self._get_value_program(self.index + offset), mode)
 
-    def _parse_instruction_opcode1(self, param_modes):
-        instruction_len = 4
-        pms = self._get_params_with_modes(instruction_len, param_modes)
+    def _write(self, offset, mode, value):
+        self._set_value(self._get_value_write(self._get_value_program(self.index + offset), mode), value)
 
-        self._set_value(
-            self._get_value_write(*pms[2]), self._get_value(*pms[0]) + self._get_value(*pms[1]),
-        )
-        self.index += instruction_len
+    def _parse_instruction_opcode1(self, modes):
+        self._write(3, modes[2], self._read(1, modes[0]) + self._read(2, modes[1]))
+        self.index += 4
 
-    def _parse_instruction_opcode2(self, param_modes):
-        instruction_len = 4
-        pms = self._get_params_with_modes(instruction_len, param_modes)
-
-        self._set_value(
-            self._get_value_write(*pms[2]), self._get_value(*pms[0]) * self._get_value(*pms[1]),
-        )
-        self.index += instruction_len
-
-    def _parse_instruction_opcode3(self, param_modes):
-        instruction_len = 2
-        pms = self._get_params_with_modes(instruction_len, param_modes)
-        ps = self._get_params(instruction_len)
+    def _parse_instruction_opcode2(self, modes):
+        self._write(3, modes[2], self._read(1, modes[0]) * self._read(2, modes[1]))
+        self.index += 4
 
+    def _parse_instruction_opcode3(self, modes):
         if self.input_values:
-            value = self.input_values.pop(0)
+            value = self.input_values.popleft()
         else:
             value = int(input("--> "))
 
-        if pms[0][1] == 2:
-            self._set_value(ps[0] + self.relative_base, value)
-        else:
-            self._set_value(ps[0], value)
+        if self.trace is not None:
+            self.trace.record(INPUT, self.steps, value)
 
-        self.index += instruction_len
+        self._write(1, modes[0], value)
+        self.index += 2
 
-    def _parse_instruction_opcode4(self, param_modes):
-        instruction_len = 2
-        pms = self._get_params_with_modes(instruction_len, param_modes)
+    def _parse_instruction_opcode4(self, modes):
+        value = self._read(1, modes[0])
+        self.index += 2
 
-        value = self._get_value(*pms[0])
-        self.index += instruction_len
+        if self.trace is not None:
+            self.trace.record(OUTPUT, self.steps, value)
 
         return value
 
-    def _parse_instruction_opcode5(self, param_modes):
-        instruction_len = 3
-        pms = self._get_params_with_modes(instruction_len, param_modes)
+    def _parse_instruction_opcode5(self, modes):
+        if self._read(1, modes[0]):
+            self.index = self._read(2, modes[1])
+        else:
+            self.index += 3
 
-        if self._get_value(*pms[0]):
-            self.index = self._get_value(*pms[1])
+    def _parse_instruction_opcode6(self, modes):
+        if not self._read(1, modes[0]):
+            self.index = self._read(2, modes[1])
         else:
-            self.index += instruction_len
+            self.index += 3
 
-    def _parse_instruction_opcode6(self, param_modes):
-        instruction_len = 3
-        pms = self._get_params_with_modes(instruction_len, param_modes)
+    def _parse_instruction_opcode7(self, modes):
+        self._write(3, modes[2], int(self._read(1, modes[0]) < self._read(2, modes[1])))
+        self.index += 4
 
-        if not self._get_value(*pms[0]):
-            self.index = self._get_value(*pms[1])
-        else:
-            self.index += instruction_len
+    def _parse_instruction_opcode8(self, modes):
+        self._write(3, modes[2], int(self._read(1, modes[0]) == self._read(2, modes[1])))
+        self.index += 4
 
-    def _parse_instruction_opcode7(self, param_modes):
-        instruction_len = 4
-        pms = self._get_params_with_modes(instruction_len, param_modes)
+    def _parse_instruction_opcode9(self, modes):
+        self.relative_base += self._read(1, modes[0])
+        self.index += 2
 
-        if self._get_value(*pms[0]) < self._get_value(*pms[1]):
-            self._set_value(self._get_value_write(*pms[2]), 1)
+    # exit by setting index outside range of program
+    def _parse_instruction_opcode99(self, _modes):
+        self.alive = False
+        if self.trace is not None:
+            self.trace.record(HALT, self.steps, 0)
+
+    def _parse_superinstruction_compare_jump(self, fused):
+        compare, compare_modes, jump_instruction, jump_opcode, jump_modes = fused
+        first, second = self._read(1, compare_modes[0]), self._read(2, compare_modes[1])
+        self._write(3, compare_modes[2], int(first < second) if compare == 7 else int(first == second))
+        self.index += 4
+
+        # the compare could have written over the jump, in which case it has to be decoded again on its own
+        if self._get_value_program(self.index) != jump_instruction:
+            self.decoded.pop(self.index - 4, None)
+            return
+
+        self.steps += 1
+        if bool(self._read(1, jump_modes[0])) == (jump_opcode == 5):
+            self.index = self._read(2, jump_modes[1])
         else:
-            self._set_value(self._get_value_write(*pms[2]), 0)
+            self.index += 3
 
-        self.index += instruction_len
+    def _decode(self, index):
+        """
+        (handler, parameter modes) for the instruction at index, cached until something writes there; when fusing,
+        a compare and branch is (fused handler, what it needs to know about both instructions) instead
+        """
 
-    def _parse_instruction_opcode8(self, param_modes):
-        instruction_len = 4
-        pms = self._get_params_with_modes(instruction_len, param_modes)
-
-        if self._get_value(*pms[0]) == self._get_value(*pms[1]):
-            self._set_value(self._get_value_write(*pms[2]), 1)
-        else:
-            self._set_value(self._get_value_write(*pms[2]), 0)
+        opcode, modes = split_instruction(self._get_value_program(index))
+        if opcode not in OPCODE_HANDLERS:
+            raise ValueError(f"Bad opcode {opcode} at {index}!")
 
-        self.index += instruction_len
+        fused = self.fuse and opcode in (7, 8) and fusable_compare_jump(self._get_value_program, index)
+        if fused:
+            self.decoded[index] = (IntcodeComputer._parse_superinstruction_compare_jump, fused)
+            return self.decoded[index]
 
-    def _parse_instruction_opcode9(self, param_modes):
-        instruction_len = 2
-        pms = self._get_params_with_modes(instruction_len, param_modes)
-        self.relative_base += self._get_value(*pms[0])
+        self.decoded[index] = (OPCODE_HANDLERS[opcode], modes)
+        return self.decoded[index]
 
-        self.index += instruction_len
+    def _execute_observed(self, handler, modes):
+        if self.stats is not None:
+            return self.stats.execute(self, handler, modes)
 
-    # exit by setting index outside range of program
-    def _parse_instruction_opcode99(self):
-        self.alive = False
+        return handler(self, modes)
 
     def _parse_instruction(self):
-        opcode_with_params = f"{self.program[self.index]:05}"
-
-        opcode = int(opcode_with_params[-2::])
-        param_modes = [int(x) for x in opcode_with_params[:3][::-1]]
-
-        if opcode == 1:
-            self._parse_instruction_opcode1(param_modes)
-        elif opcode == 2:
-            self._parse_instruction_opcode2(param_modes)
-        elif opcode == 3:
-            self._parse_instruction_opcode3(param_modes)
-        elif opcode == 4:
-            return self._parse_instruction_opcode4(param_modes)
-        elif opcode == 5:
-            self._parse_instruction_opcode5(param_modes)
-        elif opcode == 6:
-            self._parse_instruction_opcode6(param_modes)
-        elif opcode == 7:
-            self._parse_instruction_opcode7(param_modes)
-        elif opcode == 8:
-            self._parse_instruction_opcode8(param_modes)
-        elif opcode == 9:
-            self._parse_instruction_opcode9(param_modes)
-        elif opcode == 99:
-            self._parse_instruction_opcode99()
-        else:
-            print(f"Bad opcode {opcode}!")
-            raise ValueError
+        handler, modes = self.decoded.get(self.index) or self._decode(self.index)
+        self.steps += 1
+        if self.observed:
+            return self._execute_observed(handler, modes)
+
+        return handler(self, modes)
 
     def parse(self, noun=None, verb=None, stop_on_yield=False):
         if noun is not None and verb is not None:
-            self.program[1] = noun
-            self.program[2] = verb
+            self._set_value(1, noun)
+            self._set_value(2, verb)
 
         while self.alive:
+            if self.block_compiler is not None:
+                self.block_compiler.run(self)
+
             val = self._parse_instruction()
             if val is not None:
                 yield val
@@ -225,11 +348,54 @@ class IntcodeComputer:
         for _ in self.parse():
             continue
 
-        return self.program[index]
+        return self._get_value_program(index)
+
+    def _run(self, max_outputs=None, stop_for_input=True, max_steps=None):
+        """
+        run until halting, `max_outputs` values have come out, (if `stop_for_input`) the input runs dry, or (roughly,
+        if compiled blocks or fused instructions are running) `max_steps` instructions have been executed
+        """
+
+        outputs = []
+        limit = None if max_steps is None else self.steps + max_steps
+        while self.alive:
+            if self.block_compiler is not None:
+                self.block_compiler.run(self, limit)
+                if not self.alive:
+                    break
+
+            if limit is not None and self.steps >= limit:
+                break
+
+            handler, modes = self.decoded.get(self.index) or self._decode(self.index)
+            if stop_for_input and handler is OPCODE_HANDLERS[3] and not self.input_values:
+                break
+
+            self.steps += 1
+            val = self._execute_observed(handler, modes) if self.observed else handler(self, modes)
+            if val is not None:
+                outputs.append(val)
+                if max_outputs is not None and len(outputs) >= max_outputs:
+                    break
+
+        return outputs
+
+    def run_until(self, n_outputs):
+        """the next `n_outputs` values, or fewer if the program halts or needs input first"""
+
+        return self._run(max_outputs=n_outputs)
+
+    def run_until_input_needed(self):
+        """every value output until the program halts or needs input it hasn't been given"""
+
+        return self._run()
 
     def parse_and_get_next_value(self):
-        for val in self.parse(stop_on_yield=True):
-            return val
+        outputs = self._run(max_outputs=1, stop_for_input=False)
+        if outputs:
+            return outputs[0]
+
+        return None
 
     def parse_and_get_last_value(self):
         last_val = None
@@ -241,43 +407,284 @@ class IntcodeComputer:
     def pass_in(self, value):
         self.input_values.append(value)
 
+    def pass_in_all(self, values):
+        self.input_values.extend(values)
+
+    def fork(self):
+        """an independent copy of the machine as it is now; memory is only copied once one of them writes to it"""
+
+        self.shared = True
+        self.owned_pages = set()
+        forked = copy.copy(self)
+        forked.pages = dict(self.pages)
+        forked.owned_pages = set()
+        forked.input_values = deque(self.input_values)
+        forked.output_values = deque(self.output_values)
+        if self.block_compiler is not None:
+            forked.block_compiler = BlockCompiler()
+        if self.trace is not None:
+            forked.trace = self.trace.fork()
+
+        return forked
+
+    def snapshot(self):
+        """the state to go back to with restore(); as cheap as a fork"""
+
+        return self.fork()
+
+    def restore(self, snapshot):
+        snapshot.shared = True
+        snapshot.owned_pages = set()
+        self.program = snapshot.program
+        self.decoded = snapshot.decoded
+        self.shared = True
+        self.pages = dict(snapshot.pages)
+        self.owned_pages = set()
+
+        self.index = snapshot.index
+        self.relative_base = snapshot.relative_base
+        self.alive = snapshot.alive
+        self.input_values = deque(snapshot.input_values)
+        self.steps = snapshot.steps
+        self.output_values = deque(snapshot.output_values)
+        if self.block_compiler is not None:
+            self.block_compiler.reset()
+        if self.trace is not None:
+            # carry on recording from where the snapshot was, leaving what happened since as an abandoned branch
+            self.trace = snapshot.trace.fork()
+
+    def needs_input(self):
+        """whether the next instruction reads input, and there's none queued up for it"""
+
+        handler, _modes = self.decoded.get(self.index) or self._decode(self.index)
+        return handler is OPCODE_HANDLERS[3] and not self.input_values
+
     def run(self):
         for _ in self.parse():
             continue
 
+    def run_slice(self, max_steps=None):
+        """
+        run for one time slice: until the next output (which goes on `output_values`), until it needs input, until
+        it halts, or until it has used up `max_steps` instructions; returns which of those it was
+        """
 
-def test_intcode_computer():
-    # test cases
-    assert IntcodeComputer([1, 0, 0, 0, 99]).parse_and_get_value_at_index(0) == 2
-    assert IntcodeComputer([2, 3, 0, 3, 99]).parse_and_get_value_at_index(0) == 2
-    assert IntcodeComputer([2, 4, 4, 5, 99, 0]).parse_and_get_value_at_index(0) == 2
-    assert IntcodeComputer([1, 1, 1, 4, 99, 5, 6, 0, 99]).parse_and_get_value_at_index(0) == 30
-    assert IntcodeComputer([1002, 4, 3, 4, 33]).parse_and_get_value_at_index(4) == 99
-    assert IntcodeComputer([1101, 100, -1, 4, 0]).parse_and_get_value_at_index(4) == 99
+        outputs = self._run(max_outputs=1, max_steps=max_steps)
+        if outputs:
+            self.output_values.extend(outputs)
+            return RunStatus.OUTPUT
+        if not self.alive:
+            return RunStatus.HALTED
+        if self.needs_input():
+            return RunStatus.NEED_INPUT
+
+        return RunStatus.BUDGET_EXHAUSTED
+
+    def instruction_report(self, top=10):
+        """opcode counts, the hottest addresses and an annotated disassembly; needs `instrument`"""
+
+        return self.stats.report(self._get_value_program, top)
+
+    def analysis_report(self):
+        """basic blocks, idioms and writes into code, from reading the program as it was loaded rather than running it"""
+
+        return analysis_report(self.image.words.__getitem__, self.image.length or len(self.image.words))
+
+
+@attr.s(slots=True)
+class IntcodePool:
+    """hands out machines running the same image, reusing ones that have been given back"""
 
-    # "stdout" test cases
-    test_program = [3, 9, 8, 9, 10, 9, 4, 9, 99, -1, 8]
-    assert IntcodeComputer(test_program, input_values=[8]).parse_and_get_next_value() == 1
-    assert IntcodeComputer(test_program, input_values=[7]).parse_and_get_next_value() == 0
+    image = attr.ib()
+    machine_kwargs = attr.ib(factory=dict)
 
-    test_program = [3, 3, 1108, -1, 8, 3, 4, 3, 99]
-    assert IntcodeComputer(test_program, input_values=[8]).parse_and_get_next_value() == 1
-    assert IntcodeComputer(test_program, input_values=[7]).parse_and_get_next_value() == 0
+    idle = attr.ib(init=False, factory=list)
 
-    test_program = [3, 12, 6, 12, 15, 1, 13, 14, 13, 4, 13, 99, -1, 0, 1, 9]
-    assert IntcodeComputer(test_program, input_values=[0]).parse_and_get_next_value() == 0
-    assert IntcodeComputer(test_program, input_values=[8]).parse_and_get_next_value() == 1
+    def acquire(self):
+        if self.idle:
+            return self.idle.pop()
 
-    test_program = [3, 3, 1105, -1, 9, 1101, 0, 0, 12, 4, 12, 99, 1]
-    assert IntcodeComputer(test_program, input_values=[0]).parse_and_get_next_value() == 0
-    assert IntcodeComputer(test_program, input_values=[8]).parse_and_get_next_value() == 1
+        return IntcodeComputer(self.image, **self.machine_kwargs)
 
-    assert len(str(IntcodeComputer([1102, 34915192, 34915192, 7, 4, 7, 99, 0]).parse_and_get_next_value())) == 16
-    assert IntcodeComputer([104, 1125899906842624, 99]).parse_and_get_next_value() == 1125899906842624
+    def release(self, machine):
+        machine.reset()
+        self.idle.append(machine)
 
 
-if __name__ == "__main__":
-    test_intcode_computer()
+OPCODE_HANDLERS = {
+    1: IntcodeComputer._parse_instruction_opcode1,
+    2: IntcodeComputer._parse_instruction_opcode2,
+    3: IntcodeComputer._parse_instruction_opcode3,
+    4: IntcodeComputer._parse_instruction_opcode4,
+    5: IntcodeComputer._parse_instruction_opcode5,
+    6: IntcodeComputer._parse_instruction_opcode6,
+    7: IntcodeComputer._parse_instruction_opcode7,
+    8: IntcodeComputer._parse_instruction_opcode8,
+    9: IntcodeComputer._parse_instruction_opcode9,
+    99: IntcodeComputer._parse_instruction_opcode99,
+}
+
+
+def part1(program_str):
+    return IntcodeComputer.init_from_str(program_str, input_values=[1]).parse_and_get_last_value()
+
+
+def part2(program_str):
+    return IntcodeComputer.init_from_str(program_str, input_values=[5]).parse_and_get_last_value()
+
+
+def test_intcode_computer():
+    for use_jit in [False, True]:
+        # test cases
+        assert IntcodeComputer([1, 0, 0, 0, 99], use_jit=use_jit).parse_and_get_value_at_index(0) == 2
+        assert IntcodeComputer([2, 3, 0, 3, 99], use_jit=use_jit).parse_and_get_value_at_index(0) == 2
+        assert IntcodeComputer([2, 4, 4, 5, 99, 0], use_jit=use_jit).parse_and_get_value_at_index(0) == 2
+        assert IntcodeComputer([1, 1, 1, 4, 99, 5, 6, 0, 99], use_jit=use_jit).parse_and_get_value_at_index(0) == 30
+        assert IntcodeComputer([1002, 4, 3, 4, 33], use_jit=use_jit).parse_and_get_value_at_index(4) == 99
+        assert IntcodeComputer([1101, 100, -1, 4, 0], use_jit=use_jit).parse_and_get_value_at_index(4) == 99
+
+        # "stdout" test cases
+        test_program = [3, 9, 8, 9, 10, 9, 4, 9, 99, -1, 8]
+        assert IntcodeComputer(test_program, input_values=[8], use_jit=use_jit).parse_and_get_next_value() == 1
+        assert IntcodeComputer(test_program, input_values=[7], use_jit=use_jit).parse_and_get_next_value() == 0
+
+        test_program = [3, 3, 1108, -1, 8, 3, 4, 3, 99]
+        assert IntcodeComputer(test_program, input_values=[8], use_jit=use_jit).parse_and_get_next_value() == 1
+        assert IntcodeComputer(test_program, input_values=[7], use_jit=use_jit).parse_and_get_next_value() == 0
+
+        test_program = [3, 12, 6, 12, 15, 1, 13, 14, 13, 4, 13, 99, -1, 0, 1, 9]
+        assert IntcodeComputer(test_program, input_values=[0], use_jit=use_jit).parse_and_get_next_value() == 0
+        assert IntcodeComputer(test_program, input_values=[8], use_jit=use_jit).parse_and_get_next_value() == 1
+
+        test_program = [3, 3, 1105, -1, 9, 1101, 0, 0, 12, 4, 12, 99, 1]
+        assert IntcodeComputer(test_program, input_values=[0], use_jit=use_jit).parse_and_get_next_value() == 0
+        assert IntcodeComputer(test_program, input_values=[8], use_jit=use_jit).parse_and_get_next_value() == 1
+
+        test_program = [1102, 34915192, 34915192, 7, 4, 7, 99, 0]
+        assert len(str(IntcodeComputer(test_program, use_jit=use_jit).parse_and_get_next_value())) == 16
+        assert IntcodeComputer([104, 1125899906842624, 99], use_jit=use_jit).parse_and_get_next_value() == 1125899906842624
+
+
+def random_program(rng, length=40):
+    """random instructions (no input) with parameters that mostly point back into the program, ending in a halt"""
+
+    parameter_counts = {1: 3, 2: 3, 4: 1, 5: 2, 6: 2, 7: 3, 8: 3, 9: 1}
+    program = []
+    while len(program) < length:
+        opcode = rng.choice(list(parameter_counts))
+        modes = [rng.randrange(3) for _ in range(parameter_counts[opcode])]
+        if opcode in (1, 2, 7, 8):
+            modes[2] = rng.choice([0, 2])
+
+        program.append(opcode + sum(mode * 10 ** (2 + position) for position, mode in enumerate(modes)))
+        program += [rng.randrange(length + 10) for _ in modes]
+
+    return program + [99]
+
+
+def test_jit_matches_interpreter():
+    # writes into a block over a cell that an earlier block had already patched
+    program = [2001, 3, 1, 43, 2101, 0, 21, 1, 22001, 18, 33, 14, 1007, 41, 21, 7, 201, 13, 19, 3, 2101, 6, 47, 22, 201]
+    program += [42, 3, 47, 8, 42, 27, 43, 21201, 29, 42, 21, 107, 28, 8, 7, 99]
+    programs = [program]
+
+    # plus plenty of random ones, which rewrite themselves all over the place
+    rng = random.Random(0)
+    programs += [random_program(rng) for _ in range(3000)]
+
+    for program in programs:
+        interpreted = IntcodeComputer(program)
+        try:
+            outputs = interpreted._run(max_steps=2000)
+        except (ValueError, IndexError):
+            continue
+        if interpreted.alive:
+            continue
 
-    PROGRAM = IntcodeComputer.init_from_file("data/05.txt")
-    print(PROGRAM.parse_and_get_last_value())
+        compiled = IntcodeComputer(program, use_jit=True)
+        assert compiled._run() == outputs
+        assert not compiled.alive
+        assert list(compiled.program) == list(interpreted.program)
+        assert compiled.pages == interpreted.pages
+
+
+def test_memory():
+    # store the input a billion cells out, then read it back
+    computer = IntcodeComputer([3, 1000000000, 4, 1000000000, 99], input_values=[42])
+    assert computer.run_until_input_needed() == [42]
+    assert len(computer.pages) == 1
+
+    # 2**40 squared doesn't fit in 64 bits
+    assert IntcodeComputer([1102, 2 ** 40, 2 ** 40, 7, 4, 7, 99, 0]).parse_and_get_next_value() == 2 ** 80
+
+
+def test_instrument():
+    # count down from the input to 0, then halt
+    computer = IntcodeComputer([3, 10, 1001, 10, -1, 10, 1005, 10, 2, 99, 0], input_values=[3], instrument=True)
+    computer.run()
+
+    assert computer.stats.opcode_counts == {3: 1, 1: 3, 5: 3, 99: 1}
+    assert computer.stats.branches[6] == [2, 1]
+    assert "jnz  [10], 2" in computer.instruction_report()
+
+
+def test_time_slices():
+    looping = IntcodeComputer([1105, 1, 0])
+    assert looping.run_slice(max_steps=100) == RunStatus.BUDGET_EXHAUSTED
+    assert looping.steps == 100
+
+    computer = IntcodeComputer([3, 5, 4, 5, 99, 0])
+    assert computer.run_slice(max_steps=100) == RunStatus.NEED_INPUT
+    computer.pass_in(7)
+    assert computer.run_slice() == RunStatus.OUTPUT
+    assert computer.output_values.popleft() == 7
+    assert computer.run_slice() == RunStatus.HALTED
+    assert computer.steps == 3
+
+    # run() still runs to the end
+    computer = IntcodeComputer([3, 9, 4, 9, 4, 9, 99, 0, 0, 0], input_values=[7])
+    computer.run()
+    assert not computer.alive
+
+
+def test_fork():
+    # count up from the input, printing each value, forever
+    computer = IntcodeComputer([3, 11, 4, 11, 1001, 11, 1, 11, 1105, 1, 2, 0], input_values=[5])
+    assert computer.run_until(2) == [5, 6]
+
+    forked = computer.fork()
+    assert forked.run_until(3) == [7, 8, 9]
+    assert computer.run_until(1) == [7]
+
+    snapshot = computer.snapshot()
+    assert computer.run_until(2) == [8, 9]
+    computer.restore(snapshot)
+    assert computer.run_until(2) == [8, 9]
+    assert snapshot.run_until(1) == [8]
+
+    # steps, pending outputs and the trace go back to where they were as well
+    computer = IntcodeComputer([3, 11, 4, 11, 1001, 11, 1, 11, 1105, 1, 2, 0], input_values=[5], record_trace=True)
+    assert computer.run_slice() == RunStatus.OUTPUT
+    snapshot = computer.snapshot()
+    assert computer.run_until(3) == [6, 7, 8]
+
+    computer.restore(snapshot)
+    assert computer.steps == 2
+    assert list(computer.output_values) == [5]
+    assert computer.run_slice(max_steps=2) == RunStatus.BUDGET_EXHAUSTED
+    assert computer.run_slice() == RunStatus.OUTPUT
+    assert list(computer.output_values) == [5, 6]
+    assert computer.steps == 5
+    assert [computer.trace.event(index) for index in range(len(computer.trace))] == [(OUTPUT, 5, 6)]
+
+
+def test_fuse():
+    # count down from the input to 0 with a compare and branch, printing the count
+    program = [3, 20, 4, 20, 1001, 20, -1, 20, 1007, 20, 1, 21, 1006, 21, 2, 99, 0, 0, 0, 0, 0, 0]
+    assert IntcodeComputer(program, input_values=[4], fuse=True).run_until_input_needed() == [4, 3, 2, 1]
+    assert "compare and branch" in IntcodeComputer(program).analysis_report()
+
+    # the compare turns the jump it's fused with into an add, which then changes what gets output
+    program = [1108, 5, 5, 4, 6, 4, 9, 9, 104, 7, 99]
+    assert IntcodeComputer(program).run_until_input_needed() == [8]
+    assert IntcodeComputer(program, fuse=True).run_until_input_needed() == [8]
@@ -7,6 +7,8 @@ from collections import defaultdict
 
 import attr
 
+from advent import read_input
+
 
 @attr.s(slots=True)
 class OrbitMap:
@@ -84,12 +86,23 @@ class OrbitMap:
             return cls.init_from_str(orbits_io.read())
 
 
-assert OrbitMap.init_from_str("COM)B\nB)C\nC)D\nD)E\nE)F\nB)G\nG)H\nD)I\nE)J\nJ)K\nK)L").count_orbits() == 42
-assert (
-    OrbitMap.init_from_str("COM)B\nB)C\nC)D\nD)E\nE)F\nB)G\nG)H\nD)I\nE)J\nJ)K\nK)L\nK)YOU\nI)SAN").get_distance_to_santa()
-    == 4
-)
+def part1(orbit_str):
+    return OrbitMap.init_from_str(orbit_str).count_orbits()
+
+
+def part2(orbit_str):
+    return OrbitMap.init_from_str(orbit_str).get_distance_to_santa()
+
+
+def test_examples():
+    assert OrbitMap.init_from_str("COM)B\nB)C\nC)D\nD)E\nE)F\nB)G\nG)H\nD)I\nE)J\nJ)K\nK)L").count_orbits() == 42
+    assert (
+        OrbitMap.init_from_str(
+            "COM)B\nB)C\nC)D\nD)E\nE)F\nB)G\nG)H\nD)I\nE)J\nJ)K\nK)L\nK)YOU\nI)SAN"
+        ).get_distance_to_santa()
+        == 4
+    )
+
 
-orbit_map = OrbitMap.init_from_file("data/06.txt")
-assert orbit_map.count_orbits() == 261306
-print(orbit_map.get_distance_to_santa())
+def test_answers():
+    assert part1(read_input(2019, 6)) == 261306
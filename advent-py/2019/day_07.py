@@ -3,47 +3,111 @@ day 7: amplification circuit
 https://adventofcode.com/2019/day/7
 """
 
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from itertools import permutations
+import math
 import attr
 
-from day_05 import IntcodeComputer, test_intcode_computer
+from .day_05 import IntcodeImage, IntcodePool
+from .intcode_network import IntcodeNetwork
+
+# below this many orderings, starting up a process pool costs more than it saves
+PARALLEL_MIN_PERMUTATIONS = 5000
 
 
 @attr.s(slots=True)
 class AmpSequence:
-    amps = attr.ib(factory=list)
+    # one amp per phase setting, all running the same program
+    pool = attr.ib()
 
-    def _reset(self):
-        for amp in self.amps:
-            amp.reset()
+    @classmethod
+    def init_from_str(cls, program_str):
+        return AmpSequence(IntcodePool(IntcodeImage.init_from_str(program_str)))
 
     @classmethod
     def init_from_file(cls, filename):
-        return AmpSequence(amps=[IntcodeComputer.init_from_file(filename, replace_stdout=True) for _ in range(5)])
+        return AmpSequence(IntcodePool(IntcodeImage.init_from_file(filename)))
 
     @classmethod
     def init_from_list(cls, l):
-        return AmpSequence(amps=[IntcodeComputer(list(l), replace_stdout=True) for _ in range(5)])
+        return AmpSequence(IntcodePool(IntcodeImage.init_from_list(l)))
+
+    def max_amplification(self, phase_options, stages=None, max_workers=None):
+        """best signal over every ordering of `stages` distinct phases (by default, all of them) from phase_options"""
+
+        phase_options = list(phase_options)
+        stages = stages or len(phase_options)
+        if math.perm(len(phase_options), stages) >= PARALLEL_MIN_PERMUTATIONS:
+            return self.max_amplification_parallel(phase_options, stages, max_workers)
+
+        return asyncio.run(self.max_amplification_over(permutations(phase_options, stages)))
+
+    def max_amplification_parallel(self, phase_options, stages=None, max_workers=None):
+        """max_amplification across a process pool, where each worker gets the orderings starting with a given pair"""
+
+        phase_options = list(phase_options)
+        stages = stages or len(phase_options)
+
+        # a fresh image, so none of what's been decoded here gets pickled
+        image = IntcodeImage(self.pool.image.words, self.pool.image.length)
+        prefixes = [list(prefix) for prefix in permutations(phase_options, min(2, stages))]
+        search = partial(_max_amplification_from, phase_options=phase_options, stages=stages)
+
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker, initargs=(image,)) as executor:
+            return max(executor.map(search, prefixes))
+
+    async def max_amplification_over(self, orderings):
+        """best signal over the given phase orderings, all on one event loop"""
+
+        return max([await self.get_amplification_async(phases) for phases in orderings])
 
     def get_amplification(self, phases):
-        for index in range(len(self.amps)):
-            self.amps[index].replace_stdin = [phases[index]]
+        return asyncio.run(self.get_amplification_async(phases))
+
+    async def get_amplification_async(self, phases):
+        amps = [self.pool.acquire() for _ in phases]
+
+        # phases from 0 are a single pass down the chain; anything else loops the last amp back into the first
+        network = IntcodeNetwork.init_from_chain(amps, closed=0 not in phases)
+        for index, phase in enumerate(phases):
+            network.send(index, phase)
+        network.send(0, 0)
+
+        await network.run_async()
+        outputs = network.outputs[len(amps) - 1]
 
-        last_value = None
-        val = 0
-        while all([amp.alive for amp in self.amps]):
-            for amp in self.amps:
-                amp.replace_stdin.append(val)
-                val = amp.parse_and_get_next_value()
+        for amp in amps:
+            self.pool.release(amp)
 
-            if val is not None:
-                last_value = val
+        if outputs:
+            return outputs[-1]
 
-            if 0 in phases:
-                break
+        return None
 
-        self._reset()
-        return last_value
+
+# each worker process parses nothing, and keeps its own amps between tasks
+_worker_amps = None
+
+
+def _init_worker(image):
+    global _worker_amps  # pylint: disable=global-statement
+    _worker_amps = AmpSequence(IntcodePool(image))
+
+
+def _max_amplification_from(prefix, phase_options, stages):
+    rest = [phase for phase in phase_options if phase not in prefix]
+    orderings = [prefix + list(tail) for tail in permutations(rest, stages - len(prefix))]
+    return asyncio.run(_worker_amps.max_amplification_over(orderings))
+
+
+def part1(program_str):
+    return AmpSequence.init_from_str(program_str).max_amplification(range(5))
+
+
+def part2(program_str):
+    return AmpSequence.init_from_str(program_str).max_amplification(range(5, 10))
 
 
 def test_amplifiers():
@@ -203,19 +267,7 @@ def test_amplifiers():
         == 139629729
     )
 
-
-if __name__ == "__main__":
-    test_intcode_computer()
-    test_amplifiers()
-
-    AMPS = AmpSequence.init_from_file("data/07.txt")
-
-    MAX_AMPLIFICATION = -1
-    for phase_settings in permutations(range(5)):
-        MAX_AMPLIFICATION = max(MAX_AMPLIFICATION, AMPS.get_amplification(phase_settings))
-    print(MAX_AMPLIFICATION)
-
-    MAX_AMPLIFICATION_WITH_FEEDBACK = -1
-    for phase_settings in permutations(range(5, 10)):
-        MAX_AMPLIFICATION_WITH_FEEDBACK = max(MAX_AMPLIFICATION_WITH_FEEDBACK, AMPS.get_amplification(phase_settings))
-    print(MAX_AMPLIFICATION_WITH_FEEDBACK)
+    # the same search spread over processes, and with longer chains
+    amps = AmpSequence.init_from_list([3, 15, 3, 16, 1002, 16, 10, 16, 1, 16, 15, 15, 4, 15, 99, 0, 0])
+    assert amps.max_amplification(range(5)) == amps.max_amplification_parallel(range(5), max_workers=2) == 43210
+    assert amps.max_amplification(range(7)) == 6543210
@@ -3,7 +3,9 @@ day 8: space image format
 https://adventofcode.com/2019/day/8
 """
 
-import numpy as np
+from advent.imports import lazy_import
+
+np = lazy_import("numpy")
 
 
 def parse_image(img, width, height):
@@ -16,6 +18,10 @@ def parse_image_from_file(filename, width, height):
             return parse_image(line.strip(), width, height)
 
 
+def image_to_str(img):
+    return "\n".join(["".join(["#" if pix == 1 else " " for pix in row]) for row in img])
+
+
 def count_vals_in_layer(layer, val):
     return sum([1 if x == val else 0 for x in np.reshape(layer.view(), -1)])
 
@@ -47,8 +53,13 @@ def decode_image(img):
     return decoded
 
 
-assert np.array_equal(decode_image(parse_image("0222112222120000", 2, 2)), [[0, 1], [1, 0]])
+def part1(image_str):
+    return test_for_corruption(parse_image(image_str.strip(), 25, 6))
+
+
+def part2(image_str):
+    return image_to_str(decode_image(parse_image(image_str.strip(), 25, 6)))
+
 
-IMAGE = parse_image_from_file("data/08.txt", 25, 6)
-print(test_for_corruption(IMAGE))
-print(decode_image(IMAGE))
+def test_examples():
+    assert np.array_equal(decode_image(parse_image("0222112222120000", 2, 2)), [[0, 1], [1, 0]])
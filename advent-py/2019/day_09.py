@@ -3,13 +3,21 @@ day 9: sensor boost
 https://adventofcode.com/2019/day/9
 """
 
-from day_05 import IntcodeComputer, test_intcode_computer
+from advent import read_input
 
-test_intcode_computer()
+from .day_05 import IntcodeComputer
+
+
+def part1(program_str):
+    return IntcodeComputer.init_from_str(program_str, input_values=[1], use_jit=True).parse_and_get_last_value()
 
-# actual program -- convert into test cases for validation
-BOOST = IntcodeComputer.init_from_file("data/09.txt", replace_stdin=[1])
-assert BOOST.parse_and_get_last_value() == 3013554615
 
-BOOST = IntcodeComputer.init_from_file("data/09.txt", replace_stdin=[2])
-assert BOOST.parse_and_get_last_value() == 50158
+def part2(program_str):
+    return IntcodeComputer.init_from_str(program_str, input_values=[2], use_jit=True).parse_and_get_last_value()
+
+
+# actual program -- convert into test cases for validation
+def test_answers():
+    program_str = read_input(2019, 9)
+    assert part1(program_str) == 3013554615
+    assert part2(program_str) == 50158
@@ -8,6 +8,8 @@ import math
 
 from enum import Enum
 
+from advent.cache import cached_parse
+
 
 def can_divide(x):
     if x == 0:
@@ -174,6 +176,7 @@ class AsteroidField:
             num_asteroids_currently_visible = len(visible_asteroids)
 
     @classmethod
+    @cached_parse
     def init_from_str(cls, asteroid_map_str):
         asteroid_map = []
         for line in asteroid_map_str.split("\n"):
@@ -219,7 +222,14 @@ class AsteroidField:
         assert cls.init_from_str(asteroid_map).vaporize(nth_to_be_vaporized=299) == (11, 1,)
 
 
-AsteroidField.unit_test()
-FIELD = AsteroidField.init_from_file("data/10.txt")
-print(FIELD.best_station_location())
-print(FIELD.vaporize(nth_to_be_vaporized=200))
+def part1(asteroid_map_str):
+    return AsteroidField.init_from_str(asteroid_map_str).best_station_location()[2]
+
+
+def part2(asteroid_map_str):
+    asteroid_x, asteroid_y = AsteroidField.init_from_str(asteroid_map_str).vaporize(nth_to_be_vaporized=200)
+    return asteroid_x * 100 + asteroid_y
+
+
+def test_examples():
+    AsteroidField.unit_test()
@@ -2,11 +2,16 @@
 day 11: space police
 """
 
+import os
+import tempfile
 from enum import Enum
+
 import attr
-import math
 
-from day_05 import IntcodeComputer, test_intcode_computer
+from advent import read_input
+
+from .day_05 import IntcodeComputer
+from .intcode_trace import ReplayComputer, Trace
 
 
 class Color(Enum):
@@ -19,11 +24,19 @@ class Color(Enum):
         return " "
 
 
+# color value -> character, for rendering a whole row at once
+COLOR_CHARS = bytes.maketrans(bytes([color.value for color in Color]), "".join(color.to_str() for color in Color).encode())
+
+# (dx, dy) facing up, right, down, left, so turning right is one step along
+DIRECTIONS = [(0, -1), (1, 0), (0, 1), (-1, 0)]
+
+
 @attr.s(slots=True)
 class Location:
     # grid indexed from top left
     loc_x = attr.ib()
     loc_y = attr.ib()
+    # index into DIRECTIONS
     orientation = attr.ib(default=0)
 
     def get(self):
@@ -32,70 +45,162 @@ class Location:
     def turn(self, direction):
         if direction:
             # turn right
-            self.orientation += 90
+            self.orientation = (self.orientation + 1) % 4
         else:
             # turn left
-            self.orientation -= 90
+            self.orientation = (self.orientation - 1) % 4
 
     def step(self):
-        angle = math.radians(self.orientation)
+        d_x, d_y = DIRECTIONS[self.orientation]
 
-        self.loc_x += round(math.sin(angle))
-        self.loc_y -= round(math.cos(angle))
+        self.loc_x += d_x
+        self.loc_y += d_y
+
+
+@attr.s(slots=True)
+class Canvas:
+    """
+    panel colors in a flat bytearray, which at least doubles whenever something is painted off the edge, along with
+    the bounding box of everything painted so far
+    """
+
+    width = attr.ib(default=16)
+    height = attr.ib(default=16)
+
+    # where (0, 0) is in the array
+    origin_x = attr.ib(init=False)
+    origin_y = attr.ib(init=False)
+    cells = attr.ib(init=False)
+    painted = attr.ib(init=False)
+    n_painted = attr.ib(init=False, default=0)
+    # bounding box of the painted panels, inclusive
+    min_x = attr.ib(init=False, default=None)
+    max_x = attr.ib(init=False, default=None)
+    min_y = attr.ib(init=False, default=None)
+    max_y = attr.ib(init=False, default=None)
+
+    def __attrs_post_init__(self):
+        self.origin_x = self.width // 2
+        self.origin_y = self.height // 2
+        self.cells = bytearray(self.width * self.height)
+        self.painted = bytearray(self.width * self.height)
+
+    def _offset(self, x, y):
+        """position of (x, y) in the array, or None if it's off the edge"""
+
+        column, row = x + self.origin_x, y + self.origin_y
+        if 0 <= column < self.width and 0 <= row < self.height:
+            return row * self.width + column
+
+        return None
+
+    def _grow(self, x, y):
+        left, top = -self.origin_x, -self.origin_y
+        right, bottom = left + self.width, top + self.height
+        if x < left:
+            left = min(x, left - self.width)
+        elif x >= right:
+            right = max(x + 1, right + self.width)
+        if y < top:
+            top = min(y, top - self.height)
+        elif y >= bottom:
+            bottom = max(y + 1, bottom + self.height)
+
+        width, height = right - left, bottom - top
+        cells, painted = bytearray(width * height), bytearray(width * height)
+        for row in range(self.height):
+            old = row * self.width
+            new = (row - self.origin_y - top) * width - self.origin_x - left
+            cells[new : new + self.width] = self.cells[old : old + self.width]
+            painted[new : new + self.width] = self.painted[old : old + self.width]
+
+        self.width, self.height = width, height
+        self.origin_x, self.origin_y = -left, -top
+        self.cells, self.painted = cells, painted
+
+    def get(self, x, y):
+        offset = self._offset(x, y)
+        if offset is None:
+            return Color.BLACK.value
+
+        return self.cells[offset]
+
+    def paint(self, x, y, value):
+        offset = self._offset(x, y)
+        if offset is None:
+            self._grow(x, y)
+            offset = self._offset(x, y)
+
+        self.cells[offset] = value
+        if self.painted[offset]:
+            return
+
+        self.painted[offset] = 1
+        self.n_painted += 1
+        if self.min_x is None:
+            self.min_x = self.max_x = x
+            self.min_y = self.max_y = y
+        else:
+            self.min_x, self.max_x = min(self.min_x, x), max(self.max_x, x)
+            self.min_y, self.max_y = min(self.min_y, y), max(self.max_y, y)
+
+    def to_str(self):
+        if self.min_x is None:
+            return ""
+
+        start, end = self.min_x + self.origin_x, self.max_x + self.origin_x + 1
+        rows = (
+            self.cells[row * self.width + start : row * self.width + end]
+            for row in range(self.min_y + self.origin_y, self.max_y + self.origin_y + 1)
+        )
+        return b"\n".join(rows).translate(COLOR_CHARS).decode()
 
 
 @attr.s(slots=True)
 class PainterRobot:
     intcode_computer = attr.ib()
     robot_location = attr.ib(init=False)
-    area_to_paint = attr.ib(init=False)
+    canvas = attr.ib(init=False)
 
     def __attrs_post_init__(self):
         self.robot_location = Location(0, 0)
-        self.area_to_paint = dict()
+        self.canvas = Canvas()
+
+    def area_to_str(self):
+        return self.canvas.to_str()
 
     def print_area(self):
-        min_x = min([point[0] for point in self.area_to_paint.keys()])
-        max_x = max([point[0] for point in self.area_to_paint.keys()])
-        min_y = min([point[1] for point in self.area_to_paint.keys()])
-        max_y = max([point[1] for point in self.area_to_paint.keys()])
-
-        for y in range(min_y, max_y + 1):
-            for x in range(min_x, max_x + 1):
-                if (x, y) in self.area_to_paint:
-                    print(self.area_to_paint[(x, y)].to_str(), end="")
-                else:
-                    print(Color.BLACK.to_str(), end="")
-            print()
+        print(self.area_to_str())
 
     def get_color(self):
-        location = self.robot_location.get()
-        if location in self.area_to_paint:
-            return self.area_to_paint[location]
-
-        return Color.BLACK
+        return Color(self.canvas.get(self.robot_location.loc_x, self.robot_location.loc_y))
 
     def paint(self, color):
-        self.area_to_paint[self.robot_location.get()] = color
+        self.canvas.paint(self.robot_location.loc_x, self.robot_location.loc_y, color.value)
 
     def run(self):
-        panels_painted = set()
+        """paint until the program stops, returning how many panels got painted that hadn't been before"""
 
-        while self.intcode_computer.is_alive():
-            self.intcode_computer.pass_in(self.get_color().value)
-            new_color = self.intcode_computer.parse_and_get_next_value()
-            turn_dir = self.intcode_computer.parse_and_get_next_value()
+        painted_before = self.canvas.n_painted
+        location, canvas = self.robot_location, self.canvas
 
-            if new_color is None or turn_dir is None:
+        while self.intcode_computer.is_alive():
+            self.intcode_computer.pass_in(canvas.get(location.loc_x, location.loc_y))
+            outputs = self.intcode_computer.run_until(2)
+            if len(outputs) < 2:
                 break
 
-            self.paint(Color(new_color))
-            panels_painted.add(self.robot_location.get())
+            new_color, turn_dir = outputs
 
-            self.robot_location.turn(turn_dir)
-            self.robot_location.step()
+            canvas.paint(location.loc_x, location.loc_y, Color(new_color).value)
+            location.turn(turn_dir)
+            location.step()
 
-        return len(panels_painted)
+        return canvas.n_painted - painted_before
+
+    @classmethod
+    def init_from_str(cls, program_str):
+        return PainterRobot(IntcodeComputer.init_from_str(program_str))
 
     @classmethod
     def init_from_file(cls, program_file):
@@ -113,19 +218,55 @@ class MockIntcodeComputer:
     def is_alive(self):
         return len(self.program)
 
-    def parse_and_get_next_value(self):
-        return self.program.pop(0)
+    def run_until(self, n_outputs):
+        outputs = self.program[:n_outputs]
+        del self.program[:n_outputs]
+        return outputs
 
     def pass_in(self, value):
         pass
 
 
-MOCKED_ROBOT = PainterRobot.init_from_mock([1, 0, 0, 0, 1, 0, 1, 0, 0, 1, 1, 0, 1, 0])
-assert MOCKED_ROBOT.run() == 6
+def part1(program_str):
+    return PainterRobot.init_from_str(program_str).run()
+
+
+def part2(program_str):
+    robot = PainterRobot.init_from_str(program_str)
+
+    # set up starting white panel
+    robot.paint(Color.WHITE)
+    robot.run()
+    return robot.area_to_str()
+
+
+def test_examples():
+    mocked_robot = PainterRobot.init_from_mock([1, 0, 0, 0, 1, 0, 1, 0, 0, 1, 1, 0, 1, 0])
+    assert mocked_robot.run() == 6
+    assert mocked_robot.area_to_str() == "  +\n  +\n++ "
+
+
+def test_canvas():
+    # painting well past the starting size grows the canvas without losing anything
+    canvas = Canvas(4, 4)
+    canvas.paint(0, 0, Color.WHITE.value)
+    canvas.paint(-9, 5, Color.WHITE.value)
+    canvas.paint(3, -20, Color.BLACK.value)
+    canvas.paint(0, 0, Color.WHITE.value)
+
+    assert canvas.n_painted == 3
+    assert (canvas.min_x, canvas.max_x, canvas.min_y, canvas.max_y) == (-9, 3, -20, 5)
+    assert canvas.get(0, 0) == canvas.get(-9, 5) == Color.WHITE.value
+    assert canvas.get(100, 100) == canvas.get(3, -20) == Color.BLACK.value
+    assert canvas.to_str().split("\n")[20] == " " * 9 + "+   "
+
 
-ROBOT = PainterRobot.init_from_file("data/11.txt")
+def test_replay():
+    computer = IntcodeComputer.init_from_str(read_input(2019, 11), record_trace=True)
+    panels = PainterRobot(computer).run()
 
-# set up starting white panel
-ROBOT.paint(Color.WHITE)
-ROBOT.run()
-ROBOT.print_area()
+    # a saved trace replays the same run, robot and all, without the program
+    with tempfile.TemporaryDirectory() as directory:
+        trace_file = os.path.join(directory, "2019_11.trace")
+        computer.trace.save(trace_file)
+        assert PainterRobot(ReplayComputer(Trace.load(trace_file))).run() == panels == 2226
@@ -121,14 +121,8 @@ class System:
                     cycle_period_by_axis[axis] = possible_cycle
 
             if all([x is not None for x in cycle_period_by_axis]):
-                print(cycle_period_by_axis)
                 return lcm(cycle_period_by_axis)
 
-            if self.num_steps % 1000 == 0:
-                print(f"Still running, on step {self.num_steps}. Current cycles are {cycle_period_by_axis}")
-
-        return None
-
     def show(self):
         print(f"After {self.num_steps} steps:")
         for moon in self.moons:
@@ -167,6 +161,14 @@ class System:
         return system.step_and_check_for_cycles()
 
 
+def part1(moon_str):
+    return System.init_str_and_get_energy(moon_str, 1000)
+
+
+def part2(moon_str):
+    return System.init_str_and_determine_cycles(moon_str)
+
+
 system1_txt = """
 <x=-1, y=0, z=2>
 <x=2, y=-10, z=-7>
@@ -174,10 +176,6 @@ system1_txt = """
 <x=3, y=5, z=-1>
 """
 
-assert 179 == System.init_str_and_get_energy(system1_txt, 10)
-assert 2772 == System.init_str_and_determine_cycles(system1_txt)
-
-
 system2_txt = """
 <x=-8, y=-10, z=0>
 <x=5, y=5, z=10>
@@ -185,12 +183,10 @@ system2_txt = """
 <x=9, y=-8, z=-3>
 """
 
-assert 1940 == System.init_str_and_get_energy(system2_txt, 100)
-assert 4686774924 == System.init_str_and_determine_cycles(system2_txt)
 
-SYSTEM = System.init_from_file("data/12.txt")
-SYSTEM.step(1000)
-print(SYSTEM.total_energy())
+def test_examples():
+    assert 179 == System.init_str_and_get_energy(system1_txt, 10)
+    assert 2772 == System.init_str_and_determine_cycles(system1_txt)
 
-SYSTEM = System.init_from_file("data/12.txt")
-print(SYSTEM.step_and_check_for_cycles())
+    assert 1940 == System.init_str_and_get_energy(system2_txt, 100)
+    assert 4686774924 == System.init_str_and_determine_cycles(system2_txt)
@@ -2,11 +2,16 @@
 day 13: care package
 """
 
-import attr
+import sys
+import time
 
-from collections import defaultdict
 from enum import Enum
-from day_05 import IntcodeComputer, test_intcode_computer
+
+import attr
+
+from advent import read_input
+
+from .day_05 import IntcodeComputer
 
 
 class Tile(Enum):
@@ -17,82 +22,131 @@ class Tile(Enum):
     BALL = 4
 
     def __str__(self):
-        views = [" ", "+", "#", "-", "o"]
-        return views[self.value]
+        return TILE_VIEWS[self.value]
+
+
+TILE_VIEWS = (" ", "+", "#", "-", "o")
 
 
 @attr.s
 class ArcadeCabinet:
     intcode_computer = attr.ib()
     autoplay = attr.ib(default=False)
+    # draw nothing at all
+    headless = attr.ib(default=False)
+    # draw at most this many frames a second, or (if None) whenever the score changes
+    max_fps = attr.ib(default=None)
 
-    screen = attr.ib(init=False)
+    screen = attr.ib(init=False, factory=dict)
     score = attr.ib(init=False, default=0)
 
-    def __attrs_post_init__(self):
-        self.screen = defaultdict(lambda x: Tile.EMPTY)
+    # kept up to date as tiles are drawn, rather than searched for
+    paddle_x = attr.ib(init=False, default=None)
+    ball_x = attr.ib(init=False, default=None)
+    block_count = attr.ib(init=False, default=0)
+    width = attr.ib(init=False, default=0)
+    height = attr.ib(init=False, default=0)
+
+    last_render = attr.ib(init=False, default=None)
+
+    def screen_to_str(self):
+        rows = [f"\n ~ ~ SCORE: {self.score} ~ ~\n"]
+        for y in range(self.height):
+            rows.append("".join([TILE_VIEWS[self.screen.get((x, y), Tile.EMPTY).value] for x in range(self.width)]))
+
+        return "\n".join(rows) + "\n"
 
     def display(self):
-        print(f"\n ~ ~ SCORE: {self.score} ~ ~\n")
+        sys.stdout.write(self.screen_to_str())
+
+    def render(self, score_changed, force=False):
+        if self.headless:
+            return
 
-        max_x = max([x[0] for x in self.screen.keys()]) + 1
-        max_y = max([x[1] for x in self.screen.keys()]) + 1
+        now = time.perf_counter()
+        if not force:
+            if self.max_fps is None and not score_changed:
+                return
+            if self.max_fps is not None and self.last_render is not None and now - self.last_render < 1 / self.max_fps:
+                return
 
-        for y in range(max_y):
-            for x in range(max_x):
-                print(str(self.screen.get((x, y), Tile.EMPTY)), end="")
-            print()
+        self.last_render = now
+        self.display()
 
     def play_for_free(self):
         self.intcode_computer._set_value(0, 2)
 
-    def _find_x(self, tile_value):
-        for loc, tile in self.screen.items():
-            if tile == tile_value:
-                return loc[0]
+    def draw(self, x, y, tile):
+        if self.screen.get((x, y)) == Tile.BLOCK:
+            self.block_count -= 1
 
-        return None
+        self.screen[(x, y)] = tile
+        self.width = max(self.width, x + 1)
+        self.height = max(self.height, y + 1)
+
+        if tile == Tile.BLOCK:
+            self.block_count += 1
+        elif tile == Tile.PADDLE:
+            self.paddle_x = x
+        elif tile == Tile.BALL:
+            self.ball_x = x
 
     def auto_move_paddle(self):
-        paddle_x = self._find_x(Tile.PADDLE)
-        ball_x = self._find_x(Tile.BALL)
-
-        if ball_x is not None and paddle_x is not None:
-            if ball_x < paddle_x:
-                self.intcode_computer.input_values = [-1]
-            elif ball_x > paddle_x:
-                self.intcode_computer.input_values = [1]
+        if self.ball_x is not None and self.paddle_x is not None:
+            if self.ball_x < self.paddle_x:
+                self.intcode_computer.pass_in(-1)
+            elif self.ball_x > self.paddle_x:
+                self.intcode_computer.pass_in(1)
             else:
-                self.intcode_computer.input_values = [0]
+                self.intcode_computer.pass_in(0)
 
     def run(self):
         while self.intcode_computer.is_alive():
-            x = self.intcode_computer.parse_and_get_next_value()
-            y = self.intcode_computer.parse_and_get_next_value()
-            tile_type = self.intcode_computer.parse_and_get_next_value()
+            # everything drawn up to the next joystick read comes back in one batch of (x, y, tile) triples
+            outputs = self.intcode_computer.run_until_input_needed()
+            score_changed = False
+            for index in range(0, len(outputs) - 2, 3):
+                x, y, tile_type = outputs[index : index + 3]
+
+                if (x, y) == (-1, 0):
+                    self.score = tile_type
+                    score_changed = True
+                else:
+                    self.draw(x, y, Tile(tile_type))
+
+            # always show how the game ended
+            self.render(score_changed, force=not self.intcode_computer.is_alive())
+
+            if not self.intcode_computer.is_alive():
+                break
 
-            if any([tmp is None for tmp in [x, y, tile_type]]):
+            self.auto_move_paddle()
+            if not self.intcode_computer.input_values:
+                # nothing to steer towards yet
                 break
 
-            if (x, y) == (-1, 0):
-                self.score = tile_type
-                self.display()
-                continue
+    @classmethod
+    def init_from_str(cls, program_str, **kwargs):
+        return ArcadeCabinet(IntcodeComputer.init_from_str(program_str, use_jit=True), **kwargs)
+
+    @classmethod
+    def init_from_file(cls, program_file, **kwargs):
+        return ArcadeCabinet(IntcodeComputer.init_from_file(program_file, use_jit=True), **kwargs)
 
-            new_tile = Tile(tile_type)
-            self.screen[(x, y)] = Tile(tile_type)
 
-            if new_tile == Tile.PADDLE or new_tile == Tile.BALL:
-                self.auto_move_paddle()
+def part1(program_str):
+    pong = ArcadeCabinet.init_from_str(program_str, headless=True)
+    pong.run()
+    return pong.block_count
 
-    @classmethod
-    def init_from_file(cls, program_file):
-        return ArcadeCabinet(IntcodeComputer.init_from_file(program_file))
 
+def part2(program_str):
+    pong = ArcadeCabinet.init_from_str(program_str, headless=True)
+    pong.play_for_free()
+    pong.run()
+    return pong.score
 
-PONG = ArcadeCabinet.init_from_file("data/13.txt")
-PONG.play_for_free()
-PONG.run()
 
-# assert 193 == sum([1 if tile == Tile.BLOCK else 0 for tile in PONG.screen.values()])
-# PONG.display()
+def test_answers():
+    assert part1(read_input(2019, 13)) == 193
+    assert part2(read_input(2019, 13)) == 10547
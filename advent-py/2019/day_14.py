@@ -8,6 +8,8 @@ from collections import defaultdict
 from enum import Enum
 from math import ceil, floor
 
+from advent import read_data_file
+
 
 @attr.s
 class Reaction:
@@ -126,6 +128,10 @@ class Nanofactory:
 
         return cls(reactions)
 
+    @classmethod
+    def init_from_str(cls, reactions_str):
+        return cls.init_from_list(reactions_str.split("\n"))
+
     @classmethod
     def init_from_file(cls, filename):
         with open(filename) as f:
@@ -133,16 +139,25 @@ class Nanofactory:
             return cls.init_from_list(f.readlines())
 
 
-assert 31 == Nanofactory.init_from_file("data/14_tests/1.txt").ore_for(1, "FUEL")
-assert 165 == Nanofactory.init_from_file("data/14_tests/2.txt").ore_for(1, "FUEL")
-assert 13312 == Nanofactory.init_from_file("data/14_tests/3.txt").ore_for(1, "FUEL")
-assert 180697 == Nanofactory.init_from_file("data/14_tests/4.txt").ore_for(1, "FUEL")
-assert 2210736 == Nanofactory.init_from_file("data/14_tests/5.txt").ore_for(1, "FUEL")
+def part1(reactions_str):
+    return Nanofactory.init_from_str(reactions_str).ore_for(1, "FUEL")
+
+
+def part2(reactions_str):
+    return Nanofactory.init_from_str(reactions_str).fuel_from_ore(10 ** 12)
+
+
+def example_factory(number):
+    return Nanofactory.init_from_str(read_data_file(2019, f"14_tests/{number}.txt"))
+
 
-assert 82892753 == Nanofactory.init_from_file("data/14_tests/3.txt").fuel_from_ore(10 ** 12)
-assert 5586022 == Nanofactory.init_from_file("data/14_tests/4.txt").fuel_from_ore(10 ** 12)
-assert 460664 == Nanofactory.init_from_file("data/14_tests/5.txt").fuel_from_ore(10 ** 12)
+def test_examples():
+    assert 31 == example_factory(1).ore_for(1, "FUEL")
+    assert 165 == example_factory(2).ore_for(1, "FUEL")
+    assert 13312 == example_factory(3).ore_for(1, "FUEL")
+    assert 180697 == example_factory(4).ore_for(1, "FUEL")
+    assert 2210736 == example_factory(5).ore_for(1, "FUEL")
 
-NANOFACTORY = Nanofactory.init_from_file("data/14.txt")
-print(NANOFACTORY.ore_for(1, "FUEL"))
-print(NANOFACTORY.fuel_from_ore(10 ** 12))
+    assert 82892753 == example_factory(3).fuel_from_ore(10 ** 12)
+    assert 5586022 == example_factory(4).fuel_from_ore(10 ** 12)
+    assert 460664 == example_factory(5).fuel_from_ore(10 ** 12)
@@ -1,9 +1,12 @@
 from enum import Enum
-import math
-from collections import namedtuple
+from collections import deque
 from dataclasses import dataclass
-from heapq import heappush, heappop
-from day_05 import IntcodeComputer, test_intcode_computer
+
+from advent import read_input
+
+from .day_05 import IntcodeComputer
+from .intcode_trace import ReplayComputer
+
 
 class Direction(Enum):
 	NORTH = 1
@@ -11,20 +14,6 @@ class Direction(Enum):
 	WEST = 3
 	EAST = 4
 
-	def opposite(self):
-		if self == Direction.NORTH:
-			return Direction.SOUTH
-		if self == Direction.SOUTH:
-			return Direction.NORTH
-		if self == Direction.WEST:
-			return Direction.EAST
-		if self == Direction.EAST:
-			return Direction.WEST
-
-	def all_forward(self):
-		for direction in list(Direction):
-			if direction != self.opposite():
-				yield direction
 
 @dataclass(frozen=True)
 class Position:
@@ -45,134 +34,77 @@ class Position:
 			return Position(self.x + 1, self.y)
 
 
-def find_oxygen_system(program_file):
-	positions = {}
-	oxygen_position = None
-	oxygen_steps = None
+def explore_maze(droid):
+	"""breadth first search of the maze, forking the droid into every open cell instead of walking it back
+
+	returns (steps from the start to each open position, position of the oxygen system)
+	"""
 
-	program = IntcodeComputer.init_from_file(program_file)
 	start_position = Position(0, 0)
-	positions[start_position] = 0
-	steps_taken = []
-
-	# depth first search
-	def step(position, direction):
-		nonlocal oxygen_position
-		nonlocal oxygen_steps
-		nonlocal program
-		nonlocal steps_taken
-		nonlocal positions
-
-		steps_taken.append(direction)
-		new_position = position.step(direction)
-
-		# if this position is already in positions{} and the distance there is less than this,
-		# we don't need to re-explore here
-		prev_num_steps = positions.get(new_position, math.inf)
-		if prev_num_steps <= len(steps_taken):
-			# step back
-			steps_taken = steps_taken[:-1]
-			return
-
-		positions[new_position] = len(steps_taken)
-		program.pass_in(direction.value)
-		state = program.parse_and_get_next_value()
-
-		# hit oxygen system
-		if state == 2:
-			oxygen_position = new_position
-			if oxygen_steps is None or len(oxygen_steps) > len(steps_taken):
-				oxygen_steps = [s for s in steps_taken]
-
-			# go backwards
-			program.pass_in(direction.opposite().value)
-			program.parse_and_get_next_value()
-			steps_taken = steps_taken[:-1]
-
-		# hit a wall
-		elif state == 0:
-			steps_taken = steps_taken[:-1]
-
-		# clear space
-		elif state == 1:
-			for new_direction in direction.all_forward():
-				step(new_position, new_direction)
-
-			# go backwards
-			program.pass_in(direction.opposite().value)
-			program.parse_and_get_next_value()
-			steps_taken = steps_taken[:-1]
-
-
-	oxygen_steps = None
-	for first_direction in list(Direction):
-		program = IntcodeComputer.init_from_file(program_file)
-		start_position = Position(0, 0)
-		positions[start_position] = 0
-		steps_taken = []
-		step(start_position, first_direction)
-
-	return oxygen_steps
-
-def time_for_oxygen_to_fill_space(program_file, steps_to_oxygen_system):
-	starting_program = IntcodeComputer.init_from_file(program_file)
-	starting_position = Position(0, 0)
-	for direction in steps_to_oxygen_system:
-		starting_program.pass_in(direction.value)
-		starting_program.parse_and_get_next_value()
-		starting_position = starting_position.step(direction)
-
-	positions = {}
-	positions[starting_position] = 0
-	steps_taken = []
-
-	# depth first search
-	def step(position, direction):
-		nonlocal program
-		nonlocal steps_taken
-		nonlocal positions
-
-		steps_taken.append(direction)
-		new_position = position.step(direction)
-
-		# if this position is already in positions{} and the distance there is less than this,
-		# we don't need to re-explore here
-		prev_num_steps = positions.get(new_position, math.inf)
-		if prev_num_steps <= len(steps_taken):
-			# step back
-			steps_taken = steps_taken[:-1]
-			return
-
-		positions[new_position] = len(steps_taken)
-		program.pass_in(direction.value)
-		state = program.parse_and_get_next_value()
-
-		# hit a wall
-		if state == 0:
-			steps_taken = steps_taken[:-1]
-		else:
-			# step everywhere except backwards
-			for new_direction in direction.all_forward():
-				step(new_position, new_direction)
-
-			# go backwards
-			program.pass_in(direction.opposite().value)
-			program.parse_and_get_next_value()
-			steps_taken = steps_taken[:-1]
-
-
-	for first_direction in list(Direction):
-		steps_taken = []
-		program = starting_program
-		step(starting_position, first_direction)
-
-	return max(positions.values())
-
-
-
-test_intcode_computer()
-
-steps_to_oxygen_system = find_oxygen_system("data/15.txt")
-assert(len(steps_to_oxygen_system) == 232)
-assert(time_for_oxygen_to_fill_space("data/15.txt", steps_to_oxygen_system) == 320)
+	steps = {start_position: 0}
+	walls = set()
+	oxygen_position = None
+
+	to_visit = deque([(start_position, droid)])
+	while to_visit:
+		position, droid = to_visit.popleft()
+		for direction in Direction:
+			new_position = position.step(direction)
+			if new_position in steps or new_position in walls:
+				continue
+
+			moved_droid = droid.fork()
+			moved_droid.pass_in(direction.value)
+			state, = moved_droid.run_until(1)
+
+			# hit a wall
+			if state == 0:
+				walls.add(new_position)
+				continue
+
+			# hit oxygen system
+			if state == 2:
+				oxygen_position = new_position
+
+			steps[new_position] = steps[position] + 1
+			to_visit.append((new_position, moved_droid))
+
+	return steps, oxygen_position
+
+
+def time_for_oxygen_to_fill_space(open_positions, oxygen_position):
+	minutes = {oxygen_position: 0}
+	to_fill = deque([oxygen_position])
+	while to_fill:
+		position = to_fill.popleft()
+		for direction in Direction:
+			new_position = position.step(direction)
+			if new_position in open_positions and new_position not in minutes:
+				minutes[new_position] = minutes[position] + 1
+				to_fill.append(new_position)
+
+	return max(minutes.values())
+
+
+def part1(program_str):
+	steps, oxygen_position = explore_maze(IntcodeComputer.init_from_str(program_str))
+	return steps[oxygen_position]
+
+
+def part2(program_str):
+	steps, oxygen_position = explore_maze(IntcodeComputer.init_from_str(program_str))
+	return time_for_oxygen_to_fill_space(steps.keys(), oxygen_position)
+
+
+def test_answers():
+	program_str = read_input(2019, 15)
+	assert part1(program_str) == 232
+	assert part2(program_str) == 320
+
+
+def test_replay():
+	droid = IntcodeComputer.init_from_str(read_input(2019, 15), record_trace=True)
+	recorded = explore_maze(droid)
 
+	# the whole search tree plays back without running the droid's program
+	assert explore_maze(ReplayComputer(droid.trace)) == recorded
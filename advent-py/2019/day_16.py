@@ -1,3 +1,5 @@
+from advent import read_input
+
 BASE_PATTERN = [1, 0, -1, 0]
 
 
@@ -39,7 +41,6 @@ def run_part2(raw_input_signal, num_phases):
 	relevant_pattern = input_signal[int(input_signal[:7]):]
 
 	for i in range(num_phases):
-		print(relevant_pattern)
 		s = ""
 		total = 0
 
@@ -58,26 +59,28 @@ def run_part2(raw_input_signal, num_phases):
 	return relevant_pattern[:8]
 
 
-assert(run_part1("12345678", 1) == "48226158")
-assert(run_part1("12345678", 2) == "34040438")
-assert(run_part1("12345678", 3) == "03415518")
-assert(run_part1("12345678", 4) == "01029498")
+def part1(input_signal):
+	return run_part1(input_signal.strip(), 100)
+
+
+def part2(input_signal):
+	return run_part2(input_signal.strip(), 100)
+
+
+def test_examples():
+	assert(run_part1("12345678", 1) == "48226158")
+	assert(run_part1("12345678", 2) == "34040438")
+	assert(run_part1("12345678", 3) == "03415518")
+	assert(run_part1("12345678", 4) == "01029498")
 
-assert(run_part1("80871224585914546619083218645595", 100) == "24176176")
-assert(run_part1("19617804207202209144916044189917", 100) == "73745418")
-assert(run_part1("69317163492948606335995924319873", 100) == "52432133")
+	assert(run_part1("80871224585914546619083218645595", 100) == "24176176")
+	assert(run_part1("19617804207202209144916044189917", 100) == "73745418")
+	assert(run_part1("69317163492948606335995924319873", 100) == "52432133")
 
-INPUT_MESSAGE = "\
-597150919766609778476861804721789882748688742489128919278817705064161286676791229587926244062310720\
-132211266238814893179123097633851821336018404464691641520948019118465722353675853630919441535749347\
-094085116885683625088770436435695196309508366992460462862624794078064940083280686072759316330949493\
-442813981508001879713176845011131911848381188502871898308721288121882376806735137452696452192281836\
-339867018714884672847164339536634984448297483644020223937279387813576640347397724578551664718028865\
-652578588132916675256350018235846504208153161329438694998003749977771307558423191534638953644092262\
-60937941771665247483191282218355610246363741092810592458"
+	assert(run_part2("03036732577212944063491565474664", 100) == "84462026")
+	assert(run_part2("02935109699940807407585447034323", 100) == "78725270")
+	assert(run_part2("03081770884921959731165446850517", 100) == "53553731")
 
-assert(run_part2("03036732577212944063491565474664", 100) == "84462026")
-assert(run_part2("02935109699940807407585447034323", 100) == "78725270")
-assert(run_part2("03081770884921959731165446850517", 100) == "53553731")
 
-assert(run_part2(INPUT_MESSAGE, 100) == "85600369")
+def test_answers():
+	assert(part2(read_input(2019, 16)) == "85600369")
@@ -0,0 +1,317 @@
+"""
+static analysis of intcode programs: basic blocks, common idioms, and writes into code
+
+Code is found by following control flow from the entry point. Jumps to immediate addresses are followed directly;
+jumps through memory (function returns, mostly) can't be, so constants that look like return addresses being stored
+are followed as well. Anything only reachable some other way won't show up.
+"""
+
+from collections import Counter, namedtuple
+
+import attr
+
+from .intcode_disassembler import MNEMONICS, format_instruction
+from .intcode_jit import INSTRUCTION_LENGTHS, JUMP_OPCODES, split_instruction
+
+Instruction = namedtuple("Instruction", ["address", "opcode", "modes", "parameters"])
+
+WRITING_OPCODES = {1: 3, 2: 3, 3: 1, 7: 3, 8: 3}  # opcode -> which parameter is written to
+COMPARE_OPCODES = {7, 8}
+
+
+def decode(read, address):
+    """the instruction at address, or None if there isn't a valid one there"""
+
+    opcode, modes = split_instruction(read(address))
+    if opcode not in MNEMONICS:
+        return None
+
+    parameters = tuple(read(address + offset) for offset in range(1, INSTRUCTION_LENGTHS[opcode]))
+    return Instruction(address, opcode, modes, parameters)
+
+
+def instruction_length(instruction):
+    return INSTRUCTION_LENGTHS[instruction.opcode]
+
+
+def instruction_to_str(instruction):
+    return format_instruction(instruction.opcode, instruction.modes, instruction.parameters)
+
+
+def jump_behaviour(instruction):
+    """(can fall through, can jump) for a jump, given what's known about its condition"""
+
+    condition_mode, condition = instruction.modes[0], instruction.parameters[0]
+    if condition_mode != 1:
+        return True, True
+
+    jumps = bool(condition) == (instruction.opcode == 5)
+    return not jumps, jumps
+
+
+def constant_loaded(instruction):
+    """the constant an add or multiply copies into memory, like `add 0, 913, [rb+0]`, if that's what it does"""
+
+    if instruction.opcode not in (1, 2) or instruction.modes[:2] != (1, 1):
+        return None
+
+    identity = 0 if instruction.opcode == 1 else 1
+    first, second = instruction.parameters[:2]
+    if first == identity:
+        return second
+    if second == identity:
+        return first
+
+    return None
+
+
+@attr.s
+class BasicBlock:
+    start = attr.ib()
+    instructions = attr.ib(factory=list)
+    successors = attr.ib(factory=list)
+    # ends in a jump through memory, so where it goes next isn't known
+    indirect = attr.ib(default=False)
+
+    @property
+    def end(self):
+        last = self.instructions[-1]
+        return last.address + instruction_length(last)
+
+
+def find_code(read, program_size, entry=0):
+    """address -> Instruction for everything reachable from entry, and the addresses that must start a block"""
+
+    instructions = {}
+    leaders = {entry}
+    to_visit = [entry]
+
+    while to_visit:
+        address = to_visit.pop()
+        while 0 <= address < program_size and address not in instructions:
+            instruction = decode(read, address)
+            if instruction is None:
+                break
+
+            instructions[address] = instruction
+            next_address = address + instruction_length(instruction)
+
+            constant = constant_loaded(instruction)
+            if constant is not None and 0 < constant < program_size and constant != next_address:
+                # probably a return address being pushed
+                leaders.add(constant)
+                to_visit.append(constant)
+
+            if instruction.opcode == 99:
+                break
+
+            if instruction.opcode in JUMP_OPCODES:
+                falls_through, jumps = jump_behaviour(instruction)
+                if jumps and instruction.modes[1] == 1:
+                    leaders.add(instruction.parameters[1])
+                    to_visit.append(instruction.parameters[1])
+                if not falls_through:
+                    break
+
+                leaders.add(next_address)
+
+            address = next_address
+
+    return instructions, leaders
+
+
+def basic_blocks(read, program_size, entry=0):
+    instructions, leaders = find_code(read, program_size, entry)
+
+    blocks = []
+    block = None
+    for address in sorted(instructions):
+        instruction = instructions[address]
+        if block is None or address in leaders or address != block.end:
+            block = BasicBlock(address)
+            blocks.append(block)
+
+        block.instructions.append(instruction)
+        if instruction.opcode in JUMP_OPCODES or instruction.opcode == 99:
+            block = None
+
+    for block in blocks:
+        last = block.instructions[-1]
+        if last.opcode == 99:
+            continue
+
+        if last.opcode in JUMP_OPCODES:
+            falls_through, jumps = jump_behaviour(last)
+            if jumps:
+                if last.modes[1] == 1:
+                    block.successors.append(last.parameters[1])
+                else:
+                    block.indirect = True
+            if falls_through:
+                block.successors.append(block.end)
+        else:
+            block.successors.append(block.end)
+
+    return blocks
+
+
+def same_cell(parameter_a, mode_a, parameter_b, mode_b):
+    return mode_a == mode_b and mode_a in (0, 2) and parameter_a == parameter_b
+
+
+def compare_jump(first, second):
+    """whether the pair is a compare whose result is the very next thing a conditional jump tests"""
+
+    return (
+        first.opcode in COMPARE_OPCODES
+        and second.opcode in JUMP_OPCODES
+        and second.address == first.address + 4
+        and same_cell(first.parameters[2], first.modes[2], second.parameters[0], second.modes[0])
+    )
+
+
+def move_source(instruction):
+    """for `add x, 0, y` or `mul x, 1, y` (either way round), the parameter index of x"""
+
+    identity = 0 if instruction.opcode == 1 else 1
+    for index, other in [(0, 1), (1, 0)]:
+        if instruction.modes[other] == 1 and instruction.parameters[other] == identity:
+            return index
+
+    return None
+
+
+def counter_step(instruction):
+    """`add [x], n, [x]`, either way round"""
+
+    parameters, modes = instruction.parameters, instruction.modes
+    return instruction.opcode == 1 and any(
+        modes[step] == 1 and same_cell(parameters[counter], modes[counter], parameters[2], modes[2])
+        for counter, step in [(0, 1), (1, 0)]
+    )
+
+
+def idiom(instruction, following=None):
+    """the name of a common pattern starting at instruction, if there is one"""
+
+    if following is not None and compare_jump(instruction, following):
+        return "compare and branch"
+
+    if counter_step(instruction):
+        return "counter step"
+
+    if instruction.opcode in (1, 2) and move_source(instruction) is not None:
+        return "move"
+
+    if instruction.opcode in JUMP_OPCODES:
+        falls_through, jumps = jump_behaviour(instruction)
+        if jumps and not falls_through:
+            return "goto" if instruction.modes[1] == 1 else "return"
+
+    return None
+
+
+def find_idioms(blocks):
+    """(address, idiom name) for every idiom in the blocks"""
+
+    found = []
+    for block in blocks:
+        for position, instruction in enumerate(block.instructions):
+            following = block.instructions[position + 1] if position + 1 < len(block.instructions) else None
+            name = idiom(instruction, following)
+            if name is not None:
+                found.append((instruction.address, name))
+
+    return found
+
+
+def find_writes_into_code(blocks):
+    """
+    (writer address, written address, instruction address, which cell of it) for every write that's known to land in
+    code, and a count of the relative writes that can't be placed without running the program
+    """
+
+    owners = {}
+    for block in blocks:
+        for instruction in block.instructions:
+            for offset in range(instruction_length(instruction)):
+                owners[instruction.address + offset] = instruction
+
+    writes = []
+    unresolved = 0
+    for block in blocks:
+        for instruction in block.instructions:
+            if instruction.opcode not in WRITING_OPCODES:
+                continue
+
+            parameter_index = WRITING_OPCODES[instruction.opcode] - 1
+            target = instruction.parameters[parameter_index]
+            if instruction.modes[parameter_index] == 2:
+                unresolved += 1
+            elif target in owners:
+                owner = owners[target]
+                cell = "opcode" if target == owner.address else f"parameter {target - owner.address}"
+                writes.append((instruction.address, target, owner.address, cell))
+
+    return writes, unresolved
+
+
+def fusable_compare_jump(read, address):
+    """
+    the parts of a compare and branch starting at address, for the interpreter to run in one go:
+    (compare opcode, compare modes, jump instruction as written, jump opcode, jump modes), or None
+    """
+
+    first = decode(read, address)
+    if first is None or first.opcode not in COMPARE_OPCODES:
+        return None
+
+    second = decode(read, address + 4)
+    if second is None or not compare_jump(first, second):
+        return None
+
+    return first.opcode, first.modes, read(address + 4), second.opcode, second.modes
+
+
+def analysis_report(read, program_size, entry=0):
+    blocks = basic_blocks(read, program_size, entry)
+    idioms = dict(find_idioms(blocks))
+    writes, unresolved = find_writes_into_code(blocks)
+
+    n_instructions = sum(len(block.instructions) for block in blocks)
+    # instructions picked up from a misread return address can overlap real ones, so count cells rather than lengths
+    code_cells = len(
+        {
+            instruction.address + offset
+            for block in blocks
+            for instruction in block.instructions
+            for offset in range(instruction_length(instruction))
+        }
+        & set(range(program_size))
+    )
+    lines = [
+        f"{len(blocks)} basic blocks, {n_instructions} instructions covering {code_cells} of {program_size} cells",
+        f"{sum(1 for block in blocks if block.indirect)} blocks end in an indirect jump",
+        "",
+        "idioms:",
+    ]
+    for name, count in Counter(idioms.values()).most_common():
+        lines.append(f"  {name:<20} {count:>6}")
+
+    lines += ["", f"writes into code: {len(writes)}, plus {unresolved} relative writes that can't be placed statically"]
+    for writer, target, owner, cell in writes:
+        lines.append(f"  {writer:>6} writes {target} ({cell} of the instruction at {owner})")
+
+    lines += ["", "blocks:"]
+    for block in blocks:
+        successors = ", ".join(str(successor) for successor in block.successors)
+        if block.indirect:
+            successors = f"{successors}, ?" if successors else "?"
+        lines.append(f"  block {block.start} -> {successors or 'halt'}")
+        for instruction in block.instructions:
+            line = f"  {instruction.address:>6}  {instruction_to_str(instruction)}"
+            if instruction.address in idioms:
+                line = f"{line:<50} ; {idioms[instruction.address]}"
+            lines.append(line)
+
+    return "\n".join(lines)
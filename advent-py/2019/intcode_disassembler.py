@@ -0,0 +1,36 @@
+"""
+turning intcode back into something readable
+
+Parameters are shown as `[12]` for a position, `[rb+3]` for relative to the relative base, and a bare number for an
+immediate value.
+"""
+
+from .intcode_jit import INSTRUCTION_LENGTHS, split_instruction
+
+MNEMONICS = {1: "add", 2: "mul", 3: "in", 4: "out", 5: "jnz", 6: "jz", 7: "lt", 8: "eq", 9: "arb", 99: "halt"}
+
+
+def format_parameter(parameter, mode):
+    if mode == 0:
+        return f"[{parameter}]"
+    if mode == 2:
+        return f"[rb{parameter:+d}]"
+
+    return str(parameter)
+
+
+def format_instruction(opcode, modes, parameters):
+    formatted = [format_parameter(parameter, mode) for parameter, mode in zip(parameters, modes)]
+    return " ".join([f"{MNEMONICS[opcode]:<4}", ", ".join(formatted)]).rstrip()
+
+
+def disassemble_instruction(read, address):
+    """(text, length) of the instruction at address, or None if there isn't a valid one there"""
+
+    opcode, modes = split_instruction(read(address))
+    if opcode not in MNEMONICS:
+        return None
+
+    length = INSTRUCTION_LENGTHS[opcode]
+    parameters = [read(address + offset) for offset in range(1, length)]
+    return format_instruction(opcode, modes, parameters), length
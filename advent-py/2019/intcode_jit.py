@@ -0,0 +1,201 @@
+"""
+compiling straight-line runs of intcode into python functions
+
+A block starts wherever the interpreter lands and runs through arithmetic, comparisons and relative base
+changes, ending with a jump (which is compiled in) or just before an input, output or halt (which are left to
+the interpreter). Parameters are baked into the generated source as constants, so any write into a compiled
+block throws that block away and hands control back to the interpreter. Cells that get written to like that are
+remembered as patched, and blocks compiled afterwards read them from memory each time instead (or, for an
+opcode, leave that instruction to the interpreter), since programs tend to patch the same operands over and over.
+"""
+
+# the longest block worth compiling in one go; loops stitch blocks together anyway
+MAX_BLOCK_INSTRUCTIONS = 64
+
+STRAIGHT_LINE_OPCODES = {1, 2, 7, 8, 9}
+JUMP_OPCODES = {5, 6}
+INSTRUCTION_LENGTHS = {1: 4, 2: 4, 3: 2, 4: 2, 5: 3, 6: 3, 7: 4, 8: 4, 9: 2, 99: 1}
+
+
+def split_instruction(instruction):
+    return instruction % 100, (instruction // 100 % 10, instruction // 1000 % 10, instruction // 10000 % 10)
+
+
+class BlockCompiler:
+    def __init__(self):
+        self.blocks = {}
+        # address -> start addresses of the compiled blocks that cover it
+        self.owners = {}
+        # addresses where there's nothing to compile, so the interpreter takes over
+        self.interpreted = set()
+        # addresses the program has written over after they were compiled
+        self.patched = set()
+
+    def reset(self):
+        self.blocks = {}
+        self.owners = {}
+        self.interpreted = set()
+        self.patched = set()
+
+    def invalidate(self, address):
+        self.patched.add(address)
+        for start in list(self.owners.get(address, ())):
+            block_range = self.blocks.pop(start).code_range
+            for covered in block_range:
+                # patched cells are read from memory, so the block was never registered as owning them
+                owners = self.owners.get(covered)
+                if owners is None:
+                    continue
+
+                owners.discard(start)
+                if not owners:
+                    del self.owners[covered]
+
+    def run(self, computer, limit=None):
+        """run compiled blocks for as long as there are some to run, and the machine's step count is under `limit`
+
+        Blocks run whole, so a limit can be overshot by up to MAX_BLOCK_INSTRUCTIONS - 1 instructions.
+        """
+
+        while computer.alive and (limit is None or computer.steps < limit):
+            block = self.blocks.get(computer.index)
+            if block is None:
+                if computer.index in self.interpreted:
+                    return
+
+                block = self.compile(computer, computer.index)
+                if block is None:
+                    self.interpreted.add(computer.index)
+                    return
+
+            block(computer)
+
+    def compile(self, computer, start):
+        source_lines, end = generate_block_source(
+            computer._get_value_program, start, self.patched, len(computer.program)
+        )
+        if not source_lines:
+            return None
+
+        source = "\n".join(
+            [
+                "def block(vm):",
+                "    if vm.shared:",
+                "        vm._unshare()",
+                "    mem = vm.program",
+                "    rb = vm.relative_base",
+                "    code = owners",
+                "    decoded = vm.decoded",
+                *source_lines,
+            ]
+        )
+
+        namespace = {"owners": self.owners}
+        exec(compile(source, f"<intcode block {start}>", "exec"), namespace)  # pylint: disable=exec-used
+        block = namespace["block"]
+        block.code_range = range(start, end)
+        block.source = source
+
+        self.blocks[start] = block
+        for address in block.code_range:
+            if address in self.patched:
+                continue
+            self.owners.setdefault(address, set()).add(start)
+
+        return block
+
+
+def generate_block_source(read, start, patched, program_size):
+    """(lines of the function body, end address)
+
+    Addresses below `program_size` are in the program's own flat memory, which never changes size; anything past
+    that is paged, so it's read through the machine.
+    """
+
+    lines = []
+    index = start
+    ends_with_jump = False
+    # instructions in the block so far, counting the one being generated
+    executed = 0
+
+    def operand(offset, mode):
+        # like the interpreter, anything that isn't a position or relative mode is immediate
+        if index + offset in patched:
+            parameter = f"mem[{index + offset}]"
+            if mode not in (0, 2):
+                return parameter
+            address = parameter if mode == 0 else f"rb + {parameter}"
+            return f"(mem[{address}] if {address} < {program_size} else vm._get_value_program({address}))"
+
+        parameter = read(index + offset)
+        if mode not in (0, 2):
+            return str(parameter)
+        if mode == 2:
+            address = f"rb + {parameter}"
+            return f"(mem[{address}] if {address} < {program_size} else vm._get_value_program({address}))"
+        if parameter < program_size:
+            return f"mem[{parameter}]"
+
+        return f"vm._get_value_program({parameter})"
+
+    def write(offset, mode, value, next_index):
+        parameter = f"mem[{index + offset}]" if index + offset in patched else read(index + offset)
+        target = f"rb + {parameter}" if mode == 2 else str(parameter)
+        return [
+            f"    value = {value}",
+            f"    address = {target}",
+            # anything the interpreter or compiler has decoded has to go through _set_value to be invalidated
+            f"    if address < {program_size} and address not in code and address not in decoded:",
+            "        try:",
+            "            mem[address] = value",
+            "        except OverflowError:",
+            "            vm._set_value(address, value)",
+            "            mem = vm.program",
+            "    else:",
+            "        hit_code = address in code",
+            "        vm.relative_base = rb",
+            "        vm._set_value(address, value)",
+            "        mem = vm.program",
+            "        if hit_code:",
+            f"            vm.index = {next_index}",
+            f"            vm.steps += {executed}",
+            "            return",
+        ]
+
+    for _ in range(MAX_BLOCK_INSTRUCTIONS):
+        opcode, modes = split_instruction(read(index))
+        if index in patched or opcode not in STRAIGHT_LINE_OPCODES and opcode not in JUMP_OPCODES:
+            break
+
+        length = INSTRUCTION_LENGTHS[opcode]
+        executed += 1
+        lines.append(f"    # {index}: opcode {opcode} modes {modes}")
+
+        if opcode == 1:
+            lines += write(3, modes[2], f"{operand(1, modes[0])} + {operand(2, modes[1])}", index + length)
+        elif opcode == 2:
+            lines += write(3, modes[2], f"{operand(1, modes[0])} * {operand(2, modes[1])}", index + length)
+        elif opcode == 7:
+            lines += write(3, modes[2], f"int({operand(1, modes[0])} < {operand(2, modes[1])})", index + length)
+        elif opcode == 8:
+            lines += write(3, modes[2], f"int({operand(1, modes[0])} == {operand(2, modes[1])})", index + length)
+        elif opcode == 9:
+            lines.append(f"    rb += {operand(1, modes[0])}")
+        else:
+            condition = operand(1, modes[0]) if opcode == 5 else f"not {operand(1, modes[0])}"
+            lines += [
+                "    vm.relative_base = rb",
+                f"    vm.index = {operand(2, modes[1])} if {condition} else {index + length}",
+                f"    vm.steps += {executed}",
+                "    return",
+            ]
+            index += length
+            ends_with_jump = True
+            break
+
+        index += length
+
+    if lines and not ends_with_jump:
+        lines += ["    vm.relative_base = rb", f"    vm.index = {index}", f"    vm.steps += {executed}"]
+
+    return lines, index
@@ -0,0 +1,48 @@
+"""
+memory for the intcode machine
+
+The program itself (plus some headroom) lives in a flat array of 64 bit words. Addresses past that come from fixed size
+pages, allocated the first time something is written there, so a write to a huge address costs one page rather than
+a list reaching all the way out to it. An array only switches over to python ints if a value won't fit in 64 bits.
+"""
+
+from array import array
+
+PAGE_BITS = 10
+PAGE_SIZE = 1 << PAGE_BITS
+PAGE_MASK = PAGE_SIZE - 1
+
+
+def core_size(program_length):
+    """the program rounded up to whole pages, plus one more, since programs tend to keep a stack just past their code"""
+
+    return ((program_length + PAGE_MASK) >> PAGE_BITS << PAGE_BITS) + PAGE_SIZE
+
+
+def to_words(values, size=0):
+    """values (zero padded out to `size`) as a compact array of 64 bit ints, or a list if any are too big for that"""
+
+    padding = max(0, size - len(values))
+    try:
+        words = array("q", values)
+        words.frombytes(bytes(8 * padding))
+    except OverflowError:
+        words = list(values) + [0] * padding
+
+    return words
+
+
+def new_page():
+    return array("q", bytes(8 * PAGE_SIZE))
+
+
+def store(words, offset, value):
+    """write into an array or list, returning whichever one holds the value (a new list if it needed big ints)"""
+
+    try:
+        words[offset] = value
+    except OverflowError:
+        words = list(words)
+        words[offset] = value
+
+    return words
@@ -0,0 +1,142 @@
+"""
+networks of intcode machines passing values to each other
+
+Each machine runs as a coroutine until it needs input, then waits on its own queue, so only machines with something
+to read get woken up. Any machine's output can go to any number of others, which covers chains, rings, meshes and
+broadcasts alike. A run ends once every machine has halted or is waiting on input that nobody is going to send.
+
+For machines that don't talk to each other, round_robin just shares out instructions fairly, with an optional limit.
+"""
+
+import asyncio
+from collections import defaultdict
+
+import attr
+
+from .day_05 import RunStatus
+
+
+@attr.s
+class IntcodeNetwork:
+    # name -> machine
+    machines = attr.ib(factory=dict)
+    # name -> names of the machines its output goes to
+    links = attr.ib(factory=lambda: defaultdict(list))
+    # name -> everything the machine has output so far
+    outputs = attr.ib(init=False, factory=lambda: defaultdict(list))
+
+    inboxes = attr.ib(init=False, factory=dict)
+    live = attr.ib(init=False, factory=set)
+    blocked = attr.ib(init=False, default=0)
+    idle = attr.ib(init=False, default=None)
+    error = attr.ib(init=False, default=None)
+
+    @classmethod
+    def init_from_chain(cls, machines, closed=False):
+        """machine i feeds machine i + 1, and the last feeds the first if `closed`"""
+
+        network = IntcodeNetwork(dict(enumerate(machines)))
+        for index in range(len(machines) - 1):
+            network.connect(index, index + 1)
+        if closed and machines:
+            network.connect(len(machines) - 1, 0)
+
+        return network
+
+    def add_machine(self, name, machine):
+        self.machines[name] = machine
+
+    def connect(self, source, *destinations):
+        self.links[source].extend(destinations)
+
+    def send(self, name, *values):
+        self.machines[name].pass_in_all(values)
+
+    def run(self):
+        """run until every machine has halted or is stuck waiting for input, returning the outputs"""
+
+        asyncio.run(self.run_async())
+        return self.outputs
+
+    async def run_async(self):
+        self.inboxes = {name: asyncio.Queue() for name in self.machines}
+        self.live = set(self.machines)
+        self.blocked = 0
+        self.idle = asyncio.Event()
+        self.error = None
+
+        tasks = [asyncio.create_task(self._run_machine(name)) for name in self.machines]
+        if tasks:
+            await self.idle.wait()
+
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        if self.error is not None:
+            raise self.error
+
+    def _check_idle(self):
+        if self.blocked == len(self.live) and all(self.inboxes[name].empty() for name in self.live):
+            self.idle.set()
+
+    async def _run_machine(self, name):
+        machine = self.machines[name]
+        inbox = self.inboxes[name]
+
+        try:
+            while True:
+                for value in machine.run_until_input_needed():
+                    self.outputs[name].append(value)
+                    for destination in self.links[name]:
+                        self.inboxes[destination].put_nowait(value)
+
+                if not machine.alive:
+                    break
+
+                if inbox.empty():
+                    self.blocked += 1
+                    self._check_idle()
+                    value = await inbox.get()
+                    self.blocked -= 1
+                else:
+                    value = inbox.get_nowait()
+
+                machine.pass_in(value)
+                while not inbox.empty():
+                    machine.pass_in(inbox.get_nowait())
+        except Exception as err:  # pylint: disable=broad-except
+            self.error = err
+            self.idle.set()
+            return
+
+        self.live.discard(name)
+        self._check_idle()
+
+
+def round_robin(machines, time_slice=1000, budget=None):
+    """
+    take turns running each machine (name -> machine) for up to `time_slice` instructions, until each one has halted,
+    is waiting on input or has used up `budget` instructions in all; returns name -> RunStatus for how each stopped
+    """
+
+    statuses = {}
+    running = dict(machines)
+    started_at = {name: machine.steps for name, machine in running.items()}
+
+    while running:
+        for name, machine in list(running.items()):
+            steps = time_slice
+            if budget is not None:
+                steps = min(steps, budget - (machine.steps - started_at[name]))
+                if steps <= 0:
+                    statuses[name] = RunStatus.BUDGET_EXHAUSTED
+                    del running[name]
+                    continue
+
+            status = machine.run_slice(max_steps=steps)
+            if status in (RunStatus.HALTED, RunStatus.NEED_INPUT):
+                statuses[name] = status
+                del running[name]
+
+    return statuses
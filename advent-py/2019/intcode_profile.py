@@ -0,0 +1,76 @@
+"""
+counting what an intcode program actually executes
+
+With `IntcodeComputer(..., instrument=True)` every instruction goes through InstructionStats.execute, which counts
+executions per address and per opcode, and how often each conditional jump was taken. The counts carry on across
+resets, and forks add to the same counts, so a whole search over many machines shows up in one report.
+"""
+
+from collections import Counter, defaultdict
+
+import attr
+
+from .intcode_disassembler import MNEMONICS, disassemble_instruction
+from .intcode_jit import JUMP_OPCODES
+
+
+@attr.s(slots=True)
+class InstructionStats:
+    address_counts = attr.ib(factory=Counter)
+    opcode_counts = attr.ib(factory=Counter)
+    # address -> [times taken, times not taken], for conditional jumps
+    branches = attr.ib(factory=lambda: defaultdict(lambda: [0, 0]))
+
+    def execute(self, machine, handler, modes):
+        address = machine.index
+        opcode = machine._get_value_program(address) % 100
+
+        value = handler(machine, modes)
+
+        self.address_counts[address] += 1
+        self.opcode_counts[opcode] += 1
+        if opcode in JUMP_OPCODES:
+            self.branches[address][machine.index == address + 3] += 1
+
+        return value
+
+    def total(self):
+        return sum(self.opcode_counts.values())
+
+    def taken_ratio(self, address):
+        taken, not_taken = self.branches[address]
+        return taken / (taken + not_taken)
+
+    def annotated_disassembly(self, read):
+        """every executed instruction in address order, with its hit count (and how often it jumped)"""
+
+        lines = []
+        previous_end = None
+        for address in sorted(self.address_counts):
+            if previous_end is not None and address != previous_end:
+                lines.append("")
+
+            disassembled = disassemble_instruction(read, address)
+            text, length = disassembled if disassembled else (f"?? {read(address)}", 1)
+            line = f"{address:>6} {self.address_counts[address]:>10}  {text}"
+            if address in self.branches:
+                line = f"{line:<60} taken {self.taken_ratio(address):.0%}"
+
+            lines.append(line)
+            previous_end = address + length
+
+        return "\n".join(lines)
+
+    def report(self, read, top=10):
+        total = self.total()
+        lines = [f"{total} instructions executed, over {len(self.address_counts)} addresses", "", "by opcode:"]
+        for opcode, count in self.opcode_counts.most_common():
+            lines.append(f"  {MNEMONICS.get(opcode, opcode):<4} {count:>10}  {count / total:.1%}")
+
+        lines += ["", f"hottest {top} addresses:"]
+        for address, count in self.address_counts.most_common(top):
+            disassembled = disassemble_instruction(read, address)
+            lines.append(f"  {address:>6} {count:>10}  {disassembled[0] if disassembled else '??'}")
+
+        lines += ["", "disassembly:", self.annotated_disassembly(read)]
+        return "\n".join(lines)
@@ -0,0 +1,176 @@
+"""
+recording what an intcode machine reads and writes, and playing it back without the machine
+
+A trace is a flat array of (kind, step, value) int64 triples, where step counts instructions executed so far. A fork
+gets its own trace, hung off its parent's at the point it was forked, so a whole search tree can be recorded and then
+replayed by a consumer that forks the same way. Values have to fit in 64 bits.
+"""
+
+from array import array
+from collections import Counter, deque
+
+import attr
+
+INPUT = 0
+OUTPUT = 1
+HALT = 2
+
+
+@attr.s(slots=True, eq=False)
+class Trace:
+    events = attr.ib(factory=lambda: array("q"))
+    parent = attr.ib(default=None)
+    # how many of the parent's events had happened when this one was forked off
+    parent_offset = attr.ib(default=0)
+    children = attr.ib(factory=list)
+
+    def __len__(self):
+        return len(self.events) // 3
+
+    def event(self, index):
+        return tuple(self.events[3 * index : 3 * index + 3])
+
+    def record(self, kind, step, value):
+        self.events.extend((kind, step, value))
+
+    def fork(self):
+        child = Trace(parent=self, parent_offset=len(self))
+        self.children.append(child)
+        return child
+
+    def walk(self):
+        """this trace and every trace forked from it, parents before children"""
+
+        yield self
+        for child in self.children:
+            yield from child.walk()
+
+    def to_array(self):
+        """every trace in the tree as (parent number, parent offset, event count, *events), parent -1 for the root"""
+
+        numbers = {}
+        flat = array("q")
+        for number, trace in enumerate(self.walk()):
+            numbers[trace] = number
+            flat.extend((numbers.get(trace.parent, -1), trace.parent_offset, len(trace)))
+            flat.extend(trace.events)
+
+        return flat
+
+    @classmethod
+    def from_array(cls, flat):
+        traces = []
+        index = 0
+        while index < len(flat):
+            parent_number, parent_offset, n_events = flat[index : index + 3]
+            index += 3
+
+            trace = Trace(flat[index : index + 3 * n_events], None, parent_offset)
+            index += 3 * n_events
+            if parent_number >= 0:
+                trace.parent = traces[parent_number]
+                trace.parent.children.append(trace)
+            traces.append(trace)
+
+        return traces[0]
+
+    def save(self, filename):
+        with open(filename, "wb") as file:
+            self.to_array().tofile(file)
+
+    @classmethod
+    def load(cls, filename):
+        flat = array("q")
+        with open(filename, "rb") as file:
+            flat.frombytes(file.read())
+
+        return cls.from_array(flat)
+
+
+class TraceDiverged(Exception):
+    pass
+
+
+@attr.s(slots=True)
+class ReplayComputer:
+    """
+    stands in for an IntcodeComputer by playing back a trace
+
+    Inputs passed in are checked against the recording, so a consumer that stops behaving the way it did when the
+    trace was made gets a TraceDiverged rather than made up outputs.
+    """
+
+    trace = attr.ib()
+    input_values = attr.ib(factory=deque, converter=deque)
+
+    position = attr.ib(init=False, default=0)
+    alive = attr.ib(init=False, default=True)
+    # instructions the recorded machine had executed by this point
+    steps = attr.ib(init=False, default=0)
+    # position -> forks taken there so far, to match them up with the recorded ones in order
+    forks_taken = attr.ib(init=False, factory=Counter)
+
+    def is_alive(self):
+        return self.alive
+
+    def pass_in(self, value):
+        self.input_values.append(value)
+
+    def pass_in_all(self, values):
+        self.input_values.extend(values)
+
+    def _set_value(self, index, value):
+        # the recorded run already made any writes, and its outputs reflect them
+        pass
+
+    def _run(self, max_outputs=None):
+        outputs = []
+        while self.alive:
+            if self.position >= len(self.trace):
+                if self.input_values:
+                    raise TraceDiverged(f"got input {self.input_values[0]} after the end of the trace")
+                break
+
+            kind, step, value = self.trace.event(self.position)
+            if kind == INPUT:
+                if not self.input_values:
+                    break
+
+                given = self.input_values.popleft()
+                if given != value:
+                    raise TraceDiverged(f"got input {given}, but the recording read {value}")
+            elif kind == OUTPUT:
+                outputs.append(value)
+            else:
+                self.alive = False
+
+            self.position += 1
+            self.steps = step
+            if max_outputs is not None and len(outputs) >= max_outputs:
+                break
+
+        return outputs
+
+    def run_until(self, n_outputs):
+        return self._run(max_outputs=n_outputs)
+
+    def run_until_input_needed(self):
+        return self._run()
+
+    def parse_and_get_next_value(self):
+        outputs = self._run(max_outputs=1)
+        if outputs:
+            return outputs[0]
+
+        return None
+
+    def fork(self):
+        forks = [child for child in self.trace.children if child.parent_offset == self.position]
+        taken = self.forks_taken[self.position]
+        if taken >= len(forks):
+            raise TraceDiverged(f"forked more times at event {self.position} than the recording did")
+
+        self.forks_taken[self.position] += 1
+        forked = ReplayComputer(forks[taken], self.input_values)
+        forked.steps = self.steps
+        return forked
@@ -2,6 +2,8 @@
 
 from math import floor
 
+from advent import read_input
+
 
 def two_entries_that_sum_to(goal, entries):
     if len(entries) < 2:
@@ -40,20 +42,27 @@ def three_entries_that_sum_to(goal, entries):
     return None
 
 
-def load_entries_from_text(filename):
-    entries = []
+def parse_entries(entries_str):
+    return [int(line.strip()) for line in entries_str.split()]
+
+
+def part1(entries_str):
+    return two_entries_that_sum_to(2020, parse_entries(entries_str))
 
-    with open(filename) as fh:
-        for line in fh:
-            entries.append(int(line.strip()))
 
-    return entries
+def part2(entries_str):
+    return three_entries_that_sum_to(2020, parse_entries(entries_str))
 
 
 TEST_SET = [1721, 979, 366, 299, 675, 1456]
-assert two_entries_that_sum_to(2020, TEST_SET) == 514579
-assert three_entries_that_sum_to(2020, TEST_SET) == 241861950
 
-REAL_SET = load_entries_from_text("data/01.txt")
-assert two_entries_that_sum_to(2020, REAL_SET) == 866436
-assert three_entries_that_sum_to(2020, REAL_SET) == 276650720
+
+def test_examples():
+    assert two_entries_that_sum_to(2020, TEST_SET) == 514579
+    assert three_entries_that_sum_to(2020, TEST_SET) == 241861950
+
+
+def test_answers():
+    entries_str = read_input(2020, 1)
+    assert part1(entries_str) == 866436
+    assert part2(entries_str) == 276650720
@@ -2,6 +2,8 @@
 
 import re
 
+from advent import read_input
+
 PATTERN = re.compile("^([0-9]+)-([0-9]+) ([A-z]): ([A-z]+)$")
 
 
@@ -42,13 +44,23 @@ def count_valid_passwords(fn, lines):
     return count
 
 
+def part1(passwords_str):
+    return count_valid_passwords(valid_password_part1, passwords_str.split("\n"))
+
+
+def part2(passwords_str):
+    return count_valid_passwords(valid_password_part2, passwords_str.split("\n"))
+
+
 TEST_SET = ["1-3 a: abcde", "1-3 b: cdefg", "2-9 c: ccccccccc"]
-assert count_valid_passwords(valid_password_part1, TEST_SET) == 2
-assert count_valid_passwords(valid_password_part2, TEST_SET) == 1
 
-REAL_SET = []
-with open("data/02.txt") as fh:
-    REAL_SET = fh.readlines()
 
-assert count_valid_passwords(valid_password_part1, REAL_SET) == 582
-assert count_valid_passwords(valid_password_part2, REAL_SET) == 729
+def test_examples():
+    assert count_valid_passwords(valid_password_part1, TEST_SET) == 2
+    assert count_valid_passwords(valid_password_part2, TEST_SET) == 1
+
+
+def test_answers():
+    passwords_str = read_input(2020, 2)
+    assert part1(passwords_str) == 582
+    assert part2(passwords_str) == 729
@@ -1,10 +1,13 @@
 """ day 3: toboggan trajectory """
 
-from collections import namedtuple
 from enum import Enum
 import attr
 
-Location = namedtuple("Location", ["x", "y"])
+from advent import read_input
+from advent.grid import Grid2D
+from advent.imports import lazy_import
+
+np = lazy_import("numpy")
 
 
 class State(Enum):
@@ -16,23 +19,12 @@ class State(Enum):
 class TobogganRun:
     tree_map = attr.ib()
 
-    def tree(self, location):
-        if location.y >= len(self.tree_map):
-            return False
-
-        tree_map_row = self.tree_map[location.y]
-        return tree_map_row[location.x % len(tree_map_row)] == State.TREE
-
     def toboggo(self, right, down):
-        location = Location(0, 0)
-        trees_hit = 0
-
-        while location.y < len(self.tree_map):
-            location = Location(location.x + right, location.y + down)
-            if self.tree(location):
-                trees_hit += 1
+        # every row we land on after the start, with the map repeating off to the right
+        ys = np.arange(down, self.tree_map.height, down)
+        xs = (ys // down * right) % self.tree_map.width
 
-        return trees_hit
+        return int(np.count_nonzero(self.tree_map.cells[ys, xs]))
 
     def toboggo_many_slopes(self, slopes):
         result = 1
@@ -43,10 +35,21 @@ class TobogganRun:
 
     @classmethod
     def from_str(cls, map_str):
-        return cls([[State(x) for x in line.strip()] for line in map_str.split() if len(line.strip())])
+        return cls(Grid2D.from_str(map_str, {State.TREE.value: True, State.OPEN.value: False}))
 
     def __str__(self):
-        return "\n".join(["".join([x.value for x in row]) for row in self.tree_map])
+        return self.tree_map.to_str({True: State.TREE.value, False: State.OPEN.value})
+
+
+SLOPES = [(1, 1), (3, 1), (5, 1), (7, 1), (1, 2)]
+
+
+def part1(map_str):
+    return TobogganRun.from_str(map_str).toboggo(3, 1)
+
+
+def part2(map_str):
+    return TobogganRun.from_str(map_str).toboggo_many_slopes(SLOPES)
 
 
 TEST_MAP = """
@@ -62,16 +65,15 @@ TEST_MAP = """
 #...##....#
 .#..#...#.#
 """
-SLOPES = [(1, 1), (3, 1), (5, 1), (7, 1), (1, 2)]
 
-TEST_RUN = TobogganRun.from_str(TEST_MAP)
-assert TEST_RUN.toboggo(3, 1) == 7
-assert TEST_RUN.toboggo_many_slopes(SLOPES) == 336
 
-REAL_MAP = ""
-with open("data/03.txt") as fh:
-    REAL_MAP = fh.read()
+def test_examples():
+    test_run = TobogganRun.from_str(TEST_MAP)
+    assert test_run.toboggo(3, 1) == 7
+    assert test_run.toboggo_many_slopes(SLOPES) == 336
+
 
-REAL_RUN = TobogganRun.from_str(REAL_MAP)
-assert REAL_RUN.toboggo(3, 1) == 257
-assert REAL_RUN.toboggo_many_slopes(SLOPES) == 1744787392
+def test_answers():
+    map_str = read_input(2020, 3)
+    assert part1(map_str) == 257
+    assert part2(map_str) == 1744787392
@@ -2,6 +2,8 @@
 
 import re
 
+from advent import read_input
+
 
 def number_between(min_value, max_value):
     def run_for(value):
@@ -82,6 +84,14 @@ def parse_passports(passports_str, validation_fn):
     yield validation_fn(passport_str.split())
 
 
+def part1(passports_str):
+    return sum(parse_passports(passports_str, check_field_existence))
+
+
+def part2(passports_str):
+    return sum(parse_passports(passports_str, validate_password))
+
+
 TEST_DATA = """
 ecl:gry pid:860033327 eyr:2020 hcl:#fffffd
 byr:1937 iyr:2017 cid:147 hgt:183cm
@@ -98,13 +108,6 @@ hcl:#cfa07d eyr:2025 pid:166559648
 iyr:2011 ecl:brn hgt:59in
 """
 
-REAL_DATA = ""
-with open("data/04.txt") as fh:
-    REAL_DATA = fh.read()
-
-assert sum(parse_passports(TEST_DATA, check_field_existence)) == 2
-assert sum(parse_passports(REAL_DATA, check_field_existence)) == 222
-
 
 TEST_DATA_INVALID = """
 eyr:1972 cid:100
@@ -138,7 +141,13 @@ iyr:2010 hgt:158cm hcl:#b6652a ecl:blu byr:1944 eyr:2021 pid:093154719
 """
 
 
-assert sum(parse_passports(TEST_DATA_INVALID, validate_password)) == 0
-assert sum(parse_passports(TEST_DATA_VALID, validate_password)) == 4
+def test_examples():
+    assert sum(parse_passports(TEST_DATA, check_field_existence)) == 2
+    assert sum(parse_passports(TEST_DATA_INVALID, validate_password)) == 0
+    assert sum(parse_passports(TEST_DATA_VALID, validate_password)) == 4
+
 
-assert sum(parse_passports(REAL_DATA, validate_password)) == 140
+def test_answers():
+    passports_str = read_input(2020, 4)
+    assert part1(passports_str) == 222
+    assert part2(passports_str) == 140
@@ -1,5 +1,7 @@
 """ day 5: binary boarding """
 
+from advent import read_input
+
 
 def parse_row(assignment):
     return int(assignment[:7].replace("F", "0").replace("B", "1"), 2)
@@ -20,16 +22,26 @@ def find_open_seat(seat_ids):
                 return seat
 
 
-assert seat_id("FBFBBFFRLR") == 357
-assert seat_id("BFFFBBFRRR") == 567
-assert seat_id("FFFBBBFRRR") == 119
-assert seat_id("BBFFBBFRLL") == 820
+def parse_seat_ids(assignments_str):
+    return sorted([seat_id(line.strip()) for line in assignments_str.split()])
+
+
+def part1(assignments_str):
+    return parse_seat_ids(assignments_str)[-1]
+
+
+def part2(assignments_str):
+    return find_open_seat(parse_seat_ids(assignments_str))
+
 
+def test_examples():
+    assert seat_id("FBFBBFFRLR") == 357
+    assert seat_id("BFFFBBFRRR") == 567
+    assert seat_id("FFFBBBFRRR") == 119
+    assert seat_id("BBFFBBFRLL") == 820
 
-SEAT_IDS = []
-with open("data/05.txt") as fh:
-    SEAT_IDS = sorted([seat_id(line.strip()) for line in fh.readlines()])
 
-MAX_SEAT_ID = SEAT_IDS[-1]
-assert MAX_SEAT_ID == 890
-assert find_open_seat(SEAT_IDS) == 651
+def test_answers():
+    assignments_str = read_input(2020, 5)
+    assert part1(assignments_str) == 890
+    assert part2(assignments_str) == 651
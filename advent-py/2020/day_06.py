@@ -1,5 +1,7 @@
 """ day 6 """
 
+from advent import read_input
+
 
 def parse_any_member(answers):
     total_yeses = 0
@@ -32,6 +34,14 @@ def parse_all_members(answers):
     return total_yeses
 
 
+def part1(answers):
+    return parse_any_member(answers)
+
+
+def part2(answers):
+    return parse_all_members(answers)
+
+
 TEST_ANSWERS = """
 abc
 
@@ -49,11 +59,13 @@ a
 
 b"""
 
-assert parse_any_member(TEST_ANSWERS) == 11
-assert parse_all_members(TEST_ANSWERS) == 6
 
-with open("data/06.txt") as fh:
-    ANSWERS = fh.read()
+def test_examples():
+    assert parse_any_member(TEST_ANSWERS) == 11
+    assert parse_all_members(TEST_ANSWERS) == 6
+
 
-assert parse_any_member(ANSWERS) == 6590
-assert parse_all_members(ANSWERS) == 3288
+def test_answers():
+    answers = read_input(2020, 6)
+    assert part1(answers) == 6590
+    assert part2(answers) == 3288
@@ -62,6 +62,14 @@ def parse_bags(bag_rules_str):
     return bags
 
 
+def part1(bag_rules_str):
+    return parse_bags(bag_rules_str).number_of_bags_that_hold("shiny gold")
+
+
+def part2(bag_rules_str):
+    return parse_bags(bag_rules_str).bags_within("shiny gold")
+
+
 TEST_BAG_RULES_STR = """
 light red bags contain 1 bright white bag, 2 muted yellow bags.
 dark orange bags contain 3 bright white bags, 4 muted yellow bags.
@@ -74,13 +82,8 @@ faded blue bags contain no other bags.
 dotted black bags contain no other bags.
 """
 
-TEST_BAGS = parse_bags(TEST_BAG_RULES_STR)
-assert TEST_BAGS.number_of_bags_that_hold("shiny gold") == 4
-assert TEST_BAGS.bags_within("shiny gold") == 32
-
-BAGS = None
-with open("data/07.txt") as fh:
-    BAGS = parse_bags(fh.read())
 
-print(BAGS.number_of_bags_that_hold("shiny gold"))
-print(BAGS.bags_within("shiny gold"))
+def test_examples():
+    test_bags = parse_bags(TEST_BAG_RULES_STR)
+    assert test_bags.number_of_bags_that_hold("shiny gold") == 4
+    assert test_bags.bags_within("shiny gold") == 32
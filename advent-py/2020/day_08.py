@@ -1,11 +1,12 @@
 """ day 8: handheld halting """
 
 import re
-import pytest
 import attr
 
 from copy import copy
 
+from advent import read_input
+
 
 @attr.s
 class Program:
@@ -96,6 +97,16 @@ def exception_thrown(fn):
     return False
 
 
+def part1(program_str):
+    program = Program.from_str(program_str)
+    assert exception_thrown(program.run)
+    return program.accumulator
+
+
+def part2(program_str):
+    return uncorrupted_result(Program.from_str(program_str))
+
+
 TEST_PROGRAM_STR = """
 nop +0
 acc +1
@@ -108,12 +119,13 @@ jmp -4
 acc +6
 """
 
-TEST_PROGRAM = Program.from_str(TEST_PROGRAM_STR)
-assert exception_thrown(TEST_PROGRAM.run)
-assert TEST_PROGRAM.accumulator == 5
-assert uncorrupted_result(TEST_PROGRAM) == 8
 
-PROGRAM = Program.from_file("data/08.txt")
-assert exception_thrown(PROGRAM.run)
-assert PROGRAM.accumulator == 1723
-print(uncorrupted_result(PROGRAM))
+def test_examples():
+    test_program = Program.from_str(TEST_PROGRAM_STR)
+    assert exception_thrown(test_program.run)
+    assert test_program.accumulator == 5
+    assert uncorrupted_result(test_program) == 8
+
+
+def test_answers():
+    assert part1(read_input(2020, 8)) == 1723
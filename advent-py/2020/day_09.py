@@ -1,6 +1,8 @@
 """ day 9: encoding error """
 
-from day_01 import two_entries_that_sum_to
+from advent import read_input
+
+from .day_01 import two_entries_that_sum_to
 
 
 def sums_to(goal, numbers):
@@ -32,13 +34,27 @@ def encryption_weakness(numbers, preamble_length):
                 break
 
 
+def parse_numbers(numbers_str):
+    return [int(x.strip()) for x in numbers_str.split()]
+
+
+def part1(numbers_str):
+    return first_invalid_number(parse_numbers(numbers_str), 25)
+
+
+def part2(numbers_str):
+    return encryption_weakness(parse_numbers(numbers_str), 25)
+
+
 TEST_EXAMPLES = [35, 20, 15, 25, 47, 40, 62, 55, 65, 95, 102, 117, 150, 182, 127, 219, 299, 277, 309, 576]
-assert first_invalid_number(TEST_EXAMPLES, 5) == 127
-assert encryption_weakness(TEST_EXAMPLES, 5) == 62
 
 
-with open("data/09.txt") as fh:
-    EXAMPLES = [int(x.strip()) for x in fh.readlines()]
+def test_examples():
+    assert first_invalid_number(TEST_EXAMPLES, 5) == 127
+    assert encryption_weakness(TEST_EXAMPLES, 5) == 62
+
 
-assert first_invalid_number(EXAMPLES, 25) == 32321523
-assert encryption_weakness(EXAMPLES, 25) == 4794981
+def test_answers():
+    numbers_str = read_input(2020, 9)
+    assert part1(numbers_str) == 32321523
+    assert part2(numbers_str) == 4794981
@@ -45,20 +45,23 @@ def num_possible_chains(adapter_str):
     return _num_possible_chains(0, adapter_list, max(adapter_list))
 
 
+def part1(adapter_str):
+    return part1_result(adapter_str)
+
+
+def part2(adapter_str):
+    return num_possible_chains(adapter_str)
+
+
 TEST_ADAPTERS1 = "16 10 15 5 1 11 7 19 6 12 4"
 TEST_ADAPTERS2 = """
     28 33 18 42 31 14 46 20 48 47 24 23 49 45 19 38 39 11 1 32 25 35 8 17 7 9 4 2 34 10 3
 """
 
 
-assert part1_result(TEST_ADAPTERS1) == 35
-assert part1_result(TEST_ADAPTERS2) == 220
-
-assert num_possible_chains(TEST_ADAPTERS1) == 8
-assert num_possible_chains(TEST_ADAPTERS2) == 19208
-
-with open("data/10.txt") as fh:
-    ADAPTERS = fh.read()
+def test_examples():
+    assert part1_result(TEST_ADAPTERS1) == 35
+    assert part1_result(TEST_ADAPTERS2) == 220
 
-print(part1_result(ADAPTERS))
-print(num_possible_chains(ADAPTERS))
+    assert num_possible_chains(TEST_ADAPTERS1) == 8
+    assert num_possible_chains(TEST_ADAPTERS2) == 19208
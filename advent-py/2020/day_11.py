@@ -1,7 +1,9 @@
-from itertools import product
-
 from enum import Enum
-from copy import deepcopy
+
+from advent.grid import ADJACENT, Grid2D
+from advent.imports import lazy_import
+
+np = lazy_import("numpy")
 
 
 class Seat(Enum):
@@ -10,94 +12,76 @@ class Seat(Enum):
     OCCUPIED = "#"
 
 
-def parse_seats(seat_str):
-    return [[Seat(x) for x in line.strip()] for line in seat_str.split("\n") if line]
-
-
-def count_occupied_seats(seats):
-    return sum([sum([int(seat == Seat.OCCUPIED) for seat in row]) for row in seats])
-
+SEAT_CODES = {Seat.FLOOR.value: 0, Seat.EMPTY.value: 1, Seat.OCCUPIED.value: 2}
 
-def seat_range(seats, xs, ys):
-    min_x, max_x = xs
-    min_y, max_y = ys
 
-    return [seats[y][min_x:max_x] for y in range(min_y, max_y)]
+def parse_seats(seat_str):
+    """(where the seats are, which of them are occupied) as boolean arrays"""
 
+    codes = Grid2D.from_str(seat_str, SEAT_CODES, dtype=np.int8).cells
+    return codes != SEAT_CODES[Seat.FLOOR.value], codes == SEAT_CODES[Seat.OCCUPIED.value]
 
-def step_options(x, y, max_x, max_y):
-    return (max(0, x - 1), min(max_x, x + 2)), (max(0, y - 1), min(max_y, y + 2))
 
+def first_visible_seat(seats, x_dir, y_dir):
+    """flat index of the first seat seen from each cell looking along (x_dir, y_dir), or -1 if there isn't one"""
 
-def occupied_seat_visible(seats, x, y, x_dir, y_dir):
-    if x_dir == 0 and y_dir == 0:
-        return False
+    rows, columns = seats.shape
+    ys, xs = np.indices(seats.shape)
 
-    rows = len(seats)
-    columns = len(seats[0])
+    visible = np.full(seats.shape, -1)
+    searching = np.ones(seats.shape, dtype=bool)
+    for distance in range(1, max(rows, columns)):
+        target_y, target_x = ys + y_dir * distance, xs + x_dir * distance
+        searching &= (0 <= target_y) & (target_y < rows) & (0 <= target_x) & (target_x < columns)
+        if not searching.any():
+            break
 
-    x += x_dir
-    y += y_dir
-    while 0 <= x < columns and 0 <= y < rows:
-        if seats[y][x] == Seat.OCCUPIED:
-            return True
-        if seats[y][x] == Seat.EMPTY:
-            return False
+        found = np.zeros(seats.shape, dtype=bool)
+        found[searching] = seats[target_y[searching], target_x[searching]]
 
-        x += x_dir
-        y += y_dir
+        visible[found] = (target_y * columns + target_x)[found]
+        searching &= ~found
 
-    return False
+    return visible
 
 
-def step(seats, occupied_part1=True):
-    new_seats = deepcopy(seats)
+def step(seats, occupied, visible=None):
+    """without `visible`, seats only look at their direct neighbors (part 1)"""
 
-    rows = len(seats)
-    columns = len(seats[0])
+    if visible is None:
+        occupied_nearby = Grid2D(occupied).count_neighbors(fill=False)
+        threshold = 4
+    else:
+        # index -1 picks up the padding, which is never occupied
+        occupied_nearby = np.append(occupied.ravel(), False)[visible].sum(axis=0)
+        threshold = 5
 
-    for y in range(rows):
-        for x in range(columns):
-            seat_state = seats[y][x]
-            if seat_state == Seat.FLOOR:
-                continue
+    return seats & np.where(occupied, occupied_nearby < threshold, occupied_nearby == 0)
 
-            if occupied_part1:
-                occupied = count_occupied_seats(seat_range(seats, *step_options(x, y, columns, rows))) - int(
-                    seat_state == Seat.OCCUPIED
-                )
-            else:
-                occupied = 0
-                for (x_step, y_step) in product([-1, 0, 1], [-1, 0, 1]):
-                    occupied += int(occupied_seat_visible(seats, x, y, x_step, y_step))
 
-            if seat_state == Seat.EMPTY and occupied == 0:
-                new_seats[y][x] = Seat.OCCUPIED
-            elif seat_state == Seat.OCCUPIED and occupied >= 4 and occupied_part1:
-                new_seats[y][x] = Seat.EMPTY
-            elif seat_state == Seat.OCCUPIED and occupied >= 5 and not occupied_part1:
-                new_seats[y][x] = Seat.EMPTY
+def run(seat_str, occupied_part1=True):
+    seats, state = parse_seats(seat_str)
+    visible = None if occupied_part1 else np.stack([first_visible_seat(seats, *offset) for offset in ADJACENT])
 
-    return new_seats
+    while True:
+        new_state = step(seats, state, visible)
+        if np.array_equal(state, new_state):
+            return int(np.count_nonzero(state))
 
+        state = new_state
 
-def run(seat_str, occupied_part1=True):
-    # start greater than zero for the ability to loop nicely
-    state = parse_seats(seat_str)
-    changed = True
-    idx = 0
 
-    while changed is True:
-        new_state = step(state, occupied_part1)
-        changed = state != new_state
+def seats_to_str(seats, occupied):
+    codes = np.where(occupied, SEAT_CODES[Seat.OCCUPIED.value], seats.astype(np.int8))
+    return Grid2D(codes).to_str({code: char for char, code in SEAT_CODES.items()})
 
-        state = new_state
 
-    return count_occupied_seats(state)
+def part1(seat_str):
+    return run(seat_str, occupied_part1=True)
 
 
-def seats_to_str(seats):
-    return "\n".join(["".join([x.value for x in row]) for row in seats])
+def part2(seat_str):
+    return run(seat_str, occupied_part1=False)
 
 
 TEST_SEATS = """
@@ -113,11 +97,7 @@ L.LLLLLL.L
 L.LLLLL.LL
 """
 
-assert run(TEST_SEATS, occupied_part1=True) == 37
-assert run(TEST_SEATS, occupied_part1=False) == 26
-
-with open("data/11.txt") as fh:
-    SEATS = fh.read()
 
-print(run(SEATS, occupied_part1=True))
-print(run(SEATS, occupied_part1=False))
+def test_examples():
+    assert run(TEST_SEATS, occupied_part1=True) == 37
+    assert run(TEST_SEATS, occupied_part1=False) == 26
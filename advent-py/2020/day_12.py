@@ -104,6 +104,14 @@ def run_part2(directions_str):
     return abs(ship.x) + abs(ship.y)
 
 
+def part1(directions_str):
+    return run_part1(directions_str)
+
+
+def part2(directions_str):
+    return run_part2(directions_str)
+
+
 TEST_DIRECTIONS = """
 F10
 N3
@@ -112,11 +120,7 @@ R90
 F11
 """
 
-assert run_part1(TEST_DIRECTIONS) == 25
-assert run_part2(TEST_DIRECTIONS) == 286
-
-with open("data/12.txt") as fh:
-    DIRECTIONS = fh.read()
 
-print(run_part1(DIRECTIONS))
-print(run_part2(DIRECTIONS))
+def test_examples():
+    assert run_part1(TEST_DIRECTIONS) == 25
+    assert run_part2(TEST_DIRECTIONS) == 286
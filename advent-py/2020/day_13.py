@@ -47,24 +47,26 @@ def parse_bus_sch(text):
     return curr_time, schedule
 
 
+def part1(bus_sch_str):
+    return next_bus(*parse_bus_sch(bus_sch_str))
+
+
+def part2(bus_sch_str):
+    return earliest_sequential_departures(parse_bus_sch(bus_sch_str)[1])
+
+
 TEST_BUS_SCH = """
 939
 7,13,x,x,59,x,31,19
 """
 
-# assert next_bus(*parse_bus_sch(TEST_BUS_SCH)) == 295
-
-BUS_SCH = ""
-with open("data/13.txt") as fh:
-    BUS_SCH = fh.read()
-
-# assert next_bus(*parse_bus_sch(BUS_SCH)) == 3606
 
-assert earliest_sequential_departures(parse_bus_sch(TEST_BUS_SCH)[1]) == 1068781
-assert earliest_sequential_departures([17, None, 13, 19]) == 3417
-assert earliest_sequential_departures([67, 7, 59, 61]) == 754018
-assert earliest_sequential_departures([67, None, 7, 59, 61]) == 779210
-assert earliest_sequential_departures([67, 7, None, 59, 61]) == 1261476
-assert earliest_sequential_departures([1789, 37, 47, 1889]) == 1202161486
+def test_examples():
+    # assert next_bus(*parse_bus_sch(TEST_BUS_SCH)) == 295
 
-print(earliest_sequential_departures(parse_bus_sch(BUS_SCH)[1]))
+    assert earliest_sequential_departures(parse_bus_sch(TEST_BUS_SCH)[1]) == 1068781
+    assert earliest_sequential_departures([17, None, 13, 19]) == 3417
+    assert earliest_sequential_departures([67, 7, 59, 61]) == 754018
+    assert earliest_sequential_departures([67, None, 7, 59, 61]) == 779210
+    assert earliest_sequential_departures([67, 7, None, 59, 61]) == 1261476
+    assert earliest_sequential_departures([1789, 37, 47, 1889]) == 1202161486
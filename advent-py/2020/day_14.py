@@ -2,6 +2,8 @@
 
 import re
 
+from advent import read_input
+
 # I don't have internet and I'm sure python has built-in binary processing
 # but I don't know how it works
 # so just implement from scratch
@@ -48,9 +50,7 @@ def parse_program(program_str):
     mask_pattern = re.compile(r"mask = ([X01]{36})")
     write_pattern = re.compile(r"mem\[([0-9]+)\] = ([0-9]+)")
 
-    for line_index, line in enumerate(program_str.split("\n")):
-        print(f"working on line {str(line_index+1)}: {line}")
-
+    for line in program_str.split("\n"):
         if match := re.match(mask_pattern, line.strip()):
             mask_str = match.groups()[0]
             yield (mask_str,)
@@ -91,37 +91,42 @@ def run_program_v2(program_str):
     return sum(mem.values())
 
 
-assert int_to_binary(11) == "000000000000000000000000000000001011"
-assert int_to_binary(64) == "000000000000000000000000000001000000"
-assert int_to_binary(73) == "000000000000000000000000000001001001"
-assert int_to_binary(101) == "000000000000000000000000000001100101"
+def part1(program_str):
+    return run_program_v1(program_str)
+
 
-assert binary_to_int(int_to_binary(11)) == 11
-assert binary_to_int(int_to_binary(64)) == 64
-assert binary_to_int(int_to_binary(73)) == 73
-assert binary_to_int(int_to_binary(101)) == 101
+def part2(program_str):
+    return run_program_v2(program_str)
 
 
-TEST_INITIALIZATION_PROGRAM = """
+TEST_INITIALIZATION_PROGRAM_V1 = """
 mask = XXXXXXXXXXXXXXXXXXXXXXXXXXXXX1XXXX0X
 mem[8] = 11
 mem[7] = 101
 mem[8] = 0
 """
-assert run_program_v1(TEST_INITIALIZATION_PROGRAM) == 165
 
-TEST_INITIALIZATION_PROGRAM = """
+TEST_INITIALIZATION_PROGRAM_V2 = """
 mask = 000000000000000000000000000000X1001X
 mem[42] = 100
 mask = 00000000000000000000000000000000X0XX
 mem[26] = 1"""
-assert run_program_v2(TEST_INITIALIZATION_PROGRAM) == 208
 
 
-INITIALIZATION_PROGRAM = ""
-with open("data/14.txt") as fh:
-    INITIALIZATION_PROGRAM = fh.read()
+def test_examples():
+    assert int_to_binary(11) == "000000000000000000000000000000001011"
+    assert int_to_binary(64) == "000000000000000000000000000001000000"
+    assert int_to_binary(73) == "000000000000000000000000000001001001"
+    assert int_to_binary(101) == "000000000000000000000000000001100101"
+
+    assert binary_to_int(int_to_binary(11)) == 11
+    assert binary_to_int(int_to_binary(64)) == 64
+    assert binary_to_int(int_to_binary(73)) == 73
+    assert binary_to_int(int_to_binary(101)) == 101
+
+    assert run_program_v1(TEST_INITIALIZATION_PROGRAM_V1) == 165
+    assert run_program_v2(TEST_INITIALIZATION_PROGRAM_V2) == 208
 
 
-assert run_program_v1(INITIALIZATION_PROGRAM) == 17028179706934
-print(run_program_v2(INITIALIZATION_PROGRAM))
+def test_answers():
+    assert part1(read_input(2020, 14)) == 17028179706934
@@ -1,6 +1,14 @@
 """ rambunctious recitation """
 
+import tempfile
+from pathlib import Path
 
+from advent import read_input
+from advent.cache import memoize
+from advent.profiling import profile_day
+
+
+@memoize
 def play_game(starting_numbers, turns):
     numbers = {y: x + 1 for x, y in enumerate(starting_numbers)}
     prev = starting_numbers[-1]
@@ -17,27 +25,48 @@ def play_game(starting_numbers, turns):
         turn_number += 1
         prev = new_val
 
-    print("done!")
     return prev
 
 
-assert play_game([0, 3, 6], 10) == 0
-assert play_game([0, 3, 6], 2020) == 436
-assert play_game([1, 3, 2], 2020) == 1
-assert play_game([2, 1, 3], 2020) == 10
-assert play_game([1, 2, 3], 2020) == 27
-assert play_game([2, 3, 1], 2020) == 78
-assert play_game([3, 2, 1], 2020) == 438
-assert play_game([3, 1, 2], 2020) == 1836
+def parse_starting_numbers(numbers_str):
+    return [int(x) for x in numbers_str.strip().split(",")]
+
+
+def part1(numbers_str):
+    return play_game(parse_starting_numbers(numbers_str), 2020)
+
+
+def part2(numbers_str):
+    return play_game(parse_starting_numbers(numbers_str), 30000000)
+
+
+def test_examples():
+    assert play_game([0, 3, 6], 10) == 0
+    assert play_game([0, 3, 6], 2020) == 436
+    assert play_game([1, 3, 2], 2020) == 1
+    assert play_game([2, 1, 3], 2020) == 10
+    assert play_game([1, 2, 3], 2020) == 27
+    assert play_game([2, 3, 1], 2020) == 78
+    assert play_game([3, 2, 1], 2020) == 438
+    assert play_game([3, 1, 2], 2020) == 1836
+
+    # assert play_game([0, 3, 6], 30000000) == 175594
+    # assert play_game([1, 3, 2], 30000000) == 2578
+    # assert play_game([2, 1, 3], 30000000) == 3544142
+    # assert play_game([1, 2, 3], 30000000) == 261214
+    # assert play_game([2, 3, 1], 30000000) == 6895259
+    # assert play_game([3, 2, 1], 30000000) == 18
+    # assert play_game([3, 1, 2], 30000000) == 362
+
 
-assert play_game([7, 12, 1, 0, 16, 2], 2020) == 410
+def test_answers():
+    assert part1(read_input(2020, 15)) == 410
 
-# assert play_game([0, 3, 6], 30000000) == 175594
-# assert play_game([1, 3, 2], 30000000) == 2578
-# assert play_game([2, 1, 3], 30000000) == 3544142
-# assert play_game([1, 2, 3], 30000000) == 261214
-# assert play_game([2, 3, 1], 30000000) == 6895259
-# assert play_game([3, 2, 1], 30000000) == 18
-# assert play_game([3, 1, 2], 30000000) == 362
 
-print(play_game([7, 12, 1, 0, 16, 2], 30000000))
+def test_profile():
+    # even with the answer memoized, profiling has to show the game itself being played
+    part1(read_input(2020, 15))
+    with tempfile.TemporaryDirectory() as directory:
+        answers, report_path = profile_day(2020, 15, [1], report_path=Path(directory) / "2020_15.txt")
+        assert answers == {1: 410}
+        assert "(play_game)" in report_path.read_text()
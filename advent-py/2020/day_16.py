@@ -3,6 +3,8 @@
 import re
 from math import prod
 
+from advent import read_input
+
 
 def parse_input(input_str):
     reqs = {}
@@ -109,6 +111,14 @@ def part2_ticket_values(reqs, your_ticket, nearby_tickets):
     return prod([value for index, value in enumerate(your_ticket) if index in departure_indexes])
 
 
+def part1(notes_str):
+    return invalid_values(*parse_input(notes_str))
+
+
+def part2(notes_str):
+    return part2_ticket_values(*parse_input(notes_str))
+
+
 TEST_INPUT = """
 class: 1-3 or 5-7
 row: 6-11 or 33-44
@@ -124,12 +134,11 @@ nearby tickets:
 38,6,12
 """
 
-assert invalid_values(*parse_input(TEST_INPUT)) == 71
-part2_ticket_values(*parse_input(TEST_INPUT))
 
-INPUT = ""
-with open("data/16.txt") as fh:
-    INPUT = fh.read()
+def test_examples():
+    assert invalid_values(*parse_input(TEST_INPUT)) == 71
+    part2_ticket_values(*parse_input(TEST_INPUT))
+
 
-assert invalid_values(*parse_input(INPUT)) == 25788
-print(part2_ticket_values(*parse_input(INPUT)))
+def test_answers():
+    assert part1(read_input(2020, 16)) == 25788
@@ -4,6 +4,8 @@ from enum import Enum
 from copy import copy
 from collections import defaultdict, namedtuple
 
+from advent import read_input
+
 
 class Cube(Enum):
     ACTIVE = "#"
@@ -113,21 +115,28 @@ def total_active_cubes_4d(state_str, cycles):
     return total_active_cubes(parse_state_4d(state_str), cycles, neighbors_4d)
 
 
+def part1(state_str):
+    return total_active_cubes_3d(state_str, 6)
+
+
+def part2(state_str):
+    return total_active_cubes_4d(state_str, 6)
+
+
 TEST_STATE_STR = """
 .#.
 ..#
 ###
 """
 
-STATE_STR = ""
-with open("data/17.txt") as fh:
-    STATE_STR = fh.read()
 
+def test_examples():
+    assert len(list(neighbors_3d(Location3d(0, 0, 0)))) == 26
+    assert total_active_cubes_3d(TEST_STATE_STR, 6) == 112
+
+    assert len(list(neighbors_4d(Location4d(0, 0, 0, 0)))) == 80
+    assert total_active_cubes_4d(TEST_STATE_STR, 6) == 848
 
-assert len(list(neighbors_3d(Location3d(0, 0, 0)))) == 26
-assert total_active_cubes_3d(TEST_STATE_STR, 6) == 112
-assert total_active_cubes_3d(STATE_STR, 6) == 317
 
-assert len(list(neighbors_4d(Location4d(0, 0, 0, 0)))) == 80
-assert total_active_cubes_4d(TEST_STATE_STR, 6) == 848
-print(total_active_cubes_4d(STATE_STR, 6))
+def test_answers():
+    assert part1(read_input(2020, 17)) == 317
@@ -99,31 +99,25 @@ def calc_part2(math_str):
     return calculate(math_str, compute_part2)
 
 
-assert calc_part1("1 + 2 * 3 + 4 * 5 + 6") == 71
-assert calc_part1("1 + (2 * 3) + (4 * (5 + 6))") == 51
-assert calc_part1("2 * 3 + (4 * 5)") == 26
-assert calc_part1("5 + (8 * 3 + 9 + 3 * 4 * 3)") == 437
-assert calc_part1("5 * 9 * (7 * 3 * 3 + 9 * 3 + (8 + 6 * 4))") == 12240
-assert calc_part1("((2 + 4 * 9) * (6 + 9 * 8 + 6) + 6) + 2 + 4 * 2") == 13632
-
-assert calc_part2("1 + 2 * 3 + 4 * 5 + 6") == 231
-assert calc_part2("1 + (2 * 3) + (4 * (5 + 6))") == 51
-assert calc_part2("2 * 3 + (4 * 5)") == 46
-assert calc_part2("5 + (8 * 3 + 9 + 3 * 4 * 3)") == 1445
-assert calc_part2("5 * 9 * (7 * 3 * 3 + 9 * 3 + (8 + 6 * 4))") == 669060
-assert calc_part2("((2 + 4 * 9) * (6 + 9 * 8 + 6) + 6) + 2 + 4 * 2") == 23340
-
-total = 0
-with open("data/18.txt") as fh:
-    for line in fh:
-        total += calc_part1(line)
-
-print(total)
-
-
-total = 0
-with open("data/18.txt") as fh:
-    for line in fh:
-        total += calc_part2(line)
-
-print(total)
+def part1(homework_str):
+    return sum([calc_part1(line) for line in homework_str.split("\n") if line])
+
+
+def part2(homework_str):
+    return sum([calc_part2(line) for line in homework_str.split("\n") if line])
+
+
+def test_examples():
+    assert calc_part1("1 + 2 * 3 + 4 * 5 + 6") == 71
+    assert calc_part1("1 + (2 * 3) + (4 * (5 + 6))") == 51
+    assert calc_part1("2 * 3 + (4 * 5)") == 26
+    assert calc_part1("5 + (8 * 3 + 9 + 3 * 4 * 3)") == 437
+    assert calc_part1("5 * 9 * (7 * 3 * 3 + 9 * 3 + (8 + 6 * 4))") == 12240
+    assert calc_part1("((2 + 4 * 9) * (6 + 9 * 8 + 6) + 6) + 2 + 4 * 2") == 13632
+
+    assert calc_part2("1 + 2 * 3 + 4 * 5 + 6") == 231
+    assert calc_part2("1 + (2 * 3) + (4 * (5 + 6))") == 51
+    assert calc_part2("2 * 3 + (4 * 5)") == 46
+    assert calc_part2("5 + (8 * 3 + 9 + 3 * 4 * 3)") == 1445
+    assert calc_part2("5 * 9 * (7 * 3 * 3 + 9 * 3 + (8 + 6 * 4))") == 669060
+    assert calc_part2("((2 + 4 * 9) * (6 + 9 * 8 + 6) + 6) + 2 + 4 * 2") == 23340
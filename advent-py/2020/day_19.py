@@ -2,6 +2,8 @@ from abc import ABC, abstractmethod
 
 import attr
 
+from advent import read_data_file, read_input
+
 
 @attr.s
 class Rule(ABC):
@@ -168,6 +170,26 @@ def evaluate_rules_and_examples(input_str):
     return sum([1 if next(rule.exact_matches(ex), None) else 0 for ex in examples])
 
 
+def with_looping_rules(input_str):
+    # part 2 swaps in rules that refer back to themselves
+    looping_rules = {"8": "8: 42 | 42 8", "11": "11: 42 31 | 42 11 31"}
+
+    lines = []
+    for line in input_str.split("\n"):
+        index = line.split(":")[0]
+        lines.append(looping_rules.get(index, line) if ":" in line else line)
+
+    return "\n".join(lines)
+
+
+def part1(input_str):
+    return evaluate_rules_and_examples(input_str)
+
+
+def part2(input_str):
+    return evaluate_rules_and_examples(with_looping_rules(input_str))
+
+
 TEST_STR = """
 0: 4 1 5
 1: 2 3 | 3 2
@@ -184,19 +206,13 @@ aaaabbb
 """
 
 
-assert evaluate_rules_and_examples(TEST_STR) == 2
-
-with open("data/test/19_part1.txt") as fh:
-    assert evaluate_rules_and_examples(fh.read()) == 3
-
-
-with open("data/test/19_part2.txt") as fh:
-    assert evaluate_rules_and_examples(fh.read()) == 12
-
-
-with open("data/19.txt") as fh:
-    assert evaluate_rules_and_examples(fh.read()) == 102
+def test_examples():
+    assert evaluate_rules_and_examples(TEST_STR) == 2
+    assert evaluate_rules_and_examples(read_data_file(2020, "test/19_part1.txt")) == 3
+    assert evaluate_rules_and_examples(with_looping_rules(read_data_file(2020, "test/19_part1.txt"))) == 12
 
 
-with open("data/19_2.txt") as fh:
-    assert evaluate_rules_and_examples(fh.read()) == 318
+def test_answers():
+    input_str = read_input(2020, 19)
+    assert part1(input_str) == 102
+    assert part2(input_str) == 318
@@ -6,6 +6,9 @@ from collections import defaultdict, namedtuple
 from copy import copy
 import attr
 
+from advent import read_data_file, read_input
+from advent.cache import cached_parse
+
 
 class Pixel(Enum):
     ACTIVE = "#"
@@ -133,6 +136,7 @@ class Tile:
         return cls(id_num, grid)
 
 
+@cached_parse
 def read_tiles(tiles_str):
     tiles = []
     lines = tiles_str.strip().split("\n")
@@ -150,7 +154,7 @@ def read_tiles(tiles_str):
     return tiles
 
 
-def piece_tiles_together(tiles, write_file=None):
+def piece_tiles_together(tiles):
     all_tiles = {tile.id_num: copy(tile) for tile in tiles}
     placed_tile_ids = [list(all_tiles.keys())[0]]
 
@@ -213,8 +217,6 @@ def piece_tiles_together(tiles, write_file=None):
         return start_tile
 
     while len(list(remaining_tile_ids())) > 0:
-        print("NEW ROUND", len(placed_tile_ids), "/", len(all_tiles))
-
         placed_this_round = False
 
         for placed_tile_id in placed_tile_ids:
@@ -280,12 +282,6 @@ def piece_tiles_together(tiles, write_file=None):
 
         return grid
 
-    if write_file:
-        as_grid = get_as_grid()
-        for grid_row in as_grid:
-            for row in range(grid_row[0].grid_size):
-                
-
     return (
         get_grid_corner(
             list(all_tiles.values())[0], NeighborDirection.UP, NeighborDirection.LEFT
@@ -316,24 +312,22 @@ Tile 2311:
 ..###..###
 """
 
-TEST_TILE = Tile.from_str(TEST_TILE_STR)
+def part1(tiles_str):
+    return piece_tiles_together(read_tiles(tiles_str))
 
-assert TEST_TILE.rotated(2).rotated(2) == TEST_TILE
-assert TEST_TILE.flipped_x().flipped_x() == TEST_TILE
-assert TEST_TILE.flipped_y().flipped_y() == TEST_TILE
-assert TEST_TILE.flipped_x().flipped_y().rotated(2) == TEST_TILE
-assert TEST_TILE.rotated(1) != TEST_TILE
-assert TEST_TILE.rotated(2) != TEST_TILE
 
-TEST_TILES = []
-with open("data/test/20.txt") as fh:
-    TEST_TILES = read_tiles(fh.read())
+def test_examples():
+    test_tile = Tile.from_str(TEST_TILE_STR)
 
-assert piece_tiles_together(TEST_TILES) == 20899048083289
+    assert test_tile.rotated(2).rotated(2) == test_tile
+    assert test_tile.flipped_x().flipped_x() == test_tile
+    assert test_tile.flipped_y().flipped_y() == test_tile
+    assert test_tile.flipped_x().flipped_y().rotated(2) == test_tile
+    assert test_tile.rotated(1) != test_tile
+    assert test_tile.rotated(2) != test_tile
 
+    assert piece_tiles_together(read_tiles(read_data_file(2020, "test/20.txt"))) == 20899048083289
 
-TILES = []
-with open("data/20.txt") as fh:
-    TILES = read_tiles(fh.read())
 
-assert piece_tiles_together(TILES) == 28057939502729
+def test_answers():
+    assert part1(read_input(2020, 20)) == 28057939502729
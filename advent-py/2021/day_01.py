@@ -23,15 +23,21 @@ def overlay_sliding_window(measurements):
         yield sum(tup)
 
 
-def get_measurements(filename):
-    with open(filename) as f:
-        return [int(line.strip()) for line in f if line]
+def parse_measurements(measurements_str):
+    return [int(line.strip()) for line in measurements_str.split()]
+
+
+def part1(measurements_str):
+    return count_increasing_depths(parse_measurements(measurements_str))
+
+
+def part2(measurements_str):
+    return count_increasing_depths(overlay_sliding_window(parse_measurements(measurements_str)))
 
 
 TEST_MEASUREMENTS = [199, 200, 208, 210, 200, 207, 240, 269, 260, 263]
 
-assert count_increasing_depths(TEST_MEASUREMENTS) == 7
-assert count_increasing_depths(overlay_sliding_window(TEST_MEASUREMENTS)) == 5
 
-print(count_increasing_depths(get_measurements("data/day_01.txt")))
-print(count_increasing_depths(overlay_sliding_window(get_measurements("data/day_01.txt"))))
+def test_examples():
+    assert count_increasing_depths(TEST_MEASUREMENTS) == 7
+    assert count_increasing_depths(overlay_sliding_window(TEST_MEASUREMENTS)) == 5
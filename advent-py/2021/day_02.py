@@ -43,10 +43,12 @@ def follow_course_part2(course_gen):
     return pos_x * depth
 
 
-def read_course_from_file(filename):
-    with open(filename) as f:
-        for line in f:
-            yield line
+def part1(course_str):
+    return follow_course_part1(course_str.split("\n"))
+
+
+def part2(course_str):
+    return follow_course_part2(course_str.split("\n"))
 
 
 COURSE_STR = """
@@ -58,8 +60,7 @@ down 8
 forward 2
 """
 
-assert follow_course_part1(COURSE_STR.split("\n")) == 150
-assert follow_course_part2(COURSE_STR.split("\n")) == 900
 
-print(follow_course_part1(read_course_from_file("data/day_02.txt")))
-print(follow_course_part2(read_course_from_file("data/day_02.txt")))
+def test_examples():
+    assert follow_course_part1(COURSE_STR.split("\n")) == 150
+    assert follow_course_part2(COURSE_STR.split("\n")) == 900
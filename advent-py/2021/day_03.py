@@ -70,9 +70,12 @@ def life_support_rating(report):
     return oxygen_rating * co2_rating
 
 
-def read_all_lines(filename):
-    with open(filename) as f:
-        return f.readlines()
+def part1(report_str):
+    return power_consumption(report_str.strip().split("\n"))
+
+
+def part2(report_str):
+    return life_support_rating(report_str.strip().split("\n"))
 
 
 REPORT_STR = """
@@ -90,8 +93,7 @@ REPORT_STR = """
 01010
 """
 
-assert power_consumption(REPORT_STR.strip().split("\n")) == 198
-assert life_support_rating(REPORT_STR.strip().split("\n")) == 230
 
-print(power_consumption(read_all_lines("data/day_03.txt")))
-print(life_support_rating(read_all_lines("data/day_03.txt")))
+def test_examples():
+    assert power_consumption(REPORT_STR.strip().split("\n")) == 198
+    assert life_support_rating(REPORT_STR.strip().split("\n")) == 230
@@ -106,6 +106,14 @@ class BingoGame:
                         return number * board.score()
 
 
+def part1(boards_str):
+    return BingoGame.init_from_str(boards_str).get_first_winner()
+
+
+def part2(boards_str):
+    return BingoGame.init_from_str(boards_str).get_last_winner()
+
+
 TEST_STR = """
 7,4,9,5,11,17,23,2,0,14,21,24,10,16,13,6,15,25,12,22,18,20,8,19,3,26,1
 
@@ -129,10 +137,7 @@ TEST_STR = """
 """
 
 
-TEST_GAME = BingoGame.init_from_str(TEST_STR)
-assert TEST_GAME.get_first_winner() == 4512
-assert TEST_GAME.get_last_winner() == 1924
-with open("data/day_04.txt") as f:
-    GAME = BingoGame.init_from_str(f.read())
-    print(GAME.get_first_winner())
-    print(GAME.get_last_winner())
+def test_examples():
+    test_game = BingoGame.init_from_str(TEST_STR)
+    assert test_game.get_first_winner() == 4512
+    assert test_game.get_last_winner() == 1924
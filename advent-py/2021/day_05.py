@@ -73,6 +73,14 @@ def count_dangerous_areas(vent_lines, include_diagonals=False):
     return len([loc for loc in crosses if crosses[loc] > 1])
 
 
+def part1(vents_str):
+    return count_dangerous_areas(parse_lines(vents_str))
+
+
+def part2(vents_str):
+    return count_dangerous_areas(parse_lines(vents_str), include_diagonals=True)
+
+
 TEST_LINES = """
 0,9 -> 5,9
 8,0 -> 0,8
@@ -86,13 +94,8 @@ TEST_LINES = """
 5,5 -> 8,2
 """
 
-TEST_VENT_LINES = parse_lines(TEST_LINES)
-assert count_dangerous_areas(TEST_VENT_LINES) == 5
-assert count_dangerous_areas(TEST_VENT_LINES, include_diagonals=True) == 12
-
-
-with open("data/day_05.txt") as f:
-    VENT_LINES = parse_lines(f.read())
 
-print(count_dangerous_areas(VENT_LINES))
-print(count_dangerous_areas(VENT_LINES, include_diagonals=True))
+def test_examples():
+    test_vent_lines = parse_lines(TEST_LINES)
+    assert count_dangerous_areas(test_vent_lines) == 5
+    assert count_dangerous_areas(test_vent_lines, include_diagonals=True) == 12
@@ -1,5 +1,7 @@
 """ day 6: lanternfish """
 
+from advent import read_input
+
 
 class FishGenerations(list):
     @classmethod
@@ -28,14 +30,24 @@ class FishGenerations(list):
             self[6] += fish_at_timer0
 
 
+def part1(fish_str):
+    return FishGenerations.from_str(fish_str).num_fish_after_days(80)
+
+
+def part2(fish_str):
+    return FishGenerations.from_str(fish_str).num_fish_after_days(256)
+
+
 TEST_STARTING_FISH = "3,4,3,1,2"
 
-assert FishGenerations.from_str(TEST_STARTING_FISH).num_fish_after_days(18) == 26
-assert FishGenerations.from_str(TEST_STARTING_FISH).num_fish_after_days(80) == 5934
-assert FishGenerations.from_str(TEST_STARTING_FISH).num_fish_after_days(256) == 26984457539
 
-with open("data/day_06.txt") as f:
-    STARTING_FISH = f.read()
+def test_examples():
+    assert FishGenerations.from_str(TEST_STARTING_FISH).num_fish_after_days(18) == 26
+    assert FishGenerations.from_str(TEST_STARTING_FISH).num_fish_after_days(80) == 5934
+    assert FishGenerations.from_str(TEST_STARTING_FISH).num_fish_after_days(256) == 26984457539
+
 
-assert FishGenerations.from_str(STARTING_FISH).num_fish_after_days(80) == 380758
-assert FishGenerations.from_str(STARTING_FISH).num_fish_after_days(256) == 1710623015163
+def test_answers():
+    fish_str = read_input(2021, 6)
+    assert part1(fish_str) == 380758
+    assert part2(fish_str) == 1710623015163
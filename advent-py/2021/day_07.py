@@ -2,6 +2,8 @@
 
 import math
 
+from advent import read_input
+
 
 def fuel_part1(steps):
     return abs(steps)
@@ -64,12 +66,21 @@ def parse_crabs(crab_str):
     return [int(x) for x in crab_str.strip().split(",")]
 
 
-TEST_CRABS = parse_crabs("16,1,2,0,4,2,7,1,2,14")
-assert min_fuel_to_align(TEST_CRABS, fuel_part1) == 37
-assert min_fuel_to_align(TEST_CRABS, fuel_part2) == 168
+def part1(crab_str):
+    return min_fuel_to_align(parse_crabs(crab_str), fuel_part1)
+
+
+def part2(crab_str):
+    return min_fuel_to_align(parse_crabs(crab_str), fuel_part2)
+
+
+def test_examples():
+    test_crabs = parse_crabs("16,1,2,0,4,2,7,1,2,14")
+    assert min_fuel_to_align(test_crabs, fuel_part1) == 37
+    assert min_fuel_to_align(test_crabs, fuel_part2) == 168
 
-with open("data/day_07.txt") as f:
-    CRABS = parse_crabs(f.read())
 
-assert min_fuel_to_align(CRABS, fuel_part1) == 344297
-assert min_fuel_to_align(CRABS, fuel_part2) == 97164301
+def test_answers():
+    crab_str = read_input(2021, 7)
+    assert part1(crab_str) == 344297
+    assert part2(crab_str) == 97164301
@@ -1,5 +1,7 @@
 """ day 8: seven segment search """
 
+from advent import read_input
+
 
 def count_easy_digits(entry_gen):
     easy_digit_lengths = [2, 4, 3, 7]
@@ -89,6 +91,14 @@ def parse_entries(entry_str):
         yield parse_entry(line)
 
 
+def part1(entry_str):
+    return count_easy_digits(parse_entries(entry_str))
+
+
+def part2(entry_str):
+    return sum_output_digits(parse_entries(entry_str))
+
+
 TEST_ENTRY = "acedgfb cdfbe gcdfa fbcad dab cefabd cdfgeb eafb cagedb ab |cdfeb fcadb cdfeb cdbaf"
 TEST_ENTRIES = """
 be cfbegad cbdgef fgaecd cgeb fdcge agebfd fecdb fabcd edb |fdgacbe cefdb cefbgd gcbe
@@ -103,17 +113,16 @@ egadfb cdbfeg cegd fecab cgb gbdefca cg fgcdab egfdb bfceg |gbdfcae bgc cg cgb
 gcafb gcf dcaebfg ecagb gf abcdeg gaef cafbge fdbac fegbdc |fgae cfgab fg bagce
 """
 
-assert count_easy_digits(parse_entries(TEST_ENTRY)) == 0
-assert count_easy_digits(parse_entries(TEST_ENTRIES)) == 26
-
-
-with open("data/day_08.txt") as f:
-    ENTRIES = f.read()
 
-assert count_easy_digits(parse_entries(ENTRIES)) == 367
+def test_examples():
+    assert count_easy_digits(parse_entries(TEST_ENTRY)) == 0
+    assert count_easy_digits(parse_entries(TEST_ENTRIES)) == 26
 
+    assert sum_output_digits(parse_entries(TEST_ENTRY)) == 5353
+    assert sum_output_digits(parse_entries(TEST_ENTRIES)) == 61229
 
-assert sum_output_digits(parse_entries(TEST_ENTRY)) == 5353
-assert sum_output_digits(parse_entries(TEST_ENTRIES)) == 61229
 
-assert sum_output_digits(parse_entries(ENTRIES)) == 974512
+def test_answers():
+    entry_str = read_input(2021, 8)
+    assert part1(entry_str) == 367
+    assert part2(entry_str) == 974512
@@ -1,55 +1,51 @@
 """ day 9: smoke basin """
 
 from collections import namedtuple
-from queue import Queue
 from functools import reduce
 
+from advent.grid import ORTHOGONAL, Grid2D
+from advent.imports import lazy_import
+
+np = lazy_import("numpy")
+
 Location = namedtuple("Location", ["x", "y"])
 
+# anything off the map is higher than every point on it
+OFF_MAP_HEIGHT = 10
+
 
 class HeightMap:
     def __init__(self, heightmap):
         self.heightmap = heightmap
 
-    def adjacent_locations(self, loc):
-        for (delx, dely) in [(0, -1), (0, 1), (1, 0), (-1, 0)]:
-            nearby = Location(loc.x + delx, loc.y + dely)
-            if nearby in self.heightmap:
-                yield nearby
+    def low_point_mask(self):
+        nearby = self.heightmap.neighbors(ORTHOGONAL, fill=OFF_MAP_HEIGHT)
+        return (self.heightmap.cells < nearby).all(axis=0)
 
     def low_points(self):
-        for loc in self.heightmap:
-            is_lowest = True
-            for nearby in self.adjacent_locations(loc):
-                if self.heightmap[nearby] <= self.heightmap[loc]:
-                    is_lowest = False
-                    break
-
-            if is_lowest:
-                yield loc
+        for (y, x) in np.argwhere(self.low_point_mask()):
+            yield Location(int(x), int(y))
 
     def basin_sizes(self):
-        # each basin has a single low point, so start from there and search
-        # outward to find the boundary
-        for low_point in self.low_points():
-            basin_locs = set()
-            loc_queue = Queue()
-            loc_queue.put(low_point)
-
-            while not loc_queue.empty():
-                loc = loc_queue.get()
-                basin_locs.add(loc)
+        # each basin has a single low point, so label the low points and
+        # let the labels spread outward until they hit the 9s
+        in_basin = self.heightmap.cells != 9
+        labels = np.zeros(self.heightmap.cells.shape, dtype=np.int64)
+        low_points = self.low_point_mask()
+        labels[low_points] = np.arange(1, np.count_nonzero(low_points) + 1)
 
-                for near in self.adjacent_locations(loc):
-                    if near in basin_locs or self.heightmap[near] == 9:
-                        continue
+        while True:
+            spread = Grid2D(labels).neighbors(ORTHOGONAL).max(axis=0)
+            new_labels = np.where(in_basin & (labels == 0), spread, labels)
+            if np.array_equal(new_labels, labels):
+                break
 
-                    loc_queue.put(near)
+            labels = new_labels
 
-            yield len(basin_locs)
+        return np.bincount(labels.ravel())[1:].tolist()
 
     def total_risk_of_low_points(self):
-        return sum([1 + self.heightmap[loc] for loc in self.low_points()])
+        return int((self.heightmap.cells[self.low_point_mask()] + 1).sum())
 
     def largest_basins_rating(self):
         largest_basins = sorted(list(self.basin_sizes()), reverse=True)[0:3]
@@ -57,14 +53,15 @@ class HeightMap:
 
     @classmethod
     def from_str(cls, map_str):
-        heightmap = {}
-        map_lines = [line.strip() for line in map_str.split("\n") if line]
+        return cls(Grid2D.from_str(map_str))
 
-        for (y, line) in enumerate(map_lines):
-            for (x, height) in enumerate(line):
-                heightmap[Location(x, y)] = int(height)
 
-        return cls(heightmap)
+def part1(map_str):
+    return HeightMap.from_str(map_str).total_risk_of_low_points()
+
+
+def part2(map_str):
+    return HeightMap.from_str(map_str).largest_basins_rating()
 
 
 TEST_MAP = """
@@ -75,13 +72,8 @@ TEST_MAP = """
 9899965678
 """
 
-assert len(list(HeightMap.from_str(TEST_MAP).low_points())) == 4
-assert HeightMap.from_str(TEST_MAP).total_risk_of_low_points() == 15
-assert HeightMap.from_str(TEST_MAP).largest_basins_rating() == 1134
-
-
-with open("data/day_09.txt") as f:
-    MAP = f.read()
 
-print(HeightMap.from_str(MAP).total_risk_of_low_points())
-print(HeightMap.from_str(MAP).largest_basins_rating())
+def test_examples():
+    assert len(list(HeightMap.from_str(TEST_MAP).low_points())) == 4
+    assert HeightMap.from_str(TEST_MAP).total_risk_of_low_points() == 15
+    assert HeightMap.from_str(TEST_MAP).largest_basins_rating() == 1134
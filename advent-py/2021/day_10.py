@@ -3,6 +3,8 @@
 from queue import LifoQueue
 from collections import namedtuple
 
+from advent import read_input
+
 BracketSet = namedtuple("BracketSet", ["left", "right", "corrupt_points", "complete_points"])
 BRACKET_SETS = [
     BracketSet("(", ")", 3, 1),
@@ -92,6 +94,14 @@ def best_score(lines):
     return scores[len(scores) // 2]
 
 
+def part1(lines):
+    return get_total_corrupt_score(lines)
+
+
+def part2(lines):
+    return best_score(lines)
+
+
 TEST_LINES = """
 [({(<(())[]>[[{[]{<()<>>
 [(()[<>])]({[<{<<[]>>(
@@ -105,11 +115,13 @@ TEST_LINES = """
 <{([{{}}[<[[[<>{}]]]>[]]
 """
 
-assert get_total_corrupt_score(TEST_LINES) == 26397
-assert best_score(TEST_LINES) == 288957
 
-with open("data/day_10.txt") as f:
-    LINES = f.read()
+def test_examples():
+    assert get_total_corrupt_score(TEST_LINES) == 26397
+    assert best_score(TEST_LINES) == 288957
+
 
-assert get_total_corrupt_score(LINES) == 294195
-assert best_score(LINES) == 3490802734
+def test_answers():
+    lines = read_input(2021, 10)
+    assert part1(lines) == 294195
+    assert part2(lines) == 3490802734
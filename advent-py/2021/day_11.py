@@ -1,59 +1,31 @@
 """ day 11: dumbo octobus """
 
-import itertools
-from collections import namedtuple
+from advent import read_input
+from advent.grid import Grid2D
+from advent.imports import lazy_import
 
-Location = namedtuple("Location", ["x", "y"])
+np = lazy_import("numpy")
 
 
 class Octopi:
     def __init__(self, grid):
         self.grid = grid
 
-    def nearby(self, loc):
-        for (delx, dely) in itertools.product(range(-1, 2), range(-1, 2)):
-            if delx == 0 and dely == 0:
-                continue
-
-            nearby = Location(loc.x + delx, loc.y + dely)
-            if nearby in self.grid:
-                yield nearby
-
     @classmethod
     def from_str(cls, grid_str):
-        grid_lst = [line.strip() for line in grid_str.strip().split("\n") if line]
-        grid = {}
-
-        for (y, line) in enumerate(grid_lst):
-            for (x, energy) in enumerate(line):
-                grid[Location(x, y)] = int(energy)
-
-        return cls(grid)
+        return cls(Grid2D.from_str(grid_str))
 
     def step(self):
-        for loc in self.grid:
-            self.grid[loc] += 1
-
-        flashed_locations = set()
-        new_flashes = True
-
-        while new_flashes:
-            new_flashes = False
-            for loc in self.grid:
-                if loc in flashed_locations:
-                    continue
+        energy = self.grid.cells
+        energy += 1
 
-                if self.grid[loc] > 9:
-                    flashed_locations.add(loc)
-                    new_flashes = True
+        flashed = np.zeros(energy.shape, dtype=bool)
+        while (new_flashes := (energy > 9) & ~flashed).any():
+            flashed |= new_flashes
+            energy += Grid2D(new_flashes).count_neighbors(fill=False)
 
-                    for nearby_loc in self.nearby(loc):
-                        self.grid[nearby_loc] += 1
-
-        for loc in flashed_locations:
-            self.grid[loc] = 0
-
-        return len(flashed_locations)
+        energy[flashed] = 0
+        return int(np.count_nonzero(flashed))
 
     def total_flashes(self, num_steps):
         return sum([self.step() for _ in range(num_steps)])
@@ -64,10 +36,18 @@ class Octopi:
             step += 1
             flashes = self.step()
 
-            if flashes == len(self.grid):
+            if flashes == self.grid.size:
                 return step
 
 
+def part1(grid_str):
+    return Octopi.from_str(grid_str).total_flashes(100)
+
+
+def part2(grid_str):
+    return Octopi.from_str(grid_str).first_synchronized_flash()
+
+
 TEST_STR = """
 5483143223
 2745854711
@@ -81,12 +61,13 @@ TEST_STR = """
 5283751526
 """
 
-with open("data/day_11.txt") as f:
-    REAL_STR = f.read()
 
+def test_examples():
+    assert Octopi.from_str(TEST_STR).total_flashes(100) == 1656
+    assert Octopi.from_str(TEST_STR).first_synchronized_flash() == 195
 
-assert Octopi.from_str(TEST_STR).total_flashes(100) == 1656
-assert Octopi.from_str(REAL_STR).total_flashes(100) == 1717
 
-assert Octopi.from_str(TEST_STR).first_synchronized_flash() == 195
-assert Octopi.from_str(REAL_STR).first_synchronized_flash() == 476
+def test_answers():
+    grid_str = read_input(2021, 11)
+    assert part1(grid_str) == 1717
+    assert part2(grid_str) == 476
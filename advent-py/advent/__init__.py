@@ -0,0 +1,4 @@
+""" shared tooling for running the python solutions """
+
+from .inputs import input_path, read_data_file, read_input
+from .solvers import available_days, iter_solvers, load_module, solve, solve_functions
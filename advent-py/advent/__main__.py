@@ -0,0 +1,319 @@
+""" command line runner: `python -m advent run 2020 9` """
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+from .benchmark import DEFAULT_BASELINE, benchmark_solver, find_regressions, load_baseline, save_baseline
+from .cache import NO_CACHE_ENV, NO_MEMO_ENV
+from .daemon import DEFAULT_SOCKET, ask, serve
+from .generators import available_generators, generate
+from .imports import module_import_times
+from .inputs import read_input
+from .pool import run_all
+from .profiling import profile_day
+from .scaling import DEFAULT_SCALES, describe_growth, fit_growth_exponent, measure_scaling
+from .solvers import PARTS, YEARS, available_days, iter_solvers, load_module, module_tests, solve_functions
+
+
+def format_answer(answer):
+    answer_str = str(answer)
+    if "\n" in answer_str:
+        return "\n" + answer_str
+
+    return answer_str
+
+
+def selected_days(year, days):
+    return days if days else available_days(year)
+
+
+def cmd_run(args):
+    if args.jobs:
+        return run_parallel(args)
+    if args.profile:
+        return run_profiled(args)
+
+    for year in args.years:
+        for day in selected_days(year, args.days):
+            functions = solve_functions(load_module(year, day))
+            puzzle_input = read_input(year, day)
+
+            for part in args.parts:
+                if part not in functions:
+                    continue
+
+                start = time.perf_counter()
+                answer = functions[part](puzzle_input)
+                elapsed = time.perf_counter() - start
+
+                print(f"{year} day {day:02} part {part} ({elapsed * 1000:.1f}ms): {format_answer(answer)}")
+
+    return 0
+
+
+def run_parallel(args):
+    start = time.perf_counter()
+    jobs = list(iter_solvers(args.years, args.days, args.parts))
+    results = run_all(jobs, max_workers=args.jobs, timeout=args.timeout)
+    wall_time = time.perf_counter() - start
+
+    for result in results:
+        label = f"{result.year} day {result.day:02} part {result.part} ({result.elapsed * 1000:.1f}ms)"
+        if result.status == "ok":
+            print(f"{label}: {format_answer(result.answer)}")
+        else:
+            print(f"{label}: {result.status.upper()}" + (f" {result.answer}" if result.answer else ""))
+
+    failures = [result for result in results if result.status != "ok"]
+    cpu_time = sum(result.elapsed for result in results)
+    print(f"{len(results) - len(failures)}/{len(results)} solved in {wall_time:.1f}s ({cpu_time:.1f}s of solver time)")
+
+    return int(len(failures) > 0)
+
+
+def run_profiled(args):
+    if len(args.years) != 1 or len(args.days) != 1:
+        print("--profile needs exactly one year and day")
+        return 1
+
+    year, day = args.years[0], args.days[0]
+    answers, report_path = profile_day(year, day, args.parts, top_n=args.top, report_path=args.report)
+    for part, answer in answers.items():
+        print(f"{year} day {day:02} part {part}: {format_answer(answer)}")
+
+    print(f"profile written to {report_path}")
+    return 0
+
+
+def cmd_test(args):
+    failures = 0
+    for year in args.years:
+        for day in selected_days(year, args.days):
+            for name, test_fn in module_tests(load_module(year, day)):
+                try:
+                    test_fn()
+                    status = "ok"
+                except AssertionError:
+                    status = "FAILED"
+                    failures += 1
+                except Exception as err:  # pylint: disable=broad-except
+                    # a crashing test (missing data file, solver bug) is a failure too, not the end of the run
+                    status = f"FAILED {err!r}"
+                    failures += 1
+
+                print(f"{year} day {day:02} {name}: {status}")
+
+    return int(failures > 0)
+
+
+def cmd_bench(args):
+    results = []
+    for year in args.years:
+        for day in selected_days(year, args.days):
+            for part in args.parts:
+                if part not in solve_functions(load_module(year, day)):
+                    continue
+
+                result = benchmark_solver(year, day, part, warmup=args.warmup, repeats=args.repeats)
+                results.append(result)
+                print(f"{year} day {day:02} part {part}: median {result.median * 1000:.1f}ms, p95 {result.p95 * 1000:.1f}ms")
+
+    if args.save:
+        save_baseline(results, args.baseline)
+        print(f"saved baseline to {args.baseline}")
+        return 0
+
+    if not args.baseline.exists():
+        print(f"no baseline at {args.baseline}, run with --save to create one")
+        return 0
+
+    regressions = list(find_regressions(results, load_baseline(args.baseline), args.threshold))
+    for regression in regressions:
+        print(
+            f"REGRESSION {regression.key}: {regression.baseline * 1000:.1f}ms -> {regression.current * 1000:.1f}ms "
+            f"({regression.ratio:.2f}x)"
+        )
+
+    return int(len(regressions) > 0)
+
+
+def cmd_generate(args):
+    text = generate(args.year, args.day, args.scale, args.seed)
+    if args.output:
+        with open(args.output, "w") as fh:
+            fh.write(text)
+    else:
+        print(text)
+
+    return 0
+
+
+def cmd_scale(args):
+    for year in args.years:
+        for day in selected_days(year, args.days):
+            if (year, day) not in available_generators():
+                if args.days:
+                    print(f"{year} day {day:02}: no input generator")
+                continue
+
+            for part in args.parts:
+                if part not in solve_functions(load_module(year, day)):
+                    continue
+
+                points = measure_scaling(year, day, part, args.scales, args.budget)
+                for point in points:
+                    timing = f"{point.seconds * 1000:.1f}ms" if point.seconds is not None else "over budget"
+                    print(f"{year} day {day:02} part {part} x{point.scale:g} ({point.input_size} bytes): {timing}")
+
+                print(f"{year} day {day:02} part {part}: {describe_growth(fit_growth_exponent(points))}")
+
+    return 0
+
+
+def cmd_serve(args):
+    serve(args.socket)
+    return 0
+
+
+def cmd_ask(args):
+    if args.input and len(args.years) * len(args.days) != 1:
+        print("--input needs exactly one year and day")
+        return 1
+
+    requests = [
+        (year, day, part, args.input) for year in args.years for day in selected_days(year, args.days) for part in args.parts
+    ]
+
+    failures = 0
+    for (year, day, part, _), response in zip(requests, ask(requests, args.socket)):
+        if "error" in response:
+            # days that only have one part aren't worth complaining about unless that part was asked for
+            if args.part or "has no solver" not in response["error"]:
+                print(f"{year} day {day:02} part {part}: ERROR {response['error']}")
+                failures += 1
+            continue
+
+        print(f"{year} day {day:02} part {part} ({response['seconds'] * 1000:.1f}ms): {format_answer(response['answer'])}")
+
+    return int(failures > 0)
+
+
+def cmd_imports(args):
+    over_budget = 0
+    for year in args.years:
+        for day in selected_days(year, args.days):
+            module_row, imported_rows = module_import_times(f"{year}.day_{day:02}")
+            total_ms = module_row.cumulative_us / 1000
+
+            flag = ""
+            if args.budget and total_ms > args.budget:
+                flag = f" OVER BUDGET ({args.budget:g}ms)"
+                over_budget += 1
+
+            print(f"{year} day {day:02}: {total_ms:.1f}ms to import{flag}")
+            for row in sorted(imported_rows, key=lambda row: row.self_us, reverse=True)[: args.top]:
+                print(f"    {row.self_us / 1000:7.1f}ms self {row.cumulative_us / 1000:7.1f}ms cumulative  {row.name}")
+
+    return int(over_budget > 0)
+
+
+def add_selection_args(parser):
+    parser.add_argument("year", type=int, nargs="?", choices=YEARS, help="defaults to every year")
+    parser.add_argument("days", type=int, nargs="*", help="defaults to every day in the year")
+    parser.add_argument("--no-cache", action="store_true", help="always re-parse inputs instead of using the cache")
+    parser.add_argument("--no-memo", action="store_true", help="recompute memoized answers of slow functions")
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(prog="advent", description="run advent of code solvers")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="solve puzzles and print the answers")
+    add_selection_args(run_parser)
+    run_parser.add_argument("--part", type=int, choices=PARTS, help="only run one part")
+    run_parser.add_argument("--jobs", type=int, help="solve in parallel across this many worker processes")
+    run_parser.add_argument("--timeout", type=float, help="with --jobs, seconds before giving up on a solver")
+    run_parser.add_argument("--profile", action="store_true", help="profile time and memory of a single day")
+    run_parser.add_argument("--top", type=int, default=25, help="with --profile, how many functions to report")
+    run_parser.add_argument("--report", type=Path, help="with --profile, where to write the report")
+    run_parser.set_defaults(fn=cmd_run)
+
+    test_parser = subparsers.add_parser("test", help="run the example tests in each solver module")
+    add_selection_args(test_parser)
+    test_parser.set_defaults(fn=cmd_test)
+
+    bench_parser = subparsers.add_parser("bench", help="time solvers and compare against the stored baseline")
+    add_selection_args(bench_parser)
+    bench_parser.add_argument("--part", type=int, choices=PARTS, help="only run one part")
+    bench_parser.add_argument("--warmup", type=int, default=1, help="untimed runs before measuring")
+    bench_parser.add_argument("--repeats", type=int, default=5, help="timed runs per solver")
+    bench_parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE, help="baseline json file")
+    bench_parser.add_argument("--save", action="store_true", help="write the results as the new baseline")
+    bench_parser.add_argument(
+        "--threshold", type=float, default=1.25, help="fail when a median is this many times slower than baseline"
+    )
+    bench_parser.set_defaults(fn=cmd_bench)
+
+    generate_parser = subparsers.add_parser("generate", help="write a synthetic input for a day")
+    generate_parser.add_argument("year", type=int, choices=YEARS)
+    generate_parser.add_argument("day", type=int)
+    generate_parser.add_argument("--scale", type=float, default=1, help="size relative to a real input")
+    generate_parser.add_argument("--seed", type=int, default=0)
+    generate_parser.add_argument("-o", "--output", type=Path, help="defaults to stdout")
+    generate_parser.set_defaults(fn=cmd_generate, days=[], part=None, no_cache=False, no_memo=False)
+
+    scale_parser = subparsers.add_parser("scale", help="time solvers on bigger and bigger generated inputs")
+    add_selection_args(scale_parser)
+    scale_parser.add_argument("--part", type=int, choices=PARTS, help="only run one part")
+    scale_parser.add_argument("--scales", type=float, nargs="+", default=DEFAULT_SCALES)
+    scale_parser.add_argument("--budget", type=float, default=60, help="seconds per run before giving up on a day")
+    scale_parser.set_defaults(fn=cmd_scale)
+
+    serve_parser = subparsers.add_parser("serve", help="keep solvers warm in a daemon listening on a unix socket")
+    serve_parser.add_argument("--socket", type=Path, default=DEFAULT_SOCKET)
+    serve_parser.set_defaults(fn=cmd_serve, year=None, days=[], part=None, no_cache=False, no_memo=False)
+
+    ask_parser = subparsers.add_parser("ask", help="solve puzzles using a running daemon")
+    add_selection_args(ask_parser)
+    ask_parser.add_argument("--part", type=int, choices=PARTS, help="only run one part")
+    ask_parser.add_argument("--input", type=Path, help="solve this file instead of the real input")
+    ask_parser.add_argument("--socket", type=Path, default=DEFAULT_SOCKET)
+    ask_parser.set_defaults(fn=cmd_ask)
+
+    imports_parser = subparsers.add_parser("imports", help="report how long each solver module takes to import")
+    add_selection_args(imports_parser)
+    imports_parser.add_argument("--top", type=int, default=5, help="how many of the slowest imports to list")
+    imports_parser.add_argument("--budget", type=float, help="fail if a module takes more than this many ms")
+    imports_parser.set_defaults(fn=cmd_imports, part=None)
+
+    args = parser.parse_args(argv)
+    args.years = [args.year] if args.year else list(YEARS)
+    args.parts = [args.part] if getattr(args, "part", None) else list(PARTS)
+    if args.days and not args.year:
+        parser.error("a year is required when selecting days")
+
+    # set in the environment so pool workers pick it up too
+    if args.no_cache:
+        os.environ[NO_CACHE_ENV] = "1"
+    if args.no_memo or args.command in ["bench", "scale"]:
+        os.environ[NO_MEMO_ENV] = "1"
+    if args.command == "run" and args.profile:
+        os.environ[NO_MEMO_ENV] = "1"
+        os.environ[NO_CACHE_ENV] = "1"
+    if args.command == "scale":
+        # generated inputs are one-offs, no point filling the cache with them
+        os.environ[NO_CACHE_ENV] = "1"
+
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    return args.fn(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
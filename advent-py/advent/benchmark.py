@@ -0,0 +1,102 @@
+""" timing solvers and comparing against a stored baseline """
+
+import json
+import statistics
+import time
+
+import attr
+
+from .inputs import ROOT, read_input
+from .solvers import load_module, solve_functions
+
+DEFAULT_BASELINE = ROOT / "benchmarks" / "baseline.json"
+
+
+def solver_key(year, day, part):
+    return f"{year}/{day:02}/{part}"
+
+
+def percentile(timings, pct):
+    """nearest-rank percentile, so a handful of repeats still gives a real measurement"""
+
+    ordered = sorted(timings)
+    rank = max(1, -(-pct * len(ordered) // 100))
+    return ordered[rank - 1]
+
+
+@attr.s
+class BenchResult:
+    year = attr.ib()
+    day = attr.ib()
+    part = attr.ib()
+    timings = attr.ib(factory=list)
+
+    @property
+    def key(self):
+        return solver_key(self.year, self.day, self.part)
+
+    @property
+    def median(self):
+        return statistics.median(self.timings)
+
+    @property
+    def p95(self):
+        return percentile(self.timings, 95)
+
+    def to_dict(self):
+        return {"median": self.median, "p95": self.p95, "repeats": len(self.timings)}
+
+
+@attr.s
+class Regression:
+    key = attr.ib()
+    baseline = attr.ib()
+    current = attr.ib()
+
+    @property
+    def ratio(self):
+        return self.current / self.baseline
+
+
+def time_once(solve_fn, puzzle_input):
+    start = time.perf_counter()
+    solve_fn(puzzle_input)
+    return time.perf_counter() - start
+
+
+def benchmark_solver(year, day, part, warmup=1, repeats=5):
+    solve_fn = solve_functions(load_module(year, day))[part]
+    puzzle_input = read_input(year, day)
+
+    for _ in range(warmup):
+        solve_fn(puzzle_input)
+
+    return BenchResult(year, day, part, [time_once(solve_fn, puzzle_input) for _ in range(repeats)])
+
+
+def load_baseline(path=DEFAULT_BASELINE):
+    with open(path) as fh:
+        return json.load(fh)
+
+
+def save_baseline(results, path=DEFAULT_BASELINE):
+    """merge results into the baseline file, so benchmarking a single day doesn't drop the others"""
+
+    baseline = load_baseline(path) if path.exists() else {}
+    baseline.update({result.key: result.to_dict() for result in results})
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as fh:
+        json.dump(dict(sorted(baseline.items())), fh, indent=2)
+        fh.write("\n")
+
+
+def find_regressions(results, baseline, threshold):
+    """compare medians; a solver regresses when it's more than `threshold` times slower than its baseline"""
+
+    for result in results:
+        if result.key not in baseline:
+            continue
+
+        if result.median > baseline[result.key]["median"] * threshold:
+            yield Regression(result.key, baseline[result.key]["median"], result.median)
@@ -0,0 +1,197 @@
+""" on-disk caches keyed on the content of the puzzle input """
+
+import functools
+import hashlib
+import os
+import pickle
+import sys
+from collections import OrderedDict
+from contextlib import contextmanager
+
+import attr
+
+from .inputs import ROOT
+
+CACHE_DIR = ROOT / ".cache"
+
+# set to skip the parsed input cache entirely (e.g. when debugging a parser)
+NO_CACHE_ENV = "ADVENT_NO_CACHE"
+# set to recompute memoized answers, which benchmarking always does
+NO_MEMO_ENV = "ADVENT_NO_MEMO"
+
+
+def content_hash(data):
+    if isinstance(data, str):
+        data = data.encode()
+
+    return hashlib.sha256(data).hexdigest()
+
+
+@attr.s
+class DiskCache:
+    """pickled values in a directory; the least recently used files are evicted once it outgrows max_bytes"""
+
+    directory = attr.ib()
+    max_bytes = attr.ib()
+    disable_env = attr.ib(default=NO_CACHE_ENV)
+    # key -> pickled value, for long-running processes; see keep_in_memory
+    memory = attr.ib(default=None)
+
+    @property
+    def enabled(self):
+        return not os.environ.get(self.disable_env)
+
+    def path_for(self, key):
+        return self.directory / key[:2] / f"{key}.pickle"
+
+    def keep_in_memory(self):
+        """also hold entries in memory (still pickled, so every get is a fresh copy), up to max_bytes of them"""
+
+        if self.memory is None:
+            self.memory = OrderedDict()
+
+    def remember(self, key, data):
+        if self.memory is None:
+            return
+
+        self.memory[key] = data
+        self.memory.move_to_end(key)
+        total_size = sum(len(entry) for entry in self.memory.values())
+        while total_size > self.max_bytes and len(self.memory) > 1:
+            _, evicted = self.memory.popitem(last=False)
+            total_size -= len(evicted)
+
+    def get(self, key):
+        """returns (hit, value)"""
+
+        if self.memory is not None and key in self.memory:
+            self.memory.move_to_end(key)
+            return True, pickle.loads(self.memory[key])
+
+        path = self.path_for(key)
+        try:
+            with open(path, "rb") as fh:
+                data = fh.read()
+            value = pickle.loads(data)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return False, None
+
+        # bump the mtime so eviction treats this as recently used
+        os.utime(path)
+        self.remember(key, data)
+        return True, value
+
+    def set(self, key, value):
+        path = self.path_for(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        # write then rename, so a parallel run never reads a half-written file
+        data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "wb") as fh:
+            fh.write(data)
+        os.replace(tmp_path, path)
+
+        self.remember(key, data)
+        self.evict()
+
+    def entries(self):
+        if not self.directory.exists():
+            return []
+
+        return [(path, path.stat()) for path in self.directory.glob("*/*.pickle")]
+
+    def size(self):
+        return sum(stat.st_size for _, stat in self.entries())
+
+    def evict(self):
+        entries = sorted(self.entries(), key=lambda entry: entry[1].st_mtime)
+        total_size = sum(stat.st_size for _, stat in entries)
+
+        for path, stat in entries:
+            if total_size <= self.max_bytes:
+                break
+
+            path.unlink(missing_ok=True)
+            total_size -= stat.st_size
+
+    def clear(self):
+        for path, _ in self.entries():
+            path.unlink(missing_ok=True)
+
+
+@contextmanager
+def caches_disabled():
+    """skip both the parse cache and memoization inside the block"""
+
+    previous = {name: os.environ.get(name) for name in [NO_CACHE_ENV, NO_MEMO_ENV]}
+    os.environ.update({name: "1" for name in previous})
+    try:
+        yield
+    finally:
+        for name, value in previous.items():
+            if value is None:
+                del os.environ[name]
+            else:
+                os.environ[name] = value
+
+
+PARSE_CACHE = DiskCache(CACHE_DIR / "parsed", max_bytes=64 * 1024 * 1024)
+RESULT_CACHE = DiskCache(CACHE_DIR / "results", max_bytes=16 * 1024 * 1024, disable_env=NO_MEMO_ENV)
+
+
+def module_source_hash(module_name):
+    """editing a solver module invalidates everything cached from it"""
+
+    path = sys.modules[module_name].__file__
+    return file_hash(path, os.stat(path).st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=None)
+def file_hash(path, _mtime):
+    # keyed on the mtime too, so a module edited (and reloaded) under a long-running process gets hashed again
+    with open(path, "rb") as fh:
+        return content_hash(fh.read())
+
+
+def call_key(fn, args, kwargs):
+    return content_hash(
+        "\n".join([fn.__module__, fn.__qualname__, module_source_hash(fn.__module__)]).encode()
+        + pickle.dumps((args, kwargs))
+    )
+
+
+def cached_with(cache, fn):
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        if not cache.enabled:
+            return fn(*args, **kwargs)
+
+        key = call_key(fn, args, kwargs)
+        hit, value = cache.get(key)
+        if not hit:
+            value = fn(*args, **kwargs)
+            cache.set(key, value)
+
+        return value
+
+    return wrapper
+
+
+def cached_parse(fn):
+    """cache a parser's output on disk, keyed on a hash of the text it was given.
+
+    Every call gets a freshly unpickled copy, so callers are free to mutate what they get back.
+    """
+
+    return cached_with(PARSE_CACHE, fn)
+
+
+def memoize(fn):
+    """remember the results of an expensive pure function across runs.
+
+    Keyed on the function's qualified name, its arguments (which include the puzzle input) and the source of its
+    module, so re-running after editing one day only recomputes that day.
+    """
+
+    return cached_with(RESULT_CACHE, fn)
@@ -0,0 +1,129 @@
+""" a long-running solver process that answers requests over a unix socket
+
+Each request is one line of json, {"year": 2020, "day": 9, "part": 1, "input": "optional/path.txt"},
+and each response is one line of json with either the answer and timing or an error.
+"""
+
+import json
+import os
+import signal
+import socket
+import socketserver
+import sys
+import time
+from pathlib import Path
+
+from .cache import CACHE_DIR, PARSE_CACHE
+from .inputs import input_path
+from .solvers import load_module, solve_functions
+
+DEFAULT_SOCKET = CACHE_DIR / "daemon.sock"
+
+
+class WarmSolvers:
+    """
+    keeps solver modules, input text and parsed inputs in memory, reloading whatever changed on disk since the last
+    request
+    """
+
+    def __init__(self):
+        # module name -> mtime of its file when it was loaded
+        self.module_mtimes = {}
+        self.inputs = {}
+        # parsed inputs are keyed on the input and the parser's source as usual, just without going to disk
+        PARSE_CACHE.keep_in_memory()
+
+    def changed(self, module):
+        mtime = os.stat(module.__file__).st_mtime
+        return self.module_mtimes.setdefault(module.__name__, mtime) != mtime
+
+    def module(self, year, day):
+        loaded = [name for name in sys.modules if name.startswith(f"{year}.")]
+        if any(self.changed(sys.modules[name]) for name in loaded):
+            # days import from each other (all the intcode days use 2019 day 5), so reloading just the changed file
+            # would leave the others holding on to its old classes; drop the whole year and import it afresh
+            for name in loaded:
+                del sys.modules[name]
+                # modules imported since the last request haven't been recorded yet
+                self.module_mtimes.pop(name, None)
+
+        module = load_module(year, day)
+        for name in list(sys.modules):
+            if name.startswith(f"{year}."):
+                self.changed(sys.modules[name])
+
+        return module
+
+    def read(self, path):
+        mtime = os.stat(path).st_mtime
+        if path not in self.inputs or self.inputs[path][0] != mtime:
+            with open(path) as fh:
+                self.inputs[path] = (mtime, fh.read())
+
+        return self.inputs[path][1]
+
+    def solve(self, year, day, part, path=None):
+        solve_fn = solve_functions(self.module(year, day)).get(part)
+        if solve_fn is None:
+            raise LookupError(f"{year} day {day} has no solver for part {part}")
+
+        puzzle_input = self.read(Path(path) if path else input_path(year, day))
+
+        start = time.perf_counter()
+        answer = solve_fn(puzzle_input)
+        return answer, time.perf_counter() - start
+
+
+class SolverHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        for line in self.rfile:
+            try:
+                request = json.loads(line)
+                answer, seconds = self.server.solvers.solve(
+                    request["year"], request["day"], request["part"], request.get("input")
+                )
+                response = {"answer": str(answer), "seconds": seconds}
+            except Exception as err:  # pylint: disable=broad-except
+                response = {"error": repr(err)}
+
+            self.wfile.write((json.dumps(response) + "\n").encode())
+            self.wfile.flush()
+
+
+class SolverServer(socketserver.UnixStreamServer):
+    def __init__(self, socket_path):
+        self.solvers = WarmSolvers()
+        super().__init__(str(socket_path), SolverHandler)
+
+
+def serve(socket_path=DEFAULT_SOCKET):
+    socket_path.parent.mkdir(parents=True, exist_ok=True)
+    socket_path.unlink(missing_ok=True)
+
+    # exit cleanly on kill too, so the socket file gets removed
+    signal.signal(signal.SIGTERM, lambda _signum, _frame: sys.exit(0))
+
+    with SolverServer(socket_path) as server:
+        print(f"listening on {socket_path}", file=sys.stderr)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            socket_path.unlink(missing_ok=True)
+
+
+def ask(requests, socket_path=DEFAULT_SOCKET):
+    """send (year, day, part, input path or None) requests over one connection, yielding each response"""
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(str(socket_path))
+        with sock.makefile("rwb") as stream:
+            for year, day, part, path in requests:
+                request = {"year": year, "day": day, "part": part}
+                if path:
+                    request["input"] = str(Path(path).resolve())
+
+                stream.write((json.dumps(request) + "\n").encode())
+                stream.flush()
+                yield json.loads(stream.readline())
@@ -0,0 +1,19 @@
+""" synthetic puzzle inputs of any size, for seeing how the solvers scale """
+
+import random
+
+from . import y2015, y2019, y2020, y2021  # pylint: disable=unused-import
+from .registry import GENERATORS, generator
+
+
+def available_generators():
+    return sorted(GENERATORS)
+
+
+def generate(year, day, scale=1, seed=0):
+    """input text in the same format as the real input, about `scale` times as big"""
+
+    if (year, day) not in GENERATORS:
+        raise LookupError(f"No input generator for {year} day {day}")
+
+    return GENERATORS[(year, day)](scale, random.Random(seed))
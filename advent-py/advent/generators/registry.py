@@ -0,0 +1,24 @@
+""" the table of input generators, filled in by the per-year modules """
+
+import attr
+
+GENERATORS = {}
+
+
+@attr.s
+class Generator:
+    fn = attr.ib()
+    base_size = attr.ib()
+
+    def __call__(self, scale, rng):
+        return self.fn(max(1, round(self.base_size * scale)), rng)
+
+
+def generator(year, day, base_size):
+    """register fn(size, rng) -> input text; base_size is roughly the size of a real input, so scale=1 is realistic"""
+
+    def register(fn):
+        GENERATORS[(year, day)] = Generator(fn, base_size)
+        return fn
+
+    return register
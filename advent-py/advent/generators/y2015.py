@@ -0,0 +1,81 @@
+""" input generators for 2015 """
+
+import string
+
+from .registry import generator
+
+
+def wire_name(index):
+    """aa, ab, ... so generated wires never collide with `a` and `b`"""
+
+    letters = string.ascii_lowercase
+    name = ""
+    index += len(letters)
+    while index:
+        index, remainder = divmod(index, len(letters))
+        name = letters[remainder] + name
+
+    return name
+
+
+@generator(2015, 1, base_size=7000)
+def parentheses(size, rng):
+    return "".join(rng.choice("()") for _ in range(size))
+
+
+@generator(2015, 2, base_size=1000)
+def present_dimensions(size, rng):
+    return "\n".join("x".join(str(rng.randint(1, 30)) for _ in range(3)) for _ in range(size))
+
+
+@generator(2015, 3, base_size=8192)
+def delivery_directions(size, rng):
+    return "".join(rng.choice("^v<>") for _ in range(size))
+
+
+@generator(2015, 5, base_size=1000)
+def naughty_or_nice_strings(size, rng):
+    return "\n".join("".join(rng.choice(string.ascii_lowercase) for _ in range(16)) for _ in range(size))
+
+
+@generator(2015, 6, base_size=300)
+def light_instructions(size, rng):
+    lines = []
+    for _ in range(size):
+        start_x, end_x = sorted(rng.randrange(1000) for _ in range(2))
+        start_y, end_y = sorted(rng.randrange(1000) for _ in range(2))
+        action = rng.choice(["turn on", "turn off", "toggle"])
+        lines.append(f"{action} {start_x},{start_y} through {end_x},{end_y}")
+
+    return "\n".join(lines)
+
+
+@generator(2015, 7, base_size=340)
+def circuit(size, rng):
+    """wires only read from wires defined before them, so the circuit always settles; `a` is the last one"""
+
+    lines = [f"{rng.randrange(1 << 16)} -> b"]
+    wires = ["b"]
+
+    for index in range(size - 1):
+        output = "a" if index == size - 2 else wire_name(index)
+        op = rng.choice(["AND", "OR", "LSHIFT", "RSHIFT", "NOT", ""])
+        if op == "NOT":
+            lines.append(f"NOT {rng.choice(wires)} -> {output}")
+        elif op in ["LSHIFT", "RSHIFT"]:
+            lines.append(f"{rng.choice(wires)} {op} {rng.randint(1, 15)} -> {output}")
+        elif op:
+            lines.append(f"{rng.choice(wires)} {op} {rng.choice(wires)} -> {output}")
+        else:
+            lines.append(f"{rng.choice(wires)} -> {output}")
+
+        wires.append(output)
+
+    rng.shuffle(lines)
+    return "\n".join(lines)
+
+
+@generator(2015, 18, base_size=100 * 100)
+def light_grid(size, rng):
+    side = max(6, round(size ** 0.5))
+    return "\n".join("".join(rng.choice("#.") for _ in range(side)) for _ in range(side))
@@ -0,0 +1,54 @@
+""" input generators for 2019 """
+
+import math
+import string
+
+from .registry import generator
+
+
+def body_name(index):
+    """three characters, like the real map; longer once those run out"""
+
+    chars = string.ascii_uppercase + string.digits
+    name = ""
+    while len(name) < 3 or index:
+        index, remainder = divmod(index, len(chars))
+        name = chars[remainder] + name
+
+    return name
+
+
+@generator(2019, 1, base_size=100)
+def module_masses(size, rng):
+    return "\n".join(str(rng.randint(50000, 150000)) for _ in range(size))
+
+
+@generator(2019, 6, base_size=1500)
+def orbit_map(size, rng):
+    """a random tree rooted at COM, with YOU and SAN orbiting two of its bodies"""
+
+    bodies = ["COM"]
+    lines = []
+    index = 0
+    while len(bodies) <= size:
+        name = body_name(index)
+        index += 1
+        if name in ["COM", "YOU", "SAN"]:
+            continue
+
+        lines.append(f"{rng.choice(bodies)}){name}")
+        bodies.append(name)
+
+    lines.append(f"{rng.choice(bodies[1:])})YOU")
+    lines.append(f"{rng.choice(bodies[1:])})SAN")
+
+    rng.shuffle(lines)
+    return "\n".join(lines)
+
+
+@generator(2019, 10, base_size=24 * 24)
+def asteroid_field(size, rng):
+    """square, with enough asteroids that part 2 can vaporize 200 of them"""
+
+    side = max(16, math.isqrt(size))
+    return "\n".join("".join("#" if rng.random() < 0.8 else "." for _ in range(side)) for _ in range(side))
@@ -0,0 +1,109 @@
+""" input generators for 2020 """
+
+import string
+
+from .registry import generator
+
+
+@generator(2020, 1, base_size=200)
+def expense_report(size, rng):
+    """entries too big to pair up, plus one pair and one triple that sum to 2020"""
+
+    entries = [rng.randint(1011, 1999) for _ in range(max(0, size - 5))]
+    pair = rng.randint(1, 1000)
+    triple = sorted(rng.sample(range(1, 1000), 2))
+    entries += [pair, 2020 - pair, triple[0], triple[1], 2020 - sum(triple)]
+
+    rng.shuffle(entries)
+    return "\n".join(str(entry) for entry in entries)
+
+
+@generator(2020, 2, base_size=1000)
+def password_policies(size, rng):
+    lines = []
+    for _ in range(size):
+        low = rng.randint(1, 8)
+        high = rng.randint(low + 1, 16)
+        letter = rng.choice(string.ascii_lowercase[:6])
+        password = "".join(rng.choice(string.ascii_lowercase[:6]) for _ in range(rng.randint(high, 20)))
+        lines.append(f"{low}-{high} {letter}: {password}")
+
+    return "\n".join(lines)
+
+
+@generator(2020, 3, base_size=323)
+def tree_map(size, rng):
+    """rows as wide as the real map's, about a fifth of the squares trees"""
+
+    return "\n".join("".join("#" if rng.random() < 0.2 else "." for _ in range(31)) for _ in range(size))
+
+
+@generator(2020, 6, base_size=500)
+def customs_answers(size, rng):
+    groups = []
+    for _ in range(size):
+        people = rng.randint(1, 5)
+        groups.append(
+            "\n".join("".join(rng.sample(string.ascii_lowercase, rng.randint(1, 26))) for _ in range(people))
+        )
+
+    return "\n\n".join(groups)
+
+
+@generator(2020, 10, base_size=100)
+def adapter_joltages(size, rng):
+    """gaps of 1 or 3 jolts, like the real input, so there's always a chain"""
+
+    joltage = 0
+    adapters = []
+    for _ in range(size):
+        joltage += rng.choice([1, 1, 1, 3])
+        adapters.append(joltage)
+
+    rng.shuffle(adapters)
+    return "\n".join(str(adapter) for adapter in adapters)
+
+
+NEIGHBORS = [(d_x, d_y) for d_x in (-1, 0, 1) for d_y in (-1, 0, 1) if d_x or d_y]
+
+
+def seats_settle(rows, max_rounds=200):
+    """whether people stop moving around in this layout, under part 1's rules"""
+
+    seats = [(x, y) for y, row in enumerate(rows) for x, char in enumerate(row) if char == "L"]
+    occupied = set()
+    for _ in range(max_rounds):
+        new_occupied = set()
+        for x, y in seats:
+            nearby = sum((x + d_x, y + d_y) in occupied for d_x, d_y in NEIGHBORS)
+            if nearby == 0 or ((x, y) in occupied and nearby < 4):
+                new_occupied.add((x, y))
+
+        if new_occupied == occupied:
+            return True
+        occupied = new_occupied
+
+    return False
+
+
+@generator(2020, 11, base_size=95 * 95)
+def seat_layout(size, rng, block_side=12, n_blocks=16):
+    """
+    a big random layout almost always has somewhere that flips back and forth forever, so instead this tiles
+    blocks that are checked to settle, with a line of floor between them so they can't upset each other in part 1
+    """
+
+    blocks = []
+    while len(blocks) < n_blocks:
+        block = ["".join("." if rng.random() < 0.15 else "L" for _ in range(block_side)) for _ in range(block_side)]
+        if seats_settle(block):
+            blocks.append(block)
+
+    per_side = max(1, round(size ** 0.5 / (block_side + 1)))
+    rows = []
+    for _ in range(per_side):
+        row_of_blocks = [rng.choice(blocks) for _ in range(per_side)]
+        rows += [".".join(block[row] for block in row_of_blocks) for row in range(block_side)]
+        rows.append("." * len(rows[-1]))
+
+    return "\n".join(rows[:-1])
@@ -0,0 +1,61 @@
+""" input generators for 2021 """
+
+from .registry import generator
+
+
+@generator(2021, 1, base_size=2000)
+def sonar_depths(size, rng):
+    depth = 100
+    depths = []
+    for _ in range(size):
+        depth = max(1, depth + rng.randint(-10, 30))
+        depths.append(depth)
+
+    return "\n".join(str(depth) for depth in depths)
+
+
+@generator(2021, 2, base_size=1000)
+def submarine_course(size, rng):
+    return "\n".join(f"{rng.choice(['forward', 'down', 'down', 'up'])} {rng.randint(1, 9)}" for _ in range(size))
+
+
+@generator(2021, 5, base_size=500)
+def vent_lines(size, rng):
+    """horizontal, vertical and 45 degree diagonal lines only"""
+
+    lines = []
+    for _ in range(size):
+        x1, y1 = rng.randrange(1000), rng.randrange(1000)
+        length = rng.randint(1, 500)
+        dx, dy = rng.choice([(1, 0), (-1, 0), (0, 1), (0, -1), (1, 1), (1, -1), (-1, 1), (-1, -1)])
+        x2, y2 = min(999, max(0, x1 + dx * length)), min(999, max(0, y1 + dy * length))
+        if dx and dy:
+            # clipping the ends separately would bend a diagonal, so shorten it instead
+            length = min(abs(x2 - x1), abs(y2 - y1))
+            x2, y2 = x1 + dx * length, y1 + dy * length
+
+        lines.append(f"{x1},{y1} -> {x2},{y2}")
+
+    return "\n".join(lines)
+
+
+@generator(2021, 7, base_size=1000)
+def crab_positions(size, rng):
+    return ",".join(str(rng.randint(0, 2000)) for _ in range(size))
+
+
+@generator(2021, 9, base_size=100 * 100)
+def height_map(size, rng):
+    side = max(5, round(size ** 0.5))
+    return "\n".join("".join(str(rng.randint(0, 9)) for _ in range(side)) for _ in range(side))
+
+
+@generator(2021, 11, base_size=10 * 10)
+def octopus_energy(size, rng):
+    """
+    energy levels only up to 5: with the full 0-9, anything much past 10x10 almost never flashes all at once, which
+    part 2 waits for, whereas these fall into step within a few dozen steps
+    """
+
+    side = max(2, round(size ** 0.5))
+    return "\n".join("".join(str(rng.randint(0, 5)) for _ in range(side)) for _ in range(side))
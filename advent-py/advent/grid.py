@@ -0,0 +1,110 @@
+""" a 2d grid backed by a numpy array, for the cellular automaton days """
+
+from .imports import lazy_import
+
+# numpy takes longer to import than most days take to solve, so only pay for it once a grid is built
+np = lazy_import("numpy")
+
+# (dx, dy) offsets
+ORTHOGONAL = [(0, -1), (0, 1), (1, 0), (-1, 0)]
+ADJACENT = [(dx, dy) for dy in (-1, 0, 1) for dx in (-1, 0, 1) if (dx, dy) != (0, 0)]
+
+# how to treat neighbors that fall off the edge of the grid
+FILL = "fill"  # a constant value
+WRAP = "wrap"  # the opposite edge
+CLAMP = "clamp"  # the nearest cell on the edge
+
+PAD_MODES = {FILL: "constant", WRAP: "wrap", CLAMP: "edge"}
+
+
+def overlap(shift):
+    """the slice of an axis that is still on the grid after moving `shift` cells along it"""
+
+    return slice(shift, None) if shift >= 0 else slice(None, shift)
+
+
+class Grid2D:
+    """cells[y, x], so rows of the input text stay rows of the array"""
+
+    def __init__(self, cells):
+        self.cells = np.ascontiguousarray(cells)
+
+    @property
+    def height(self):
+        return self.cells.shape[0]
+
+    @property
+    def width(self):
+        return self.cells.shape[1]
+
+    @property
+    def size(self):
+        return self.cells.size
+
+    def copy(self):
+        return Grid2D(self.cells.copy())
+
+    def padded(self, pad, border=FILL, fill=0):
+        pad_kwargs = {"constant_values": fill} if border == FILL else {}
+        return np.pad(self.cells, pad, mode=PAD_MODES[border], **pad_kwargs)
+
+    def shifted_views(self, offsets=ADJACENT, border=FILL, fill=0):
+        """one view per offset, where view[y, x] is the neighbor of (x, y) at that offset"""
+
+        pad = max(max(abs(dx), abs(dy)) for dx, dy in offsets)
+        padded = self.padded(pad, border, fill)
+
+        for dx, dy in offsets:
+            yield padded[pad + dy : pad + dy + self.height, pad + dx : pad + dx + self.width]
+
+    def neighbors(self, offsets=ADJACENT, border=FILL, fill=0):
+        """stack of arrays, one per offset, so [i, y, x] is the neighbor of (x, y) at offsets[i]"""
+
+        return np.stack(list(self.shifted_views(offsets, border, fill)))
+
+    def count_neighbors(self, offsets=ADJACENT, border=FILL, fill=0):
+        """sum of the neighboring cells; on a boolean grid, the number of neighbors that are set"""
+
+        counts = np.zeros(self.cells.shape, dtype=np.int64)
+        if border == FILL and not fill:
+            # nothing to add from off the edge, so skip padding and add the overlapping slices directly
+            for dx, dy in offsets:
+                counts[overlap(-dy), overlap(-dx)] += self.cells[overlap(dy), overlap(dx)]
+
+            return counts
+
+        for view in self.shifted_views(offsets, border, fill):
+            counts += view
+
+        return counts
+
+    def to_str(self, chars):
+        """chars maps each cell value back to the character it was parsed from"""
+
+        return "\n".join("".join(chars[value] for value in row) for row in self.cells.tolist())
+
+    @classmethod
+    def zeros(cls, width, height, dtype=None):
+        return cls(np.zeros((height, width), dtype=dtype or np.int64))
+
+    @classmethod
+    def from_str(cls, grid_str, values=None, dtype=None):
+        """parse straight from the text bytes. values maps characters to cell values; without it every cell is a digit"""
+
+        lines = [line.strip() for line in grid_str.split("\n") if line.strip()]
+        raw = np.frombuffer("".join(lines).encode(), dtype=np.uint8).reshape(len(lines), -1)
+
+        if values is None:
+            return cls((raw - ord("0")).astype(dtype or np.int64))
+
+        lookup = np.zeros(256, dtype=dtype or np.asarray(list(values.values())).dtype)
+        known = np.zeros(256, dtype=bool)
+        for char, value in values.items():
+            lookup[ord(char)] = value
+            known[ord(char)] = True
+
+        if not known[raw].all():
+            unknown = sorted({chr(x) for x in np.unique(raw[~known[raw]])})
+            raise ValueError(f"Unexpected characters in grid: {unknown}")
+
+        return cls(lookup[raw])
@@ -0,0 +1,66 @@
+""" deferring heavy imports, and measuring what each solver module costs to import """
+
+import importlib.util
+import sys
+from collections import namedtuple
+
+from .inputs import ROOT
+
+# solver modules import this, so keep it light: no attrs, and only the reporting needs subprocess
+ImportTime = namedtuple("ImportTime", ["name", "depth", "self_us", "cumulative_us"])
+
+
+def lazy_import(name):
+    """a module that is only really imported the first time one of its attributes is used"""
+
+    if name in sys.modules:
+        return sys.modules[name]
+
+    spec = importlib.util.find_spec(name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+subprocess = lazy_import("subprocess")
+
+
+def parse_importtime(stderr):
+    """rows of `python -X importtime` output, in the order they were printed (children before their parent)"""
+
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        depth = (len(name) - len(name.lstrip())) // 2
+        yield ImportTime(name.strip(), depth, int(self_us), int(cumulative_us))
+
+
+def module_import_times(module_name):
+    """import a module in a fresh interpreter, returning (the module's own row, the rows for everything it pulled in)"""
+
+    # __import__ rather than importlib.import_module, which -X importtime doesn't report on
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"__import__({module_name!r})"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    rows = list(parse_importtime(result.stderr))
+    for index, row in enumerate(rows):
+        if row.name == module_name and row.depth == 0:
+            # the rows for a module's imports come right before it, back to the previous top level import
+            start = index
+            while start > 0 and rows[start - 1].depth > 0:
+                start -= 1
+
+            return row, rows[start:index]
+
+    raise LookupError(f"{module_name} did not show up in the import times")
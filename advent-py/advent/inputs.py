@@ -0,0 +1,34 @@
+""" locating and reading puzzle inputs """
+
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# 2021 switched the naming scheme for data files, so check both
+INPUT_NAME_FORMATS = ["{day:02}.txt", "day_{day:02}.txt"]
+
+
+def year_dir(year):
+    return ROOT / str(year)
+
+
+def input_path(year, day):
+    data_dir = year_dir(year) / "data"
+    for name_format in INPUT_NAME_FORMATS:
+        path = data_dir / name_format.format(day=day)
+        if path.exists():
+            return path
+
+    raise FileNotFoundError(f"No input found for {year} day {day} in {data_dir}")
+
+
+def read_input(year, day):
+    with open(input_path(year, day)) as fh:
+        return fh.read()
+
+
+def read_data_file(year, name):
+    """read any file in a year's data directory (e.g. example inputs)"""
+
+    with open(year_dir(year) / "data" / name) as fh:
+        return fh.read()
@@ -0,0 +1,91 @@
+""" running many solvers at once across a process pool """
+
+import signal
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import contextmanager
+
+import attr
+
+from .benchmark import DEFAULT_BASELINE, load_baseline, solver_key
+from .inputs import read_input
+from .solvers import load_module, solve_functions
+
+
+@attr.s
+class JobResult:
+    year = attr.ib()
+    day = attr.ib()
+    part = attr.ib()
+    status = attr.ib()
+    answer = attr.ib(default=None)
+    elapsed = attr.ib(default=None)
+
+
+class JobTimeout(Exception):
+    pass
+
+
+def raise_timeout(_signum, _frame):
+    raise JobTimeout()
+
+
+@contextmanager
+def time_limit(seconds):
+    """raise JobTimeout if the block runs longer than `seconds`; uses an alarm, so only in the main thread"""
+
+    if not seconds:
+        yield
+        return
+
+    signal.signal(signal.SIGALRM, raise_timeout)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+
+
+def run_job(year, day, part, timeout=None):
+    """runs in a worker process; the time limit means a stuck solver frees up its worker"""
+
+    solve_fn = solve_functions(load_module(year, day))[part]
+    puzzle_input = read_input(year, day)
+
+    start = time.perf_counter()
+    try:
+        with time_limit(timeout):
+            answer = solve_fn(puzzle_input)
+        return JobResult(year, day, part, "ok", answer, time.perf_counter() - start)
+    except JobTimeout:
+        return JobResult(year, day, part, "timeout", elapsed=time.perf_counter() - start)
+    except Exception as err:  # pylint: disable=broad-except
+        return JobResult(year, day, part, "error", repr(err), time.perf_counter() - start)
+
+
+def recorded_runtimes(baseline_path=DEFAULT_BASELINE):
+    if not baseline_path.exists():
+        return {}
+
+    return {key: timing["median"] for key, timing in load_baseline(baseline_path).items()}
+
+
+def longest_first(jobs, runtimes):
+    """solvers without a recorded runtime go first, since they could be anything"""
+
+    return sorted(jobs, key=lambda job: runtimes.get(solver_key(*job), float("inf")), reverse=True)
+
+
+def run_all(jobs, max_workers=None, timeout=None, runtimes=None):
+    """runs (year, day, part) jobs in parallel, returning results in calendar order"""
+
+    if runtimes is None:
+        runtimes = recorded_runtimes()
+
+    results = []
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(run_job, *job, timeout=timeout) for job in longest_first(jobs, runtimes)]
+        for future in as_completed(futures):
+            results.append(future.result())
+
+    return sorted(results, key=lambda result: (result.year, result.day, result.part))
@@ -0,0 +1,86 @@
+""" profiling a single day with cProfile and tracemalloc """
+
+import cProfile
+import io
+import pstats
+import time
+import tracemalloc
+
+from .cache import caches_disabled
+from .inputs import ROOT, read_input
+from .solvers import load_module, solve_functions
+
+PROFILE_DIR = ROOT / "profiles"
+
+
+def default_report_path(year, day):
+    return PROFILE_DIR / f"{year}_{day:02}.txt"
+
+
+def format_size(num_bytes):
+    for unit in ["B", "KiB", "MiB"]:
+        if abs(num_bytes) < 1024:
+            return f"{num_bytes:.1f}{unit}"
+        num_bytes /= 1024
+
+    return f"{num_bytes:.1f}GiB"
+
+
+def profile_part(solve_fn, puzzle_input, top_n):
+    """returns (answer, report lines) for one run of solve_fn"""
+
+    profiler = cProfile.Profile()
+    # a single frame per allocation keeps the tracing overhead down
+    tracemalloc.start(1)
+
+    start = time.perf_counter()
+    profiler.enable()
+    try:
+        answer = solve_fn(puzzle_input)
+    finally:
+        profiler.disable()
+        elapsed = time.perf_counter() - start
+        _, peak_memory = tracemalloc.get_traced_memory()
+        snapshot = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+
+    lines = [f"answer: {answer}", f"time: {elapsed * 1000:.1f}ms (with profiling overhead)"]
+    lines.append(f"peak memory: {format_size(peak_memory)}")
+
+    stats_io = io.StringIO()
+    pstats.Stats(profiler, stream=stats_io).sort_stats(pstats.SortKey.CUMULATIVE).print_stats(top_n)
+    lines += ["", f"top {top_n} functions by cumulative time:", stats_io.getvalue().strip()]
+
+    # ignore the bookkeeping of tracemalloc itself
+    snapshot = snapshot.filter_traces([tracemalloc.Filter(False, tracemalloc.__file__)])
+    lines += ["", f"top {top_n} allocation sites still held at the end:"]
+    for stat in snapshot.statistics("lineno")[:top_n]:
+        frame = stat.traceback[0]
+        lines.append(f"{format_size(stat.size):>10} in {stat.count:>7} blocks  {frame.filename}:{frame.lineno}")
+
+    return answer, lines
+
+
+def profile_day(year, day, parts, top_n=25, report_path=None):
+    """profile each part of a day, write everything to one report file, and return (answers, report path)"""
+
+    report_path = report_path or default_report_path(year, day)
+    functions = solve_functions(load_module(year, day))
+    puzzle_input = read_input(year, day)
+
+    answers = {}
+    report = []
+    for part in parts:
+        if part not in functions:
+            continue
+
+        # a cached answer would leave nothing to profile but the unpickling
+        with caches_disabled():
+            answers[part], lines = profile_part(functions[part], puzzle_input, top_n)
+        report += [f"===== {year} day {day:02} part {part} =====", *lines, ""]
+
+    report_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(report_path, "w") as fh:
+        fh.write("\n".join(report))
+
+    return answers, report_path
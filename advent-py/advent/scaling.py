@@ -0,0 +1,78 @@
+""" timing solvers on generated inputs of growing size and fitting how they scale """
+
+import math
+import time
+
+import attr
+
+from .generators import generate
+from .pool import JobTimeout, time_limit
+from .solvers import load_module, solve_functions
+
+DEFAULT_SCALES = (1, 10, 100, 1000)
+
+# runs faster than this are mostly overhead, so they'd skew the fit
+MIN_FIT_SECONDS = 0.001
+
+
+@attr.s
+class ScalingPoint:
+    scale = attr.ib()
+    input_size = attr.ib()
+    seconds = attr.ib()  # None if it ran out of time
+
+
+def fit_growth_exponent(points):
+    """least squares fit of log(time) against log(input size), so time ~ size ** exponent"""
+
+    usable = [(math.log(p.input_size), math.log(p.seconds)) for p in points if p.seconds and p.seconds >= MIN_FIT_SECONDS]
+    if len(usable) < 2:
+        return None
+
+    mean_x = sum(x for x, _ in usable) / len(usable)
+    mean_y = sum(y for _, y in usable) / len(usable)
+    spread = sum((x - mean_x) ** 2 for x, _ in usable)
+    if not spread:
+        return None
+
+    return sum((x - mean_x) * (y - mean_y) for x, y in usable) / spread
+
+
+def describe_growth(exponent):
+    if exponent is None:
+        return "not enough data to fit"
+
+    return f"time ~ n^{exponent:.2f}"
+
+
+def measure_scaling(year, day, part, scales=DEFAULT_SCALES, budget=60, seed=0):
+    """time one part at each scale, stopping at the first run that blows the budget (in seconds)"""
+
+    solve_fn = solve_functions(load_module(year, day))[part]
+
+    # one untimed run first, so one-off costs (like lazy imports) don't all land on the first scale; it's on another
+    # seed's input, so nothing it leaves cached matches what gets timed
+    warmup_input = generate(year, day, scales[0], seed + 1)
+    try:
+        with time_limit(budget):
+            solve_fn(warmup_input)
+    except JobTimeout:
+        return [ScalingPoint(scales[0], len(warmup_input), None)]
+
+    points = []
+    for scale in scales:
+        puzzle_input = generate(year, day, scale, seed)
+
+        start = time.perf_counter()
+        try:
+            with time_limit(budget):
+                solve_fn(puzzle_input)
+            seconds = time.perf_counter() - start
+        except JobTimeout:
+            seconds = None
+
+        points.append(ScalingPoint(scale, len(puzzle_input), seconds))
+        if seconds is None:
+            break
+
+    return points
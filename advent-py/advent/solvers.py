@@ -0,0 +1,72 @@
+""" discovering solver modules and their solve functions """
+
+import importlib
+import inspect
+import re
+
+from .inputs import ROOT, read_input
+
+YEARS = (2015, 2019, 2020, 2021)
+PARTS = (1, 2)
+
+DAY_PATTERN = re.compile(r"^day_([0-9]{2})\.py$")
+
+
+def available_days(year):
+    days = []
+    for path in (ROOT / str(year)).iterdir():
+        if match := re.match(DAY_PATTERN, path.name):
+            days.append(int(match.group(1)))
+
+    return sorted(days)
+
+
+def load_module(year, day):
+    return importlib.import_module(f"{year}.day_{day:02}")
+
+
+def solve_functions(module):
+    """maps part number -> solve function, for whichever parts the module implements"""
+
+    functions = {}
+    for part in PARTS:
+        if callable(solve_fn := getattr(module, f"part{part}", None)):
+            functions[part] = solve_fn
+
+    return functions
+
+
+def module_tests(module):
+    """test_* functions that take no arguments (so helpers like test_for_corruption are skipped)"""
+
+    for name in sorted(dir(module)):
+        if not (name.startswith("test_") and callable(test_fn := getattr(module, name))):
+            continue
+
+        if not inspect.signature(test_fn).parameters:
+            yield name, test_fn
+
+
+def solve(year, day, part, puzzle_input=None):
+    solve_fn = solve_functions(load_module(year, day)).get(part)
+    if solve_fn is None:
+        raise LookupError(f"{year} day {day} has no solver for part {part}")
+
+    if puzzle_input is None:
+        puzzle_input = read_input(year, day)
+
+    return solve_fn(puzzle_input)
+
+
+def iter_solvers(years=YEARS, days=None, parts=PARTS):
+    """yields (year, day, part) for every solver matching the given filters"""
+
+    for year in years:
+        for day in available_days(year):
+            if days and day not in days:
+                continue
+
+            functions = solve_functions(load_module(year, day))
+            for part in parts:
+                if part in functions:
+                    yield year, day, part